@@ -1,50 +1,42 @@
 """
 Implementation details endpoint for NbS solutions.
-Production-ready, ORM-based, fast.
+Production-ready, served from a per-process plan cache.
 """
 
+from typing import List
+
 from fastapi import APIRouter, Query, HTTPException, Depends
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
-from app.db import models
+from app.utils.implementation_utils import get_implementation_plan, get_implementation_plans
 
 router = APIRouter()
 
 
 @router.get("/implementation")
 def get_implementation(
-    solution: str = Query(..., description="Exact name of the NbS solution"),
+    solution: List[str] = Query(..., description="Exact name of the NbS solution; repeat for several"),
     db: Session = Depends(get_db)
 ):
     """
     Fetch implementation steps + maintenance details for a given solution.
     Case-insensitive search.
+
+    With several `solution` parameters, returns every plan found in one
+    response as {"plans": [...], "missing": [...]}.
     """
 
-    record = (
-        db.query(models.NbsImplementation)
-        .filter(models.NbsImplementation.solution.ilike(solution))
-        .first()
-    )
+    if len(solution) > 1:
+        plans, missing = get_implementation_plans(solution, db)
+        return {"plans": plans, "missing": missing}
+
+    plan = get_implementation_plan(solution[0], db)
 
-    if not record:
+    if not plan:
         raise HTTPException(
             status_code=404,
-            detail=f"No implementation plan found for solution '{solution}'."
+            detail=f"No implementation plan found for solution '{solution[0]}'."
         )
 
-    # Split comma-separated strings into clean lists
-    steps = []
-    if record.implementation_steps:
-        steps = [step.strip() for step in record.implementation_steps.split(",") if step.strip()]
-
-    maintenance = []
-    if record.maintenance_requirements:
-        maintenance = [m.strip() for m in record.maintenance_requirements.split(",") if m.strip()]
-
-    return {
-        "solution": record.solution,
-        "implementation_steps": steps,
-        "maintenance_requirements": maintenance
-    }
+    return plan
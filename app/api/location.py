@@ -1,10 +1,12 @@
 """
 Location endpoints for the NbS Toolkit.
 Provides:
-- List of states
-- List of districts in a state
+- List of states (read once per process, then served from memory)
+- List of districts in a state (from the same per-process cache)
 """
 
+import threading
+
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
 
@@ -13,27 +15,73 @@ from app.db import models
 
 router = APIRouter()
 
+_locations = None
+_locations_lock = threading.Lock()
 
-# ----------------------------------------
-# GET ALL STATES
-# ----------------------------------------
 
-@router.get("/states")
-def get_states(db: Session = Depends(get_db)):
+def clear_state_cache():
+    """Drop the cached states and districts so the next request reloads them."""
+    global _locations
+    with _locations_lock:
+        _locations = None
+
+
+def _load_locations(db: Session):
     """
-    Returns a sorted list of all unique states from the district_data table.
+    Read states and their districts from district_data in one query.
+    The table is currently state-level; districts are read only when a
+    district_name column is mapped.
     """
+    district_column = getattr(models.District, "district_name", None)
+    columns = [models.District.state_name]
+    if district_column is not None:
+        columns.append(district_column)
 
-    states = (
-        db.query(models.District.state_name)
+    states = {}
+    districts = {}
+    rows = (
+        db.query(*columns)
         .distinct()
         .order_by(models.District.state_name.asc())
         .all()
     )
+    for row in rows:
+        state = row[0]
+        states.setdefault(state, None)
+        if state is None:
+            continue
+        names = districts.setdefault(state.lower(), [])
+        if len(row) > 1 and row[1] is not None and row[1] not in names:
+            names.append(row[1])
+
+    return {
+        "states": list(states),
+        "districts": {state: sorted(names) for state, names in districts.items()},
+    }
+
+
+def _get_locations(db: Session):
+    """Return the per-process states and districts, loading them on first use."""
+    global _locations
 
-    state_list = [s[0] for s in states]
+    if _locations is None:
+        with _locations_lock:
+            if _locations is None:
+                _locations = _load_locations(db)
+    return _locations
 
-    return {"states": state_list}
+
+# ----------------------------------------
+# GET ALL STATES
+# ----------------------------------------
+
+@router.get("/states")
+def get_states(db: Session = Depends(get_db)):
+    """
+    Returns a sorted list of all unique states from the district_data table.
+    The DISTINCT query runs once per process; later calls reuse the list.
+    """
+    return {"states": list(_get_locations(db)["states"])}
 
 
 # ----------------------------------------
@@ -46,25 +94,19 @@ def get_districts(
     db: Session = Depends(get_db)
 ):
     """
-    Returns all districts for a given state.
+    Returns all districts for a given state (case-insensitive), from the
+    same per-process cache as /states.
     """
 
-    rows = (
-        db.query(models.District.district_name)
-        .filter(models.District.state_name.ilike(state_name))
-        .distinct()
-        .all()
-    )
+    districts = _get_locations(db)["districts"].get(state_name.lower(), [])
 
-    if not rows:
+    if not districts:
         raise HTTPException(
             status_code=404,
             detail=f"No districts found for state '{state_name}'."
         )
 
-    districts = [r[0] for r in rows if r[0] is not None]
-
     return {
         "state": state_name,
-        "districts": districts
+        "districts": list(districts)
     }
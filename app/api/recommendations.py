@@ -6,11 +6,12 @@ Provides:
 """
 
 from fastapi import APIRouter, Query, Depends, HTTPException
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
 from app.db import models
-from app.utils.recommendation_utils import get_recommendation_data
+from app.utils.recommendation_utils import get_recommendation_json
 
 
 router = APIRouter()
@@ -28,28 +29,13 @@ def get_recommendations(
 ):
     """
     Returns a list of best-fitting plants and NbS options for the given state/water type.
-    Uses the new ORM-based recommendation engine.
+    Served from the precomputed state × water-type answer matrix as ready JSON.
     """
 
-    result = get_recommendation_data(state_name, water_type, db)
-
-    # Always return safe empty structure
-    if not result or not isinstance(result, dict):
-        return {
-            "soil_type": None,
-            "plant_match_level": "None",
-            "nbs_match_level": "None",
-            "plants": [],
-            "nbs_options": [],
-            "nbs_implementation": []
-        }
-
-    # Guarantee keys exist
-    result.setdefault("plants", [])
-    result.setdefault("nbs_options", [])
-    result.setdefault("nbs_implementation", [])
-
-    return result
+    return Response(
+        content=get_recommendation_json(state_name, water_type, db),
+        media_type="application/json",
+    )
 
 
 
@@ -1,9 +1,11 @@
 """
 Water data upload + classification + recommendation endpoint.
 Production-grade, ORM only, stable and safe.
+Rows can be persisted write-behind; see app/db/write_behind.py.
 """
 
 from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from typing import Optional
 import pandas as pd
@@ -11,9 +13,9 @@ import json
 from datetime import datetime
 
 from app.db.database import get_db
-from app.db import models
-from app.core.logic import classify_water_type
-from app.utils.recommendation_utils import get_recommendation_data
+from app.db.write_behind import save_water_data, water_data_row
+from app.core.logic import classify_water_frame
+from app.utils.recommendation_utils import WATER_TYPES, get_water_data_json
 
 
 router = APIRouter()
@@ -23,8 +25,8 @@ router = APIRouter()
 # HELPERS
 # --------------------------------------------------------
 
-def read_uploaded_file(file: UploadFile) -> dict:
-    """Reads a CSV or Excel file and returns the first row as a dict."""
+def read_uploaded_frame(file: UploadFile) -> pd.DataFrame:
+    """Reads a CSV or Excel file and returns every row as a DataFrame."""
     try:
         if file.filename.endswith(".csv"):
             df = pd.read_csv(file.file)
@@ -39,8 +41,7 @@ def read_uploaded_file(file: UploadFile) -> dict:
     if df.empty:
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
 
-    row = df.iloc[0].to_dict()
-    return row
+    return df
 
 
 
@@ -66,17 +67,19 @@ async def upload_water_data(
             detail="state_name is required to generate recommendations."
         )
 
-    allowed_types = ["Grey Water", "Black Water", "Brown Water", "Yellow Water"]
+    allowed_types = list(WATER_TYPES)
 
     # --------------------------------------------------------
     # A) FILE UPLOAD FLOW
     # --------------------------------------------------------
     if file and file.filename:
 
-        raw_data = read_uploaded_file(file)
+        frame = read_uploaded_frame(file)
+        raw_data = frame.iloc[0].to_dict()
 
-        # classify using logic.py
-        water_type = classify_water_type(raw_data)
+        # classify every row at once; the first row still decides the type
+        classes, distribution = classify_water_frame(frame)
+        water_type = classes.iloc[0]
 
         if water_type == "Unknown":
             raise HTTPException(
@@ -84,8 +87,8 @@ async def upload_water_data(
                 detail="Could not classify water type from the uploaded data."
             )
 
-        # Save record
-        entry = models.WaterData(
+        # Save record (queued when WATER_DATA_WRITE_MODE=write_behind)
+        entry = water_data_row(
             water_type=water_type,
             colour=raw_data.get("colour"),
             odour=raw_data.get("odour"),
@@ -102,21 +105,18 @@ async def upload_water_data(
             created_at=datetime.now(),
             updated_at=datetime.now(),
         )
-        db.add(entry)
-        db.commit()
-
-        # Fetch recommendations
-        result = get_recommendation_data(state_name, water_type, db)
-
-        # Safe return
-        result.setdefault("plants", [])
-        result.setdefault("nbs_options", [])
-        result.setdefault("nbs_implementation", [])
-
-        return {
-            "classified_type": water_type,
-            "recommendations": result
-        }
+        save_water_data(db, entry)
+
+        # Fetch precomputed recommendations as ready JSON
+        return Response(
+            content=get_water_data_json(
+                water_type,
+                state_name,
+                db,
+                extra={"rows_classified": len(frame), "class_distribution": distribution},
+            ),
+            media_type="application/json",
+        )
 
 
     # --------------------------------------------------------
@@ -130,8 +130,9 @@ async def upload_water_data(
                 detail=f"preset_type must be one of {allowed_types}"
             )
 
-        # Save simple preset entry
-        entry = models.WaterData(
+        # Save simple preset entry. sample_source, notes and raw_data have no
+        # water_data columns, so water_data_row drops them.
+        entry = water_data_row(
             water_type=preset_type,
             created_at=datetime.now(),
             updated_at=datetime.now(),
@@ -139,19 +140,12 @@ async def upload_water_data(
             notes=notes,
             raw_data=json.dumps({"preset_type": preset_type})
         )
-        db.add(entry)
-        db.commit()
+        save_water_data(db, entry)
 
-        result = get_recommendation_data(state_name, preset_type, db)
-
-        result.setdefault("plants", [])
-        result.setdefault("nbs_options", [])
-        result.setdefault("nbs_implementation", [])
-
-        return {
-            "classified_type": preset_type,
-            "recommendations": result
-        }
+        return Response(
+            content=get_water_data_json(preset_type, state_name, db),
+            media_type="application/json",
+        )
 
 
     # --------------------------------------------------------
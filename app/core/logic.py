@@ -5,6 +5,7 @@ Core logic for water classification used in the NBS Toolkit.
 Hosted in this file because classification affects multiple API modules.
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -78,3 +79,67 @@ def classify_water_type(row: dict) -> str:
         return "Grey Water"
 
     return "Unknown"
+
+
+# ---------------------------------------------------------
+# WHOLE-FILE (VECTORIZED) CLASSIFICATION
+# ---------------------------------------------------------
+
+WATER_CLASS_COLUMNS = ("bod", "tss", "nitrate", "phosphate")
+
+
+def _safe_number_column(df: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    Parses one column of an uploaded file with the `_safe_number` rules.
+    Numeric columns are used as-is. Text columns are factorized so each
+    distinct value ("40-60", "<30", ...) is parsed once and broadcast back.
+    A missing column counts as 0, like a missing key in `classify_water_type`.
+    """
+    if column not in df:
+        return np.zeros(len(df))
+
+    values = df[column]
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.to_numpy(dtype=float)
+
+    codes, uniques = pd.factorize(values)
+    parsed = np.array([_safe_number(value) for value in uniques], dtype=float)
+    numbers = np.append(parsed, np.nan)[codes]
+
+    # Missing cells get code -1: None parses to 0, NaN stays NaN.
+    missing = np.flatnonzero(codes == -1)
+    if len(missing):
+        numbers[missing] = [_safe_number(value) for value in values.iloc[missing]]
+    return numbers
+
+
+def classify_water_frame(df: pd.DataFrame):
+    """
+    Classifies every row of an uploaded file at once with the same rules as
+    `classify_water_type`, applied as array masks in the same priority order.
+
+    Returns (classes, distribution):
+        classes       pandas Series of water types aligned with df.index
+        distribution  dict of water type → row count, most common first
+    """
+    bod, tss, nitrate, phosphate = (
+        _safe_number_column(df, column) for column in WATER_CLASS_COLUMNS
+    )
+
+    with np.errstate(invalid="ignore"):
+        yellow = (nitrate > 1000) | (phosphate > 100) | (bod > 1000)
+        black = (bod >= 300) & (tss >= 250) & (nitrate >= 40)
+        brown = (bod >= 200) & (bod < 600) & (tss >= 200) & (nitrate >= 30) & (nitrate < 100)
+        grey = (bod < 300) & (tss < 300) & (nitrate < 30)
+
+    classes = pd.Series(
+        np.select(
+            [yellow, black, brown, grey],
+            ["Yellow Water", "Black Water", "Brown Water", "Grey Water"],
+            default="Unknown",
+        ),
+        index=df.index,
+        dtype=object,
+    )
+    distribution = {str(k): int(v) for k, v in classes.value_counts().items()}
+    return classes, distribution
@@ -0,0 +1,243 @@
+"""
+Write-behind buffer for legacy water-data submissions.
+
+`/api/water-data` used to commit one `water_data` row on the request path
+before computing recommendations. In write-behind mode the row is queued in
+memory and a background thread writes each batch in one transaction, with
+one executemany INSERT per set of columns (file-upload rows carry water
+quality fields, preset rows do not). Remaining rows are flushed when the app
+shuts down. A batch that keeps failing is retried one row at a time after
+WATER_DATA_MAX_RETRIES attempts: good rows are written, and only rows that
+still fail are moved aside (kept in `failed` and logged with their values at
+ERROR level so they can be re-entered), so later rows are still written.
+
+Durability settings (environment variables):
+  WATER_DATA_WRITE_MODE        "sync" (default, commit per request) or "write_behind"
+  WATER_DATA_BATCH_SIZE        rows per INSERT, default 200
+  WATER_DATA_FLUSH_INTERVAL    seconds between flushes, default 2.0
+  WATER_DATA_QUEUE_MAX         queued rows before falling back to a direct write, default 1000
+  WATER_DATA_MAX_RETRIES       failed attempts before a batch is split into single rows, default 3
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+
+from sqlalchemy import insert
+
+from app.db import models
+
+
+logger = logging.getLogger(__name__)
+
+WATER_DATA_COLUMNS = frozenset(
+    column.name for column in models.WaterData.__table__.columns if column.name != "id"
+)
+
+
+def water_data_row(**values):
+    """Keep only values for columns that exist on `water_data`."""
+    return {key: value for key, value in values.items() if key in WATER_DATA_COLUMNS}
+
+
+# ---------------------------------------------------------
+# WRITE-BEHIND BUFFER
+# ---------------------------------------------------------
+
+class WriteBehindBuffer:
+    """Bounded in-process queue that batches inserts into one table."""
+
+    def __init__(
+        self,
+        session_factory,
+        table,
+        batch_size=200,
+        flush_interval=2.0,
+        max_queue=1000,
+        max_retries=3,
+    ):
+        self.session_factory = session_factory
+        self.table = table
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval)
+        self.max_retries = max(1, int(max_retries))
+        self._queue = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._retry = []
+        self._retry_attempts = 0
+        self.failed = []
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def submit(self, row):
+        """
+        Queue one row. Returns True when queued.
+        When the queue is full the row is written directly, so nothing is dropped.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            logger.warning("Write-behind queue full; writing %s row directly.", self.table.name)
+            self._insert([row])
+            return False
+
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def flush(self):
+        """Write every queued row now. Returns the number of rows written."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                batch, self._retry = self._retry, []
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if not batch:
+                    return written
+                try:
+                    self._insert(batch)
+                except Exception:
+                    self._retry_attempts += 1
+                    if self._retry_attempts < self.max_retries:
+                        # Keep the batch for the next flush instead of losing it.
+                        logger.exception(
+                            "Write-behind flush of %s rows failed (attempt %s of %s); will retry.",
+                            len(batch),
+                            self._retry_attempts,
+                            self.max_retries,
+                        )
+                        self._retry = batch
+                        return written
+                    # Split the batch so one bad row cannot block or sink the rest.
+                    logger.exception(
+                        "Write-behind flush of %s rows failed %s times; writing them one at a time.",
+                        len(batch),
+                        self._retry_attempts,
+                    )
+                    self._retry_attempts = 0
+                    written += self._insert_each(batch)
+                    continue
+                self._retry_attempts = 0
+                written += len(batch)
+
+    def close(self):
+        """Stop the background thread and flush everything still queued."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(self.flush_interval, 1.0) * 5)
+        self.flush()
+
+    @property
+    def pending(self):
+        """Rows waiting to be written, including a batch waiting to be retried."""
+        return self._queue.qsize() + len(self._retry)
+
+    def _insert(self, rows):
+        """Write rows in one transaction, one executemany INSERT per column set.
+
+        Missing columns are left out rather than set to None, so server
+        defaults such as `created_at` still apply.
+        """
+        groups = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        with self.session_factory() as db:
+            for group in groups.values():
+                db.execute(insert(self.table), group)
+            db.commit()
+
+    def _insert_each(self, rows):
+        """Write rows one per transaction; move rows that fail aside. Returns rows written."""
+        written = 0
+        for row in rows:
+            try:
+                self._insert([row])
+            except Exception:
+                self.failed.append(row)
+                logger.exception(
+                    "Write-behind could not write a %s row; moved aside: %s",
+                    self.table.name,
+                    json.dumps(row, default=str, sort_keys=True),
+                )
+            else:
+                written += 1
+        return written
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"write-behind-{self.table.name}",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+# ---------------------------------------------------------
+# WATER DATA WRITER
+# ---------------------------------------------------------
+
+_water_data_writer = None
+_water_data_writer_lock = threading.Lock()
+
+
+def write_behind_enabled():
+    return os.getenv("WATER_DATA_WRITE_MODE", "sync").strip().lower() == "write_behind"
+
+
+def get_water_data_writer():
+    """Return the process-wide water-data buffer, built from env settings."""
+    global _water_data_writer
+    if _water_data_writer is None:
+        with _water_data_writer_lock:
+            if _water_data_writer is None:
+                from app.db.database import SessionLocal
+
+                _water_data_writer = WriteBehindBuffer(
+                    SessionLocal,
+                    models.WaterData.__table__,
+                    batch_size=os.getenv("WATER_DATA_BATCH_SIZE", "200"),
+                    flush_interval=os.getenv("WATER_DATA_FLUSH_INTERVAL", "2.0"),
+                    max_queue=os.getenv("WATER_DATA_QUEUE_MAX", "1000"),
+                    max_retries=os.getenv("WATER_DATA_MAX_RETRIES", "3"),
+                )
+    return _water_data_writer
+
+
+def save_water_data(db, row):
+    """Persist one water-data row, queued or committed per WATER_DATA_WRITE_MODE."""
+    if write_behind_enabled():
+        get_water_data_writer().submit(row)
+        return
+
+    db.add(models.WaterData(**row))
+    db.commit()
+
+
+def close_water_data_writer():
+    """Flush-on-shutdown hook for the water-data buffer."""
+    global _water_data_writer
+    with _water_data_writer_lock:
+        writer, _water_data_writer = _water_data_writer, None
+    if writer is not None:
+        writer.close()
@@ -4,8 +4,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.db.db_connection import get_connection
 
-from app.db.database import Base, engine
+import logging
+
+from app.db.database import Base, SessionLocal, engine
 from app.api import implementation, location, recommendations, water_data
+from app.db.write_behind import close_water_data_writer
+from app.utils.implementation_utils import warm_implementation_cache
+from app.utils.recommendation_utils import warm_recommendation_cache
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="NBS Toolkit API",
@@ -48,6 +55,21 @@ def startup_event():
     # in the database when the application starts.
     Base.metadata.create_all(bind=engine)
 
+    # Precompute every state × water-type recommendation answer. If the tables
+    # are not ready yet, the first request builds the cache instead.
+    try:
+        with SessionLocal() as db:
+            warm_recommendation_cache(db)
+            warm_implementation_cache(db)
+    except Exception:
+        logger.exception("Recommendation cache warm-up failed; it will load on first request.")
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    # Flush any water-data rows still queued by the write-behind buffer.
+    close_water_data_writer()
+
 # -----------------------------
 # Health check
 # -----------------------------
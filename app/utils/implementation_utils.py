@@ -0,0 +1,112 @@
+"""
+Implementation-plan cache for the legacy /api/implementation endpoint.
+
+✔ All nbs_implementation rows loaded once per process
+✔ Steps and maintenance strings split once, not per request
+✔ Case-folded solution name → parsed plan lookup
+"""
+
+import threading
+
+from app.db import models
+
+
+_plans = None
+_plans_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# PARSING
+# ---------------------------------------------------------
+
+def _split_items(text):
+    """Split a comma-separated string into clean list items."""
+    if not text:
+        return []
+    return [item.strip() for item in text.split(",") if item.strip()]
+
+
+def _parse_plan(record):
+    return {
+        "solution": record.solution,
+        "implementation_steps": _split_items(record.implementation_steps),
+        "maintenance_requirements": _split_items(record.maintenance_requirements),
+    }
+
+
+def _solution_key(solution):
+    return solution.strip().casefold() if isinstance(solution, str) else None
+
+
+# ---------------------------------------------------------
+# CACHE
+# ---------------------------------------------------------
+
+def _get_plans(db):
+    """Load and parse every implementation plan on first use."""
+    global _plans
+    if _plans is None:
+        with _plans_lock:
+            if _plans is None:
+                plans = {}
+                impl = models.NbsImplementation
+                records = (
+                    db.query(impl.solution, impl.implementation_steps, impl.maintenance_requirements)
+                    .order_by(impl.id)
+                )
+                for record in records:
+                    key = _solution_key(record.solution)
+                    if key:
+                        # Keep the first row per name, as the old `.first()` lookup did.
+                        plans.setdefault(key, _parse_plan(record))
+                _plans = plans
+    return _plans
+
+
+def warm_implementation_cache(db):
+    """Load every plan now, e.g. at startup or after a data reload."""
+    clear_implementation_cache()
+    return _get_plans(db)
+
+
+def clear_implementation_cache():
+    """Drop cached plans so the next request reloads them."""
+    global _plans
+    with _plans_lock:
+        _plans = None
+
+
+# ---------------------------------------------------------
+# LOOKUPS
+# ---------------------------------------------------------
+
+def get_implementation_plan(solution, db):
+    """Return the parsed plan for one solution name, or None when missing."""
+    key = _solution_key(solution)
+    if not key:
+        return None
+    plan = _get_plans(db).get(key)
+    return None if plan is None else {
+        "solution": plan["solution"],
+        "implementation_steps": list(plan["implementation_steps"]),
+        "maintenance_requirements": list(plan["maintenance_requirements"]),
+    }
+
+
+def get_implementation_plans(solutions, db):
+    """
+    Return (plans, missing) for several solution names in request order.
+    Names repeated with different casing are returned once.
+    """
+    plans, missing, seen = [], [], set()
+    for solution in solutions:
+        key = _solution_key(solution)
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        plan = get_implementation_plan(solution, db)
+        if plan is None:
+            missing.append(solution)
+        else:
+            plans.append(plan)
+    return plans, missing
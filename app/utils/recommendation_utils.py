@@ -10,12 +10,33 @@ Key features:
 ✔ No use of Index.isin()
 ✔ Pure Python filtering
 ✔ Always returns clean JSON-safe output
+✔ Tables loaded once and cached with pre-lowercased match columns
+✔ Match tiers computed with NumPy boolean masks
+✔ Every state × water-type answer precomputed as serialized JSON
 """
 
+import threading
+
+import numpy as np
 import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from rapidfuzz import fuzz
 
 
+TOP_N = 5
+
+WATER_TYPES = ("Grey Water", "Black Water", "Brown Water", "Yellow Water")
+
+# Tier order matches the original ranking walk: Perfect, Strong, Moderate, Weak.
+# "Any" is never reached because every row already qualifies as Weak.
+_TIER_LEVELS = ("Perfect", "Strong", "Moderate", "Weak")
+_TIER_SCORES = (100, 80, 60, None)
+_NAN_KEY = object()
+
+_cache = None
+_cache_lock = threading.Lock()
+
 
 # ---------------------------------------------------------
 # UTILS
@@ -51,14 +72,12 @@ def _lower(x):
 # DATA HELPERS
 # ---------------------------------------------------------
 
-def _retrieve_soil_type(merged_df, state_name):
+def _retrieve_soil_type(tables, state_name):
     """Return soil type for a state, fallback Loamy."""
     try:
-        row = merged_df[merged_df["state_name"].str.lower() == state_name.lower()]
-        if not row.empty:
-            s = row.iloc[0].get("soil_type")
-            if s:
-                return str(s)
+        s = tables.soil_by_state.get(state_name.lower())
+        if s:
+            return str(s)
     except:
         pass
     return "Loamy"
@@ -69,97 +88,222 @@ def _fuzzy_score(a, b):
 
 
 # ---------------------------------------------------------
-# CORE RANKING (SAFE)
+# CACHED TABLES
+# ---------------------------------------------------------
+
+class _RankFrame:
+    """One table prepared for ranking: row dicts plus lowercase match columns."""
+
+    def __init__(self, df):
+        df = df.copy()
+
+        df["_state"] = df["state_name"].apply(_lower)
+        df["_water"] = df["optimal_water_type"].apply(_lower)
+        df["_soil"] = df.get("soil_type", "").apply(_lower)
+
+        # Rows are converted once here instead of on every request.
+        self.records = [row.to_dict() for _, row in df.iterrows()]
+        self.state = df["_state"].to_numpy(dtype=object)
+        self.water = df["_water"].to_numpy(dtype=object)
+        self.soil = df["_soil"].to_numpy(dtype=object)
+
+        # Dedup key = plant_species OR solution, encoded as integer codes.
+        # Missing text values are all the same NaN object, so they share a key.
+        codes = {}
+        key_codes = []
+        for rowd in self.records:
+            key = rowd.get("plant_species") or rowd.get("solution")
+            if isinstance(key, float) and key != key:
+                key = _NAN_KEY
+            key_codes.append(codes.setdefault(key, len(codes)))
+        self.key_codes = np.asarray(key_codes, dtype=np.int64)
+        self.key_count = len(codes)
+
+
+class _RecommendationTables:
+    """All legacy recommendation tables, loaded once per process."""
+
+    def __init__(self, district_df, plant_df, nbs_df, impl_df):
+        # First soil_type per lowercase state, as the per-request lookup did.
+        self.soil_by_state = {}
+        if "state_name" in district_df:
+            soils = district_df["soil_type"] if "soil_type" in district_df else [None] * len(district_df)
+            for state, soil in zip(district_df["state_name"], soils):
+                if isinstance(state, str):
+                    self.soil_by_state.setdefault(state.lower(), soil)
+
+        self.plants = _RankFrame(plant_df)
+        self.nbs = _RankFrame(nbs_df)
+        self.impl_map = {int(r["id"]): r.to_dict() for _, r in impl_df.iterrows()}
+
+        # Answers depend only on lowercase (state, water type), so every known
+        # combination is computed and serialized once here.
+        states = set(self.soil_by_state)
+        states.update(self.plants.state, self.nbs.state)
+        water_types = {water_type.lower() for water_type in WATER_TYPES}
+        water_types.update(self.plants.water, self.nbs.water)
+        self.answers = {
+            (state, water_type): _to_json_bytes(
+                _recommendation_payload(_recommendation_from_tables(self, state, water_type))
+            )
+            for state in states
+            for water_type in water_types
+        }
+
+
+def _get_tables(db):
+    """Load the four recommendation tables on first use and reuse them."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = _RecommendationTables(
+                    pd.read_sql("SELECT * FROM district_data", db.bind),
+                    pd.read_sql("SELECT * FROM plant_data", db.bind),
+                    pd.read_sql("SELECT * FROM nbs_options", db.bind),
+                    pd.read_sql("SELECT * FROM nbs_implementation", db.bind),
+                )
+    return _cache
+
+
+def warm_recommendation_cache(db):
+    """Load tables and the answer matrix now, e.g. at startup or after a reload."""
+    clear_recommendation_cache()
+    return _get_tables(db)
+
+
+def clear_recommendation_cache():
+    """Drop cached tables and answers so the next request reloads them."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+# ---------------------------------------------------------
+# CORE RANKING (VECTORIZED)
 # ---------------------------------------------------------
 
-def _rank_matches(df, state_name, water_type, soil_type):
+def _rank_matches(frame, state_name, water_type, soil_type):
     """
     Ranking system without any Pandas row comparisons:
     1. Perfect
     2. Strong
     3. Moderate
     4. Weak (fuzzy)
-    5. Any
     Dedup key = plant_species OR solution.
-    """
 
-    df = df.copy()
+    Each row gets its best tier from boolean masks. Its position in the
+    original tier-by-tier walk is tier * n + row, and the first TOP_N
+    distinct keys by that position are kept.
+    """
 
-    df["_state"] = df["state_name"].apply(_lower)
-    df["_water"] = df["optimal_water_type"].apply(_lower)
-    df["_soil"] = df.get("soil_type", "").apply(_lower)
+    n = len(frame.records)
+    if n == 0 or frame.key_count == 0:
+        return []
 
     t_state = state_name.lower()
     t_water = water_type.lower()
     t_soil = soil_type.lower()
 
-    results = []
-
-    # ----- PERFECT -----
-    for _, row in df.iterrows():
-        if row["_state"] == t_state and row["_water"] == t_water and row["_soil"] == t_soil:
-            results.append((row.to_dict(), "Perfect", 100))
+    water = frame.water == t_water
+    strong = water & (frame.state == t_state)
+    perfect = strong & (frame.soil == t_soil)
 
-    # ----- STRONG -----
-    for _, row in df.iterrows():
-        if row["_state"] == t_state and row["_water"] == t_water:
-            results.append((row.to_dict(), "Strong", 80))
+    tier = np.full(n, 3, dtype=np.int64)
+    tier[water] = 2
+    tier[strong] = 1
+    tier[perfect] = 0
+    position = tier * n + np.arange(n, dtype=np.int64)
 
-    # ----- MODERATE -----
-    for _, row in df.iterrows():
-        if row["_water"] == t_water:
-            results.append((row.to_dict(), "Moderate", 60))
+    # Earliest position of each dedup key.
+    best = np.full(frame.key_count, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(best, frame.key_codes, position)
 
-    # ----- WEAK (FUZZY) -----
-    for _, row in df.iterrows():
-        fuzzy = _fuzzy_score(row["_soil"], t_soil)
-        results.append((row.to_dict(), "Weak", 40 + (fuzzy / 10)))
+    k = min(TOP_N, frame.key_count)
+    top = np.argpartition(best, k - 1)[:k]
+    top = top[np.argsort(best[top])]
 
-    # ----- ANY -----
-    for _, row in df.iterrows():
-        results.append((row.to_dict(), "Any", 10))
-
-    # -----------------------------------------------------
-    # DEDUP BY NAME (plant_species or solution)
-    # -----------------------------------------------------
-    unique = {}
-    for rowd, level, score in results:
-        key = rowd.get("plant_species") or rowd.get("solution")
-        if key not in unique:
-            rowd["match_level"] = level
-            rowd["score"] = score
-            unique[key] = rowd
-
-        if len(unique) >= 5:
-            break
+    results = []
+    for pos in best[top]:
+        level_index, row_index = divmod(int(pos), n)
+        rowd = dict(frame.records[row_index])
+        score = _TIER_SCORES[level_index]
+        if score is None:
+            score = 40 + (_fuzzy_score(frame.soil[row_index], t_soil) / 10)
+        rowd["match_level"] = _TIER_LEVELS[level_index]
+        rowd["score"] = score
+        results.append(rowd)
 
-    return list(unique.values())
+    return results
 
 
 # ---------------------------------------------------------
 # PUBLIC ENTRYPOINT
 # ---------------------------------------------------------
 
-def get_recommendation_data(state_name: str, water_type: str, db):
-    """Called by API."""
-
-    merged_df = pd.read_sql("SELECT * FROM district_data", db.bind)
-    plant_df = pd.read_sql("SELECT * FROM plant_data", db.bind)
-    nbs_df = pd.read_sql("SELECT * FROM nbs_options", db.bind)
-    impl_df = pd.read_sql("SELECT * FROM nbs_implementation", db.bind)
+def _recommendation_from_tables(tables, state_name, water_type):
+    """Rank plants and NbS options for one state and water type."""
 
-    soil_type = _retrieve_soil_type(merged_df, state_name)
+    soil_type = _retrieve_soil_type(tables, state_name)
 
-    plants = _rank_matches(plant_df, state_name, water_type, soil_type)
-    nbs = _rank_matches(nbs_df, state_name, water_type, soil_type)
+    plants = _rank_matches(tables.plants, state_name, water_type, soil_type)
+    nbs = _rank_matches(tables.nbs, state_name, water_type, soil_type)
 
     # Join implementation
-    impl_map = {int(r["id"]): r.to_dict() for _, r in impl_df.iterrows()}
     for item in nbs:
-        item["implementation"] = impl_map.get(item["id"], {})
+        item["implementation"] = tables.impl_map.get(item["id"], {})
 
     return _clean_dict({
         "soil_type": soil_type,
         "plants": plants,
-        "nbs_options": nbs,     
+        "nbs_options": nbs,
     })
+
+
+def _recommendation_payload(result):
+    """Guarantee the response keys the endpoints always returned."""
+
+    result.setdefault("plants", [])
+    result.setdefault("nbs_options", [])
+    result.setdefault("nbs_implementation", [])
+    return result
+
+
+def _to_json_bytes(value):
+    """Serialize exactly as FastAPI would for a plain dict return value."""
+
+    return JSONResponse(content=jsonable_encoder(value)).body
+
+
+def get_recommendation_data(state_name: str, water_type: str, db):
+    """Called by API."""
+
+    return _recommendation_from_tables(_get_tables(db), state_name, water_type)
+
+
+def get_recommendation_json(state_name: str, water_type: str, db) -> bytes:
+    """Return the serialized recommendation payload, from the matrix when known."""
+
+    tables = _get_tables(db)
+    try:
+        return tables.answers[(state_name.lower(), water_type.lower())]
+    except KeyError:
+        pass
+    return _to_json_bytes(
+        _recommendation_payload(_recommendation_from_tables(tables, state_name, water_type))
+    )
+
+
+def get_water_data_json(classified_type: str, state_name: str, db, extra=None) -> bytes:
+    """Return the serialized `/water-data` response around a cached answer."""
+
+    parts = [
+        b'{"classified_type":',
+        _to_json_bytes(classified_type),
+        b',"recommendations":',
+        get_recommendation_json(state_name, classified_type, db),
+    ]
+    for key, value in (extra or {}).items():
+        parts += [b",", _to_json_bytes(key), b":", _to_json_bytes(value)]
+    parts.append(b"}")
+    return b"".join(parts)
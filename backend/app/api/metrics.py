@@ -0,0 +1,63 @@
+"""Request metrics middleware and the `/metrics` response.
+
+`MetricsMiddleware` times every HTTP request and counts it by method, route
+template and status code, and tracks requests in flight. Route templates such
+as `/api/v1/sites/{region_id}` are used instead of raw paths so station names
+and IDs never become label values. `main.py` installs the middleware and the
+`/metrics` route when `METRICS_ENABLED=true`.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from fastapi import Response
+
+from app.api.route_templates import RouteTemplates
+from app.core.metrics import (
+    CONTENT_TYPE,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    REGISTRY,
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware that records request counts, latency and requests in flight."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        self.route_templates = RouteTemplates()
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            method = scope.get("method", "")
+            route = self.route_templates.resolve(scope)
+            HTTP_REQUEST_DURATION.observe(elapsed, method, route)
+            HTTP_REQUESTS.inc(method, route, str(status_code))
+
+
+def metrics_response() -> Response:
+    """Return every registered metric in the Prometheus text format."""
+
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
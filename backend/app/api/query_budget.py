@@ -0,0 +1,74 @@
+"""Per-request SQL query budget middleware.
+
+`QueryBudgetMiddleware` counts and fingerprints the SQL statements each HTTP
+request runs. When a request runs more statements than the budget, or repeats
+one statement shape at least `repeat_threshold` times (an N+1 loop), it logs
+one JSON warning on the `app.sql.budget` logger. It only observes requests;
+responses and data are never changed.
+
+`main.py` installs it when `SQL_QUERY_BUDGET` is above zero.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from app.db.statement_counter import StatementCounter, count_statements
+
+logger = logging.getLogger("app.sql.budget")
+
+REPORTED_FINGERPRINTS = 3
+
+
+def budget_violation(
+    counter: StatementCounter,
+    *,
+    budget: int,
+    repeat_threshold: int,
+) -> dict[str, Any] | None:
+    """Return a report when `counter` broke the budget, otherwise None."""
+
+    repeated = counter.repeated(repeat_threshold)
+    if counter.count <= budget and not repeated:
+        return None
+    return {
+        "statements": counter.count,
+        "budget": budget,
+        "repeated": [
+            {"fingerprint": shape, "count": seen}
+            for shape, seen in repeated[:REPORTED_FINGERPRINTS]
+        ],
+    }
+
+
+class QueryBudgetMiddleware:
+    """ASGI middleware that warns about requests over the SQL statement budget."""
+
+    def __init__(self, app: Any, *, budget: int, repeat_threshold: int) -> None:
+        self.app = app
+        self.budget = budget
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_statements(fingerprint=True) as counter:
+            await self.app(scope, receive, send)
+
+        report = budget_violation(
+            counter,
+            budget=self.budget,
+            repeat_threshold=self.repeat_threshold,
+        )
+        if report is not None:
+            record = {
+                "event": "sql_query_budget_exceeded",
+                "method": scope.get("method"),
+                "path": scope.get("path"),
+                **report,
+            }
+            logger.warning(json.dumps(record), extra={"sql_query_budget": record})
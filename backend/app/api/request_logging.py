@@ -0,0 +1,138 @@
+"""Request ID and request summary logging middleware.
+
+`RequestLoggingMiddleware` gives every HTTP request an ID, taken from a safe
+incoming `X-Request-ID` header or generated, and returns it in the
+`X-Request-ID` response header. Every log line written while the request runs
+carries that `request_id`. When the request finishes, one summary line with
+the route template, status, duration, SQL statement count and any fields that
+services added to the request context is written on the `app.request` logger.
+Errors and slow requests are always logged; other requests are sampled.
+
+`main.py` installs it when `REQUEST_LOGGING_ENABLED=true`.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import time
+import uuid
+from typing import Any
+
+from app.api.route_templates import RouteTemplates
+from app.core.logging import (
+    current_request_context,
+    reset_request_context,
+    start_request_context,
+)
+from app.db.statement_counter import count_statements
+
+logger = logging.getLogger("app.request")
+
+REQUEST_ID_HEADER = "x-request-id"
+_SAFE_REQUEST_ID = re.compile(r"[A-Za-z0-9._:-]{1,64}")
+
+
+def request_id_from_headers(headers: list[tuple[bytes, bytes]]) -> str:
+    """Return a safe incoming request ID, or a new random one."""
+
+    for name, value in headers:
+        if name.lower() == REQUEST_ID_HEADER.encode():
+            candidate = value.decode("latin-1")
+            if _SAFE_REQUEST_ID.fullmatch(candidate):
+                return candidate
+            break
+    return uuid.uuid4().hex
+
+
+def should_log_request(
+    status_code: int,
+    duration_ms: float,
+    *,
+    sample_rate: float,
+    slow_ms: float,
+) -> bool:
+    """Return whether a finished request gets a summary line."""
+
+    if status_code >= 400 or duration_ms >= slow_ms:
+        return True
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+class RequestLoggingMiddleware:
+    """ASGI middleware that tags log lines with a request ID and logs a summary."""
+
+    def __init__(self, app: Any, *, sample_rate: float, slow_ms: float) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.route_templates = RouteTemplates()
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = request_id_from_headers(scope.get("headers", []))
+        status_code = 500
+
+        async def send_with_request_id(message: dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", [])
+                    if name.lower() != REQUEST_ID_HEADER.encode()
+                ]
+                headers.append((REQUEST_ID_HEADER.encode(), request_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = start_request_context(request_id)
+        started = time.perf_counter()
+        try:
+            with count_statements() as counter:
+                await self.app(scope, receive, send_with_request_id)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            context = dict(current_request_context() or {})
+            reset_request_context(token)
+            if should_log_request(
+                status_code,
+                duration_ms,
+                sample_rate=self.sample_rate,
+                slow_ms=self.slow_ms,
+            ):
+                self._log_summary(scope, status_code, duration_ms, counter.count, context)
+
+    def _log_summary(
+        self,
+        scope: dict[str, Any],
+        status_code: int,
+        duration_ms: float,
+        sql_statements: int,
+        context: dict[str, Any],
+    ) -> None:
+        method = scope.get("method", "")
+        route = self.route_templates.resolve(scope)
+        fields = {
+            **context,
+            "event": "request",
+            "method": method,
+            "route": route,
+            "status": status_code,
+            "duration_ms": round(duration_ms, 3),
+            "sql_statements": sql_statements,
+        }
+        level = logging.WARNING if status_code >= 500 or duration_ms >= self.slow_ms else logging.INFO
+        logger.log(
+            level,
+            "%s %s %s %.1fms",
+            method,
+            route,
+            status_code,
+            duration_ms,
+            extra=fields,
+        )
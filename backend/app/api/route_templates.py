@@ -0,0 +1,41 @@
+"""Route template lookup for request middleware.
+
+Metrics and request logs label requests by route template, such as
+`/api/v1/sites/{region_id}`, instead of the raw path, so station names and
+IDs never become label values or log keys.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from starlette.routing import compile_path
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RouteTemplates:
+    """Resolve the full path template of the route that handled a request."""
+
+    def __init__(self) -> None:
+        self._templates: list[tuple[str, re.Pattern[str]]] | None = None
+
+    def resolve(self, scope: dict[str, Any]) -> str:
+        """Return the matched route's full path template, or `unmatched`.
+
+        The matched route only knows its path inside its own router, so the
+        full template (with the `/api/v1` prefix) is found among the app's
+        OpenAPI paths.
+        """
+
+        path = getattr(scope.get("route"), "path", None)
+        if not path:
+            return UNMATCHED_ROUTE
+        if self._templates is None:
+            schema_paths = scope["app"].openapi().get("paths", {})
+            self._templates = [(template, compile_path(template)[0]) for template in schema_paths]
+        for template, pattern in self._templates:
+            if template.endswith(path) and pattern.match(scope["path"]):
+                return template
+        return path
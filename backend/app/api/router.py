@@ -8,6 +8,8 @@ from fastapi import APIRouter
 
 from app.api.routes import (
     availability,
+    locations,
+    names,
     nbs,
     plants,
     pollution,
@@ -23,10 +25,12 @@ api_router = APIRouter()
 
 api_router.include_router(reference.router)
 api_router.include_router(sites.router)
+api_router.include_router(locations.router)
 api_router.include_router(water.router)
 api_router.include_router(standards.router)
 api_router.include_router(nbs.router)
 api_router.include_router(plants.router)
+api_router.include_router(names.router)
 api_router.include_router(pollution.router)
 api_router.include_router(river.router)
 api_router.include_router(availability.router)
@@ -0,0 +1,77 @@
+"""Read-only state, district, and station lookup routes.
+
+These endpoints list stored locations and answer type-ahead searches from the
+in-memory location index. They return names and region IDs only and do not
+choose sites for recommendations.
+"""
+
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from app.schemas import (
+    LocationDistrictsResponse,
+    LocationSearchResponse,
+    LocationStationsResponse,
+    LocationStatesResponse,
+)
+from app.services import LocationIndex, get_location_index
+
+router = APIRouter(prefix="/locations", tags=["locations"])
+
+
+def get_location_lookup(db: Annotated[Session, Depends(get_db)]) -> LocationIndex:
+    """Return the cached location index, building it on first use."""
+
+    return get_location_index(db)
+
+
+@router.get("/states", response_model=LocationStatesResponse)
+def list_states(
+    index: Annotated[LocationIndex, Depends(get_location_lookup)],
+) -> dict[str, object]:
+    """Return all states recorded in water observations."""
+
+    return {"states": index.list_states()}
+
+
+@router.get("/districts", response_model=LocationDistrictsResponse)
+def list_districts(
+    index: Annotated[LocationIndex, Depends(get_location_lookup)],
+    state: str | None = None,
+) -> dict[str, object]:
+    """Return districts, optionally only those in one state."""
+
+    return {"state": state, "districts": index.list_districts(state)}
+
+
+@router.get("/stations", response_model=LocationStationsResponse)
+def list_stations(
+    index: Annotated[LocationIndex, Depends(get_location_lookup)],
+    state: str | None = None,
+    district: str | None = None,
+) -> dict[str, object]:
+    """Return stations, optionally filtered by state and district."""
+
+    return {
+        "state": state,
+        "district": district,
+        "stations": index.list_stations(state=state, district=district),
+    }
+
+
+@router.get("/search", response_model=LocationSearchResponse)
+def search_locations(
+    index: Annotated[LocationIndex, Depends(get_location_lookup)],
+    q: Annotated[str, Query(min_length=1, description="Typed start of a location name.")],
+    kind: Annotated[
+        Literal["state", "district", "station"] | None,
+        Query(description="Limit matches to states, districts, or stations."),
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> dict[str, object]:
+    """Return locations with a word starting with the query."""
+
+    return {"query": q, "matches": index.search(q, kind=kind, limit=limit)}
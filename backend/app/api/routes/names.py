@@ -0,0 +1,42 @@
+"""Read-only fuzzy name autocomplete route.
+
+This endpoint matches stored plant species and NbS solution names against a
+typed query. It returns names, IDs, and match scores only. It does not select
+plants or NbS options for recommendations.
+"""
+
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from app.schemas import NameAutocompleteResponse
+from app.services import NAME_SCORE_CUTOFF, NameSearchIndex, get_name_search_index
+
+router = APIRouter(prefix="/names", tags=["names"])
+
+
+def get_name_index(db: Annotated[Session, Depends(get_db)]) -> NameSearchIndex:
+    """Return the cached name index, building it on first use."""
+
+    return get_name_search_index(db)
+
+
+@router.get("/autocomplete", response_model=NameAutocompleteResponse)
+def autocomplete_names(
+    index: Annotated[NameSearchIndex, Depends(get_name_index)],
+    q: Annotated[str, Query(min_length=1, description="Partial or misspelled name.")],
+    kind: Annotated[
+        Literal["plant", "nbs"] | None,
+        Query(description="Limit matches to plant species or NbS solutions."),
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+    min_score: Annotated[float, Query(ge=0, le=100)] = NAME_SCORE_CUTOFF,
+) -> dict[str, object]:
+    """Return catalogue names that fuzzily match the query."""
+
+    return {
+        "query": q,
+        "matches": index.search(q, kind=kind, limit=limit, score_cutoff=min_score),
+    }
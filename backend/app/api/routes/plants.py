@@ -10,8 +10,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
-from app.schemas import PlantResponse
-from app.services import PlantCatalogService
+from app.schemas import PlantResponse, PlantSearchResponse
+from app.services import PlantCatalogService, PlantSearchIndex, get_plant_search_index
 
 router = APIRouter(prefix="/plants", tags=["plants"])
 
@@ -23,6 +23,54 @@ def list_plants(db: Annotated[Session, Depends(get_db)]) -> list[dict[str, objec
     return PlantCatalogService(db).list_plants()
 
 
+def get_search_index(db: Annotated[Session, Depends(get_db)]) -> PlantSearchIndex:
+    """Return the cached plant search index, building it on first use."""
+
+    return get_plant_search_index(db)
+
+
+FacetValues = Annotated[
+    list[str] | None,
+    Query(
+        description=(
+            "Match any of these whole field values, ignoring case; "
+            "repeat the parameter for OR."
+        )
+    ),
+]
+
+
+@router.get("/search", response_model=PlantSearchResponse)
+def search_plants(
+    index: Annotated[PlantSearchIndex, Depends(get_search_index)],
+    q: Annotated[
+        str | None,
+        Query(description="Free-text tokens; every token must appear in the plant row."),
+    ] = None,
+    native_status: FacetValues = None,
+    plant_type: FacetValues = None,
+    pollution_tolerance: FacetValues = None,
+    metals_pollutants: FacetValues = None,
+    water_needs: FacetValues = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    offset: Annotated[int, Query(ge=0)] = 0,
+) -> dict[str, object]:
+    """Search stored plants with faceted AND/OR filters and facet counts."""
+
+    return index.search(
+        q,
+        {
+            "native_status": native_status or [],
+            "plant_type": plant_type or [],
+            "pollution_tolerance": pollution_tolerance or [],
+            "metals_pollutants": metals_pollutants or [],
+            "water_needs": water_needs or [],
+        },
+        limit=limit,
+        offset=offset,
+    )
+
+
 @router.get("/nbs/{nbs_id}", response_model=list[PlantResponse])
 def get_plants_for_nbs(
     nbs_id: int,
@@ -2,18 +2,28 @@
 
 This route is a thin FastAPI wrapper around the internal staged workflow
 service. It calls `max_step="L"` and returns the internal recommendation
-assembly output. It does not mutate data, deploy anything, or change Azure
-settings.
+assembly output. With `WORKFLOW_TIMING_ENABLED=true` it also returns per-step
+timings in a `Server-Timing` header. With `PROFILING_ENABLED=true` a request
+sending `X-Profile: collapsed` or `X-Profile: speedscope` (or `?profile=...`)
+gets a sampling profile of its own run instead of the recommendation. It does
+not mutate data, deploy anything, or change Azure settings.
 """
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
+from app.core.config import Settings, get_settings
+from app.core.logging import add_request_context
+from app.core.profiling import PROFILE_FORMATS, StackSampler
 from app.db.session import get_db
 from app.schemas import RecommendationRequest, RecommendationResponse
-from app.services import ScientificWorkflowService
+from app.services import (
+    ScientificWorkflowService,
+    log_workflow_timings,
+    server_timing_header,
+)
 
 router = APIRouter(prefix="/recommend", tags=["recommendation"])
 
@@ -23,19 +33,69 @@ def get_scientific_workflow_service(
 ) -> ScientificWorkflowService:
     """Build the read-only scientific workflow service for one request."""
 
-    return ScientificWorkflowService.from_session(db)
+    settings = get_settings()
+    return ScientificWorkflowService.from_session(
+        db,
+        use_water_summary=settings.water_summary_enabled,
+        use_catalog_snapshot=settings.nbs_catalog_snapshot_enabled,
+    )
 
 
 @router.post("", response_model=RecommendationResponse)
 def run_local_recommendation_workflow(
     request: RecommendationRequest,
+    response: Response,
+    http_request: Request,
     workflow_service: Annotated[
         ScientificWorkflowService,
         Depends(get_scientific_workflow_service),
     ],
-) -> dict[str, Any]:
+) -> Any:
     """Run the staged A-L workflow and return safe recommendation assembly output."""
 
+    settings = get_settings()
+    profile_format = _requested_profile_format(http_request, settings)
+    if profile_format is None:
+        return _recommendation_payload(request, response, workflow_service, settings)
+
+    with StackSampler(interval=settings.profiling_sample_interval_ms / 1000) as sampler:
+        _recommendation_payload(request, response, workflow_service, settings)
+    body, media_type = sampler.render(profile_format, name="POST /api/v1/recommend")
+    return Response(
+        body,
+        media_type=media_type,
+        headers={
+            "X-Profile-Samples": str(sampler.sample_count),
+            "X-Profile-Duration-Ms": f"{sampler.duration_ms:.3f}",
+        },
+    )
+
+
+def _requested_profile_format(http_request: Request, settings: Settings) -> str | None:
+    """Return the profile format asked for, or None when profiling is off."""
+
+    if not settings.profiling_enabled:
+        return None
+    requested = http_request.headers.get("X-Profile") or http_request.query_params.get("profile")
+    if not requested:
+        return None
+    profile_format = requested.strip().lower()
+    if profile_format not in PROFILE_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Profile format must be one of: {', '.join(PROFILE_FORMATS)}.",
+        )
+    return profile_format
+
+
+def _recommendation_payload(
+    request: RecommendationRequest,
+    response: Response,
+    workflow_service: ScientificWorkflowService,
+    settings: Settings,
+) -> dict[str, Any]:
+    """Run the workflow and shape the route response."""
+
     try:
         result = workflow_service.run(
             request.workflow_input(),
@@ -47,6 +107,7 @@ def run_local_recommendation_workflow(
                 else None
             ),
             expert_validated=False,
+            record_timings=settings.workflow_timing_enabled,
         )
     except Exception as exc:  # pragma: no cover - defensive API boundary
         return {
@@ -63,7 +124,19 @@ def run_local_recommendation_workflow(
         }
 
     payload = result.to_dict()
+    timings = payload.get("timings")
+    if timings:
+        response.headers["Server-Timing"] = server_timing_header(timings)
+        log_workflow_timings(
+            timings,
+            sample_rate=settings.workflow_timing_log_sample_rate,
+            workflow_status=payload.get("workflow_status"),
+            step_completed=payload.get("step_completed"),
+        )
     assembly_bundle = payload.get("recommendation_assembly_bundle")
+    add_request_context(
+        recommendations=len((assembly_bundle or {}).get("recommendations") or []),
+    )
     weights_status = _weights_status(payload, assembly_bundle)
     expert_validated = _expert_validated(payload, assembly_bundle)
 
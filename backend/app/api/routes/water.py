@@ -23,7 +23,10 @@ router = APIRouter(prefix="/water", tags=["water"])
 def get_station_observations(
     station: str,
     db: Annotated[Session, Depends(get_db)],
-    parameter: Annotated[str | None, Query(description="Optional exact parameter name.")] = None,
+    parameter: Annotated[
+        str | None,
+        Query(description="Optional parameter name; case and spacing are ignored."),
+    ] = None,
 ) -> list[dict[str, object]]:
     """Return raw observations for one station, optionally for one parameter."""
 
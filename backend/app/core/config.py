@@ -6,6 +6,7 @@ Never put production Azure credentials in this repository.
 """
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -18,6 +19,43 @@ class Settings(BaseSettings):
     app_env: str = Field(default="local", alias="APP_ENV")
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
     database_url: str | None = Field(default=None, alias="DATABASE_URL")
+    database_mode: Literal["database", "snapshot"] = Field(
+        default="database",
+        alias="DATABASE_MODE",
+    )
+    snapshot_path: str = Field(default="narmada_nbs_snapshot.db", alias="SNAPSHOT_PATH")
+    arrow_catalog_dir: str | None = Field(default=None, alias="ARROW_CATALOG_DIR")
+    water_summary_enabled: bool = Field(default=False, alias="WATER_SUMMARY_ENABLED")
+    nbs_catalog_snapshot_enabled: bool = Field(
+        default=False,
+        alias="NBS_CATALOG_SNAPSHOT_ENABLED",
+    )
+    warm_location_index: bool = Field(default=False, alias="WARM_LOCATION_INDEX")
+    workflow_timing_enabled: bool = Field(default=False, alias="WORKFLOW_TIMING_ENABLED")
+    workflow_timing_log_sample_rate: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        alias="WORKFLOW_TIMING_LOG_SAMPLE_RATE",
+    )
+    sql_query_budget: int = Field(default=0, ge=0, alias="SQL_QUERY_BUDGET")
+    sql_repeat_threshold: int = Field(default=10, ge=2, alias="SQL_REPEAT_THRESHOLD")
+    log_format: Literal["text", "json"] = Field(default="text", alias="LOG_FORMAT")
+    request_logging_enabled: bool = Field(default=False, alias="REQUEST_LOGGING_ENABLED")
+    request_log_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        alias="REQUEST_LOG_SAMPLE_RATE",
+    )
+    request_log_slow_ms: float = Field(default=1000.0, gt=0.0, alias="REQUEST_LOG_SLOW_MS")
+    metrics_enabled: bool = Field(default=False, alias="METRICS_ENABLED")
+    profiling_enabled: bool = Field(default=False, alias="PROFILING_ENABLED")
+    profiling_sample_interval_ms: float = Field(
+        default=1.0,
+        gt=0.0,
+        alias="PROFILING_SAMPLE_INTERVAL_MS",
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
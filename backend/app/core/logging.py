@@ -1,16 +1,157 @@
-"""Logging setup for the backend application.
+"""Logging setup and per-request log context for the backend application.
 
-This module keeps logging configuration in one place. It does not configure
-deployment, secrets, database tables, or scientific recommendation behavior.
+This module keeps logging configuration in one place. Log records are handed
+to a queue and written by a background listener thread, so console or App
+Service log stream I/O never blocks a request. `LOG_FORMAT=json` writes one
+JSON object per line. While a request is being handled, every record carries
+its `request_id`, and code can add fields to the request's context (workflow
+step reached, cache results, row counts) that are written with the request
+summary line. It does not configure deployment, secrets, database tables, or
+scientific recommendation behavior.
 """
 
+from __future__ import annotations
+
+import atexit
+import copy
+import json
 import logging
+import queue
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+LOG_FORMATS = ("text", "json")
+
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "taskName"}
+
+_request_context: ContextVar[dict[str, Any] | None] = ContextVar(
+    "request_context",
+    default=None,
+)
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+def start_request_context(request_id: str, **fields: Any) -> Token[dict[str, Any] | None]:
+    """Open the log context for one request and return its reset token."""
+
+    return _request_context.set({"request_id": request_id, **fields})
+
+
+def reset_request_context(token: Token[dict[str, Any] | None]) -> None:
+    """Close the log context opened by `start_request_context`."""
+
+    _request_context.reset(token)
+
+
+def current_request_context() -> dict[str, Any] | None:
+    """Return the current request's log context, or None outside a request."""
+
+    return _request_context.get()
+
+
+def add_request_context(**fields: Any) -> None:
+    """Add fields to the current request's log context, if there is one.
+
+    The context is one dictionary shared by the request's task and the thread
+    running a sync route, so fields added in services reach the middleware.
+    """
+
+    context = _request_context.get()
+    if context is not None:
+        context.update(fields)
+
+
+def add_request_context_entry(field: str, key: str, value: Any) -> None:
+    """Set `context[field][key] = value` on the current request's log context."""
+
+    context = _request_context.get()
+    if context is not None:
+        context.setdefault(field, {})[key] = value
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line.
+
+    Fields passed with `extra=` are written as top-level keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class ContextQueueHandler(QueueHandler):
+    """Queue handler that stamps records with the current request ID."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve everything that depends on the calling thread or on live
+        # objects before the record crosses to the listener thread.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        context = _request_context.get()
+        if context is not None and not hasattr(record, "request_id"):
+            record.request_id = context["request_id"]
+        return record
+
+
+def stop_logging() -> None:
+    """Write any queued records and remove the queue handler."""
+
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(log_level: str, log_format: str = "text") -> None:
+    """Configure console logging through a background queue listener.
+
+    Like `logging.basicConfig`, this leaves the root logger alone when some
+    other handler is already installed.
+    """
+
+    global _listener, _queue_handler
+    root = logging.getLogger()
+    stop_logging()
+    if root.handlers:
+        return
 
+    output = logging.StreamHandler()
+    output.setFormatter(JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT))
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = ContextQueueHandler(records)
+    _listener = QueueListener(records, output)
+    root.setLevel(log_level.upper())
+    root.addHandler(_queue_handler)
+    _listener.start()
 
-def configure_logging(log_level: str) -> None:
-    """Configure simple console logging for local development."""
 
-    logging.basicConfig(
-        level=log_level.upper(),
-        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-    )
+atexit.register(stop_logging)
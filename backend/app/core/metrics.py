@@ -0,0 +1,344 @@
+"""In-process metrics rendered in the Prometheus text format.
+
+Counters, gauges and histograms here keep one dictionary of values per thread.
+Recording a value only touches the calling thread's dictionary, so request
+threads never wait on each other; the shards are summed when `/metrics` is
+scraped. Callback gauges read their value (for example DB pool usage) at
+scrape time. This module has no third-party dependency and never records
+request bodies, station names or scientific values.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+from app.core.logging import add_request_context_entry
+
+LabelValues = tuple[str, ...]
+MetricT = TypeVar("MetricT", bound="Metric")
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _ThreadShards:
+    """Per-thread value dictionaries that are combined when metrics are read."""
+
+    __slots__ = ("_local", "_shards", "_lock")
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[dict[LabelValues, Any]] = []
+        self._lock = threading.Lock()
+
+    def mine(self) -> dict[LabelValues, Any]:
+        """Return the calling thread's dictionary, registering it on first use."""
+
+        try:
+            return self._local.values
+        except AttributeError:
+            values: dict[LabelValues, Any] = {}
+            with self._lock:
+                self._shards.append(values)
+            self._local.values = values
+            return values
+
+    def copies(self) -> list[dict[LabelValues, Any]]:
+        """Return a copy of every thread's dictionary."""
+
+        with self._lock:
+            shards = list(self._shards)
+        return [dict(shard) for shard in shards]
+
+    def clear(self) -> None:
+        """Reset every thread's values."""
+
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects."""
+
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str]) -> str:
+    """Render `{name="value",...}`, or an empty string without labels."""
+
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """Base class holding a metric's name, help text and label names."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def samples(self) -> list[str]:
+        """Return the metric's sample lines."""
+
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        """Return the HELP, TYPE and sample lines."""
+
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+
+
+class Counter(Metric):
+    """Monotonic counter keyed by label values."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._shards = _ThreadShards()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add `amount` to the series for `labels`."""
+
+        values = self._shards.mine()
+        values[labels] = values.get(labels, 0.0) + amount
+
+    def values(self) -> dict[LabelValues, float]:
+        """Return the summed value of every series."""
+
+        totals: dict[LabelValues, float] = {}
+        for shard in self._shards.copies():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+
+    def samples(self) -> list[str]:
+        values = self.values()
+        if not values and not self.labelnames:
+            values = {(): 0.0}
+        return [
+            f"{self.name}{_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(values.items())
+        ]
+
+    def clear(self) -> None:
+        """Reset every series to zero."""
+
+        self._shards.clear()
+
+
+class Gauge(Counter):
+    """Value that can go up and down, such as requests in flight."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """Subtract `amount` from the series for `labels`."""
+
+        self.inc(*labels, amount=-amount)
+
+
+class CallbackGauge(Metric):
+    """Gauge whose series are read from a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        callback: Callable[[], dict[LabelValues, float]],
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.callback().items())
+        ]
+
+
+class Histogram(Metric):
+    """Cumulative histogram with fixed upper bounds, keyed by label values."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._shards = _ThreadShards()
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation for `labels`."""
+
+        values = self._shards.mine()
+        entry = values.get(labels)
+        if entry is None:
+            # One slot per bucket plus +Inf, then the sum and the count.
+            entry = values[labels] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        entry[bisect_left(self.buckets, value)] += 1
+        entry[-2] += value
+        entry[-1] += 1
+
+    def values(self) -> dict[LabelValues, list[float]]:
+        """Return per-series bucket counts, sum and count summed over threads."""
+
+        totals: dict[LabelValues, list[float]] = {}
+        for shard in self._shards.copies():
+            for labels, entry in shard.items():
+                total = totals.setdefault(labels, [0] * len(entry))
+                for index, value in enumerate(list(entry)):
+                    total[index] += value
+        return totals
+
+    def samples(self) -> list[str]:
+        lines: list[str] = []
+        bounds = [*map(_format_value, self.buckets), "+Inf"]
+        for labels, entry in sorted(self.values().items()):
+            cumulative = 0
+            for bound, count in zip(bounds, entry[: len(bounds)]):
+                cumulative += count
+                bucket_labels = _labels((*self.labelnames, "le"), (*labels, bound))
+                lines.append(f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}")
+            series = _labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{series} {_format_value(entry[-2])}")
+            lines.append(f"{self.name}_count{series} {_format_value(cumulative)}")
+        return lines
+
+    def clear(self) -> None:
+        """Drop every observation."""
+
+        self._shards.clear()
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Add `metric`, replacing any metric with the same name."""
+
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text format."""
+
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.register(
+    Counter(
+        "http_requests_total",
+        "HTTP requests by method, route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+HTTP_REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by method and route template.",
+        ("method", "route"),
+    )
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.register(
+    Gauge("http_requests_in_flight", "HTTP requests currently being handled.")
+)
+WORKFLOW_RUNS = REGISTRY.register(
+    Counter(
+        "workflow_runs_total",
+        "Scientific workflow runs by workflow_status and last completed step.",
+        ("workflow_status", "step_completed"),
+    )
+)
+CACHE_LOOKUPS = REGISTRY.register(
+    Counter(
+        "service_cache_lookups_total",
+        "Process-wide service cache lookups by cache and result (hit or miss).",
+        ("cache", "result"),
+    )
+)
+
+
+def _cache_hit_ratios() -> dict[LabelValues, float]:
+    """Return hits / lookups for every cache that has been used."""
+
+    lookups: dict[str, list[float]] = {}
+    for (cache, result), value in CACHE_LOOKUPS.values().items():
+        counts = lookups.setdefault(cache, [0.0, 0.0])
+        counts[0 if result == "hit" else 1] += value
+    return {
+        (cache,): hits / (hits + misses)
+        for cache, (hits, misses) in lookups.items()
+        if hits + misses
+    }
+
+
+REGISTRY.register(
+    CallbackGauge(
+        "service_cache_hit_ratio",
+        "Share of service cache lookups served from memory.",
+        ("cache",),
+        _cache_hit_ratios,
+    )
+)
+
+
+def record_cache_lookup(cache: str, *, hit: bool) -> None:
+    """Count one lookup of a process-wide service cache.
+
+    The result is also noted on the current request's log context.
+    """
+
+    result = "hit" if hit else "miss"
+    CACHE_LOOKUPS.inc(cache, result)
+    add_request_context_entry("cache", cache, result)
+
+
+def record_workflow_run(workflow_status: str, step_completed: str | None) -> None:
+    """Count one scientific workflow run by its outcome."""
+
+    WORKFLOW_RUNS.inc(workflow_status, step_completed or "none")
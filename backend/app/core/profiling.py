@@ -0,0 +1,176 @@
+"""Sampling profiler for diagnosing one slow request.
+
+`StackSampler` is a context manager. While it is open, a background thread
+reads the Python stack of the thread that opened it at a fixed interval and
+counts each distinct stack, from the `with` block down to the running
+function. The result can be written as collapsed stacks (one
+`outer;inner;leaf count` line per stack, for flame graph tools) or as a
+speedscope profile (https://www.speedscope.app).
+
+Sampling only reads frames, so the profiled code runs unchanged. The sampler
+thread needs the GIL to take a sample, so busy pure-Python code is sampled
+about every `sys.getswitchinterval()` seconds even with a shorter interval;
+each sample is weighted by the time since the previous one. Profiles contain
+function names and source locations only, never arguments or local values.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from types import FrameType, TracebackType
+from typing import Any
+
+PROFILE_FORMATS = ("collapsed", "speedscope")
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Frame keys are (function name, file, first line of the function).
+FrameKey = tuple[str, str, int]
+
+_BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _short_path(filename: str) -> str:
+    """Return `filename` relative to the backend folder, or its last two parts."""
+
+    path = Path(filename)
+    try:
+        return path.resolve().relative_to(_BACKEND_ROOT).as_posix()
+    except ValueError:
+        return "/".join(path.parts[-2:])
+
+
+class StackSampler:
+    """Sample the calling thread's stack until the `with` block exits."""
+
+    def __init__(self, interval: float = 0.001) -> None:
+        if interval <= 0:
+            raise ValueError("Sampling interval must be positive.")
+        self.interval = interval
+        # Stack of frame keys (outermost first) -> [sample count, weight in ms].
+        self.stacks: dict[tuple[FrameKey, ...], list[float]] = {}
+        self.duration_ms = 0.0
+        self._thread_id = 0
+        self._root: FrameType | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+        self._paths: dict[str, str] = {}
+
+    def __enter__(self) -> StackSampler:
+        self._thread_id = threading.get_ident()
+        self._root = sys._getframe(1)
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._sample_until_stopped,
+            name="request-profiler",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+        self._root = None
+
+    @property
+    def sample_count(self) -> int:
+        """Return the number of samples taken."""
+
+        return int(sum(count for count, _ in self.stacks.values()))
+
+    def _sample_until_stopped(self) -> None:
+        previous = self._started
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                self._record(self._stack(frame), (now - previous) * 1000)
+            previous = now
+
+    def _stack(self, frame: FrameType | None) -> tuple[FrameKey, ...]:
+        """Return frame keys from the profiled block down to `frame`."""
+
+        keys: list[FrameKey] = []
+        while frame is not None:
+            code = frame.f_code
+            filename = self._paths.get(code.co_filename)
+            if filename is None:
+                filename = self._paths[code.co_filename] = _short_path(code.co_filename)
+            name = getattr(code, "co_qualname", code.co_name)
+            keys.append((name, filename, code.co_firstlineno))
+            if frame is self._root:
+                break
+            frame = frame.f_back
+        keys.reverse()
+        return tuple(keys)
+
+    def _record(self, stack: tuple[FrameKey, ...], weight_ms: float) -> None:
+        entry = self.stacks.setdefault(stack, [0, 0.0])
+        entry[0] += 1
+        entry[1] += weight_ms
+
+    def collapsed(self) -> str:
+        """Return `frame;frame;frame count` lines, heaviest stack first."""
+
+        lines = [
+            ";".join(f"{name} ({filename}:{line})" for name, filename, line in stack)
+            + f" {int(count)}"
+            for stack, (count, _) in sorted(
+                self.stacks.items(),
+                key=lambda item: (-item[1][0], item[0]),
+            )
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def speedscope(self, name: str) -> dict[str, Any]:
+        """Return a speedscope `sampled` profile weighted in milliseconds."""
+
+        frame_index: dict[FrameKey, int] = {}
+        samples: list[list[int]] = []
+        weights: list[float] = []
+        for stack, (_, weight_ms) in self.stacks.items():
+            samples.append([frame_index.setdefault(key, len(frame_index)) for key in stack])
+            weights.append(round(weight_ms, 3))
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "nbs_toolkit_backend",
+            "shared": {
+                "frames": [
+                    {"name": frame_name, "file": filename, "line": line}
+                    for frame_name, filename, line in frame_index
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": round(sum(weights), 3),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+    def render(self, profile_format: str, name: str) -> tuple[str, str]:
+        """Return `(body, media type)` for one of `PROFILE_FORMATS`."""
+
+        if profile_format == "collapsed":
+            return self.collapsed(), "text/plain; charset=utf-8"
+        if profile_format == "speedscope":
+            return json.dumps(self.speedscope(name)), "application/json"
+        raise ValueError(f"Unknown profile format: {profile_format!r}.")
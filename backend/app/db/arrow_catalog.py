@@ -0,0 +1,198 @@
+"""Database-free start-up cache for the catalogue snapshot and water summary.
+
+Building the NbS catalogue snapshot and the water summary index means loading
+whole tables through ORM objects and then converting them to dictionaries.
+`export_arrow_catalog` writes the tables those two caches read to Arrow IPC
+files, and `ArrowCatalog` reads them back as row dictionaries, so a worker
+can build both caches without a database round trip or ORM objects. Each
+worker still holds its own copy of the rows; the files are not shared
+in-memory columns.
+
+The files are a separate export, not written by any data loader. Export
+from the backend folder, and again after the catalogue or observations
+change:
+
+    python -m app.db.arrow_catalog --output-dir arrow_catalog
+
+Set `ARROW_CATALOG_DIR` to that folder to make the catalogue snapshot and the
+water summary index load from it. `pyarrow` is imported only when a catalogue
+is written or opened. This module copies stored rows only; it does not change
+values.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Float, Integer, select
+from sqlalchemy.engine import Engine
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.core.config import get_settings
+from app.db.base import Base
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+# Tables read by `NbsCatalogSnapshot.from_arrow` and `WaterSummaryIndex.from_arrow`.
+ARROW_CATALOG_TABLES = (
+    "nbs_options",
+    "removal_efficiency",
+    "nbs_implementation",
+    "nbs_footprint",
+    "nbs_criteria",
+    "water_observations",
+)
+
+
+def _arrow_type(column: Any) -> "pa.DataType":
+    """Map a SQLAlchemy column type to an Arrow type."""
+
+    import pyarrow as pa
+
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, Float):
+        return pa.float64()
+    return pa.string()
+
+
+def export_arrow_catalog(source: Engine, directory: str | Path) -> dict[str, int]:
+    """Write each catalogue table to `<directory>/<table>.arrow`.
+
+    Each file holds one uncompressed record batch, so it can be memory-mapped
+    and read without decompressing. Files are written under a temporary name
+    and moved into place when complete. Returns row counts per table.
+    """
+
+    import pyarrow as pa
+    import pyarrow.ipc
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    counts: dict[str, int] = {}
+    with source.connect() as connection:
+        for name in ARROW_CATALOG_TABLES:
+            table = Base.metadata.tables[name]
+            rows = connection.execute(select(table).order_by(table.c.id)).all()
+            schema = pa.schema([(column.name, _arrow_type(column)) for column in table.columns])
+            batch = pa.record_batch(
+                [
+                    pa.array([row[position] for row in rows], type=field.type)
+                    for position, field in enumerate(schema)
+                ],
+                schema=schema,
+            )
+            partial = directory / f"{name}.arrow.partial"
+            with pa.OSFile(str(partial), "wb") as sink:
+                with pa.ipc.new_file(sink, schema) as writer:
+                    writer.write_batch(batch)
+            os.replace(partial, directory / f"{name}.arrow")
+            counts[name] = len(rows)
+    return counts
+
+
+class ArrowCatalog:
+    """Read catalogue tables from memory-mapped Arrow IPC files.
+
+    Tables are opened on first use. Reading a table maps the file; `rows`
+    then converts the whole table to Python dictionaries.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        missing = [
+            name for name in ARROW_CATALOG_TABLES
+            if not (self.directory / f"{name}.arrow").is_file()
+        ]
+        if missing:
+            raise RuntimeError(
+                f"Arrow catalogue in {self.directory} is missing {', '.join(missing)}. "
+                "Export it with `python -m app.db.arrow_catalog --output-dir <folder>`."
+            )
+        self._tables: dict[str, pa.Table] = {}
+        self._lock = Lock()
+
+    def table(self, name: str) -> "pa.Table":
+        """Return one memory-mapped table."""
+
+        if name not in self._tables:
+            import pyarrow as pa
+            import pyarrow.ipc
+
+            with self._lock:
+                if name not in self._tables:
+                    source = pa.memory_map(str(self.directory / f"{name}.arrow"), "r")
+                    self._tables[name] = pa.ipc.open_file(source).read_all()
+        return self._tables[name]
+
+    def rows(self, name: str) -> list[dict[str, Any]]:
+        """Return table rows as dictionaries, in the same shape as ORM rows."""
+
+        return self.table(name).to_pylist()
+
+
+_catalog: ArrowCatalog | None = None
+_catalog_lock = Lock()
+
+
+def get_arrow_catalog() -> ArrowCatalog | None:
+    """Return the process-wide catalogue, or `None` when `ARROW_CATALOG_DIR` is unset."""
+
+    global _catalog
+    directory = get_settings().arrow_catalog_dir
+    if not directory:
+        return None
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = ArrowCatalog(directory)
+    return _catalog
+
+
+def clear_arrow_catalog() -> None:
+    """Drop the cached catalogue so the next call re-opens the files."""
+
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
+
+
+def main() -> None:
+    """Export the configured database into an Arrow catalogue folder."""
+
+    from sqlalchemy import create_engine
+
+    from app.db.session import _connect_args, _normalize_database_url
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Export catalogue tables to Arrow IPC files.")
+    parser.add_argument("--output-dir", default=settings.arrow_catalog_dir or "arrow_catalog")
+    parser.add_argument(
+        "--source-url",
+        default=settings.database_url,
+        help="Database to copy from (defaults to DATABASE_URL).",
+    )
+    args = parser.parse_args()
+
+    if not args.source_url:
+        raise SystemExit("DATABASE_URL is not set; pass --source-url.")
+    source_url = _normalize_database_url(args.source_url)
+    source = create_engine(source_url, connect_args=_connect_args(source_url))
+    try:
+        counts = export_arrow_catalog(source, args.output_dir)
+    finally:
+        source.dispose()
+
+    for name, count in counts.items():
+        print(f"{name:<24} {count:>8} rows")
+    print(f"Arrow catalogue written to {args.output_dir}.")
+
+
+if __name__ == "__main__":
+    main()
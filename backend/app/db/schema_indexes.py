@@ -0,0 +1,45 @@
+"""`CREATE INDEX` statements read from the repository's schema files.
+
+The PostgreSQL indexes are defined once, in `schema.sql` and its patch files
+at the repository root. The read-only snapshot export and the synthetic
+benchmark dataset apply the same statements, so SQLite query plans follow
+the same indexes as the database instead of a hand-kept copy. This module
+reads DDL only; it does not connect to a database.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SCHEMA_FILES = ("schema.sql", "schema_river_network_patch.sql", "schema_index_patch.sql")
+
+_CREATE_INDEX = re.compile(r"CREATE INDEX[^;]+", flags=re.IGNORECASE)
+
+
+def schema_index_statements(
+    files: tuple[str, ...] = SCHEMA_FILES,
+    root: Path = REPO_ROOT,
+) -> list[str]:
+    """Return the schema files' `CREATE INDEX` statements, made idempotent."""
+
+    statements: list[str] = []
+    for name in files:
+        path = root / name
+        if not path.is_file():
+            raise RuntimeError(
+                f"Schema file {path} was not found; index definitions are read from "
+                "the repository's schema files."
+            )
+        for match in _CREATE_INDEX.findall(path.read_text(encoding="utf-8")):
+            statement = " ".join(match.split())
+            if "IF NOT EXISTS" not in statement.upper():
+                statement = re.sub(
+                    r"^CREATE INDEX",
+                    "CREATE INDEX IF NOT EXISTS",
+                    statement,
+                    flags=re.IGNORECASE,
+                )
+            statements.append(statement)
+    return statements
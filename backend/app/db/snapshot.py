@@ -0,0 +1,173 @@
+"""Read-only local snapshot of the reference tables.
+
+The scientific reference data is small, read-only, and versioned, but every
+read goes to the configured database. `export_snapshot` copies every model
+table into one SQLite file, and `create_snapshot_engine` opens that file with
+`mode=ro&immutable=1` and memory-mapped reads. Set `DATABASE_MODE=snapshot`
+and `SNAPSHOT_PATH` to make `get_engine()` (and so every repository) read from
+the file with no network round trips.
+
+Export from the backend folder:
+
+    python -m app.db.snapshot --output narmada_nbs_snapshot.db
+
+This module copies stored rows only. It does not change values or add
+scientific data.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import stat
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.engine import Engine
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.db.base import Base
+from app.db.schema_indexes import schema_index_statements
+
+SNAPSHOT_MMAP_BYTES = 256 * 1024 * 1024
+SNAPSHOT_INFO_TABLE = "snapshot_info"
+
+
+def snapshot_url(path: str | Path) -> str:
+    """Return a read-only, immutable SQLite URI for a snapshot file."""
+
+    return f"sqlite:///file:{Path(path).resolve().as_posix()}?mode=ro&immutable=1&uri=true"
+
+
+def create_snapshot_engine(path: str | Path) -> Engine:
+    """Open a snapshot file read-only with memory-mapped I/O."""
+
+    if not Path(path).is_file():
+        raise RuntimeError(
+            f"Snapshot file {path} was not found. Export one with "
+            "`python -m app.db.snapshot --output <file>` or set DATABASE_MODE=database."
+        )
+
+    engine = create_engine(snapshot_url(path), connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def _configure(dbapi_connection, _record) -> None:
+        """Enable memory-mapped reads and refuse writes on every connection."""
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA mmap_size={SNAPSHOT_MMAP_BYTES}")
+        cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    return engine
+
+
+def read_snapshot_info(engine: Engine) -> dict[str, str]:
+    """Return the key/value metadata written when the snapshot was exported."""
+
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(
+            f"SELECT key, value FROM {SNAPSHOT_INFO_TABLE} ORDER BY key"
+        ).all()
+    return {key: value for key, value in rows}
+
+
+def export_snapshot(
+    source: Engine,
+    output: str | Path,
+    *,
+    batch_size: int = 5000,
+) -> dict[str, int]:
+    """Copy every model table from `source` into a new read-only snapshot file.
+
+    The file is written next to `output` and moved into place only when
+    complete, so readers never open a half-written snapshot. Returns row
+    counts per table.
+    """
+
+    output = Path(output)
+    index_statements = schema_index_statements()
+    partial = output.with_name(output.name + ".partial")
+    if partial.exists():
+        partial.unlink()
+
+    target = create_engine(f"sqlite:///{partial.resolve().as_posix()}")
+    counts: dict[str, int] = {}
+    try:
+        Base.metadata.create_all(target)
+        with source.connect() as reader, target.begin() as writer:
+            for table in Base.metadata.sorted_tables:
+                result = reader.execution_options(yield_per=batch_size).execute(select(table))
+                counts[table.name] = 0
+                for rows in result.mappings().partitions(batch_size):
+                    writer.execute(insert(table), [dict(row) for row in rows])
+                    counts[table.name] += len(rows)
+                copied = writer.execute(select(func.count()).select_from(table)).scalar_one()
+                if copied != counts[table.name]:
+                    raise RuntimeError(
+                        f"{table.name}: read {counts[table.name]} rows, wrote {copied}."
+                    )
+
+            # The same indexes as PostgreSQL, read from the schema files.
+            for statement in index_statements:
+                writer.exec_driver_sql(statement)
+
+            writer.exec_driver_sql(
+                f"CREATE TABLE {SNAPSHOT_INFO_TABLE} (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            info = {
+                "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "source_dialect": source.dialect.name,
+                **{f"rows.{name}": str(count) for name, count in counts.items()},
+            }
+            writer.exec_driver_sql(
+                f"INSERT INTO {SNAPSHOT_INFO_TABLE} (key, value) VALUES (?, ?)",
+                list(info.items()),
+            )
+        with target.connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+            connection.exec_driver_sql("VACUUM")
+    finally:
+        target.dispose()
+
+    if output.exists():
+        os.chmod(output, stat.S_IRUSR | stat.S_IWUSR)
+    os.replace(partial, output)
+    os.chmod(output, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+    return counts
+
+
+def main() -> None:
+    """Export the configured database into a snapshot file."""
+
+    from app.core.config import get_settings
+    from app.db.session import _connect_args, _normalize_database_url
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Export reference tables to a snapshot file.")
+    parser.add_argument("--output", default=settings.snapshot_path)
+    parser.add_argument(
+        "--source-url",
+        default=settings.database_url,
+        help="Database to copy from (defaults to DATABASE_URL).",
+    )
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    if not args.source_url:
+        raise SystemExit("DATABASE_URL is not set; pass --source-url.")
+    source_url = _normalize_database_url(args.source_url)
+    source = create_engine(source_url, connect_args=_connect_args(source_url))
+    try:
+        counts = export_snapshot(source, args.output, batch_size=args.batch_size)
+    finally:
+        source.dispose()
+
+    for name, count in counts.items():
+        print(f"{name:<24} {count:>8} rows")
+    print(f"Snapshot written to {args.output} ({sum(counts.values())} rows).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Count and fingerprint SQL statements executed while a block of code runs.
+
+`count_statements()` installs one SQLAlchemy `before_cursor_execute` listener
+on the `Engine` class the first time it is used, so code that never asks for
+counts pays nothing. Counters live in a context variable: only statements run
+by the same request or thread are counted, and nested counters all see them.
+
+With `fingerprint=True` a counter also groups statements by their normalized
+SQL shape (literals, bound parameters and `IN` lists replaced by `?`). Many
+statements with one shape inside a single request or step are the signature
+of an N+1 loop. This module only observes statements; it does not change
+queries or data.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(
+    r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|__\[POSTCOMPILE_\w+\]|\b\d+(?:\.\d+)?\b"
+)
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(
+    r"\bVALUES\s*\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*",
+    re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint_statement(statement: str) -> str:
+    """Return the SQL shape of `statement` with every value replaced by `?`.
+
+    `IN (?, ?, ?)` lists collapse to `IN (...)` and multi-row `VALUES` lists
+    to `VALUES (...)`, so the same query with a different number of values
+    keeps one fingerprint.
+    """
+
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip()
+    shape = _IN_LIST.sub("IN (...)", shape)
+    return _VALUES_LIST.sub("VALUES (...)", shape)
+
+
+class StatementCounter:
+    """Running count of SQL statements seen inside one `count_statements()` block."""
+
+    __slots__ = ("count", "fingerprints")
+
+    def __init__(self, *, fingerprint: bool = False) -> None:
+        self.count = 0
+        self.fingerprints: Counter[str] | None = Counter() if fingerprint else None
+
+    def repeated(self, threshold: int = 2) -> list[tuple[str, int]]:
+        """Return (fingerprint, count) pairs seen at least `threshold` times, most first."""
+
+        if self.fingerprints is None:
+            return []
+        return [
+            (shape, seen)
+            for shape, seen in self.fingerprints.most_common()
+            if seen >= threshold
+        ]
+
+    def max_repeated(self) -> int:
+        """Return how often the most common statement shape ran."""
+
+        if not self.fingerprints:
+            return 0
+        return self.fingerprints.most_common(1)[0][1]
+
+
+_active_counters: ContextVar[tuple[StatementCounter, ...]] = ContextVar(
+    "active_sql_statement_counters",
+    default=(),
+)
+_listener_installed = False
+_listener_lock = threading.Lock()
+
+
+def _count_statement(
+    _connection: Any,
+    _cursor: Any,
+    statement: str,
+    *_args: Any,
+) -> None:
+    """Add the statement to every counter active in the current context."""
+
+    shape: str | None = None
+    for counter in _active_counters.get():
+        counter.count += 1
+        if counter.fingerprints is not None:
+            if shape is None:
+                shape = fingerprint_statement(statement)
+            counter.fingerprints[shape] += 1
+
+
+def _install_listener() -> None:
+    """Attach the counting listener to every engine, once per process."""
+
+    global _listener_installed
+    if _listener_installed:
+        return
+    with _listener_lock:
+        if not _listener_installed:
+            event.listen(Engine, "before_cursor_execute", _count_statement)
+            _listener_installed = True
+
+
+@contextmanager
+def count_statements(*, fingerprint: bool = False) -> Iterator[StatementCounter]:
+    """Yield a counter of the SQL statements executed inside the block."""
+
+    _install_listener()
+    counter = StatementCounter(fingerprint=fingerprint)
+    token = _active_counters.set(_active_counters.get() + (counter,))
+    try:
+        yield counter
+    finally:
+        _active_counters.reset(token)
@@ -1,76 +1,162 @@
-"""Scientific engine modules for staged recommendation workflow work."""
+"""Scientific engine modules for staged recommendation workflow work.
+
+Names are exported lazily: `from app.engines import TopsisRankingEngine` loads
+only `app.engines.topsis_ranking` (and what it imports), on first use. This
+keeps the engines out of application start-up until a workflow runs.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.engines.input_normalization import (
+        DATA_PRIORITY_NOTE,
+        InputContext,
+        InputNormalizationEngine,
+        normalize_match_key,
+        normalize_text,
+    )
+    from app.engines.candidate_filtering import (
+        CandidateEligibilityProfile,
+        CandidateFilterBundle,
+        CandidateFilteringEngine,
+        CandidateFilterResult,
+        OptionTextFeatures,
+        build_eligibility_profile,
+        build_option_text_features,
+        need_group_mask,
+    )
+    from app.engines.confidence_scoring import (
+        CandidateConfidenceResult,
+        ConfidenceFactor,
+        ConfidenceScoringBundle,
+        ConfidenceScoringEngine,
+    )
+    from app.engines.mcda_matrix import (
+        McdaMatrixBuilder,
+        McdaMatrixBundle,
+        McdaMatrixRow,
+    )
+    from app.engines.mcda_normalization import (
+        McdaNormalizationEngine,
+        NormalizedMcdaCriterion,
+        NormalizedMcdaMatrixBundle,
+        NormalizedMcdaMatrixRow,
+    )
+    from app.engines.mcda_numeric_projection import McdaNumericProjectionEngine
+    from app.engines.mcda_weights import (
+        McdaWeightsBundle,
+        McdaWeightsHandler,
+    )
+    from app.engines.plant_matching import (
+        CandidatePlantMatches,
+        PlantMatch,
+        PlantMatchingBundle,
+        PlantMatchingEngine,
+    )
+    from app.engines.pollutant_gap import (
+        ParameterGapResult,
+        PollutantGapBundle,
+        PollutantGapEngine,
+    )
+    from app.engines.recommendation_assembly import (
+        AssembledRecommendation,
+        RecommendationAssemblyBundle,
+        RecommendationAssemblyEngine,
+        RecommendationEvidenceSummary,
+    )
+    from app.engines.target_validation import TargetUseCaseValidator
+    from app.engines.treatment_need import (
+        TreatmentNeedBundle,
+        TreatmentNeedClassifier,
+        TreatmentNeedResult,
+    )
+    from app.engines.topsis_ranking import (
+        TopsisCriterionContribution,
+        TopsisRankedCandidate,
+        TopsisRankingBundle,
+        TopsisRankingEngine,
+    )
+    from app.engines.water_input_assembly import (
+        SOURCE_PRIORITY,
+        WaterInputAssemblyEngine,
+        WaterInputBundle,
+    )
+
+# Exported name -> submodule of `app.engines` that defines it.
+_EXPORTS = {
+    "DATA_PRIORITY_NOTE": "input_normalization",
+    "InputContext": "input_normalization",
+    "InputNormalizationEngine": "input_normalization",
+    "normalize_match_key": "input_normalization",
+    "normalize_text": "input_normalization",
+    "CandidateEligibilityProfile": "candidate_filtering",
+    "CandidateFilterBundle": "candidate_filtering",
+    "CandidateFilteringEngine": "candidate_filtering",
+    "CandidateFilterResult": "candidate_filtering",
+    "OptionTextFeatures": "candidate_filtering",
+    "build_eligibility_profile": "candidate_filtering",
+    "build_option_text_features": "candidate_filtering",
+    "need_group_mask": "candidate_filtering",
+    "CandidateConfidenceResult": "confidence_scoring",
+    "ConfidenceFactor": "confidence_scoring",
+    "ConfidenceScoringBundle": "confidence_scoring",
+    "ConfidenceScoringEngine": "confidence_scoring",
+    "McdaMatrixBuilder": "mcda_matrix",
+    "McdaMatrixBundle": "mcda_matrix",
+    "McdaMatrixRow": "mcda_matrix",
+    "McdaNormalizationEngine": "mcda_normalization",
+    "NormalizedMcdaCriterion": "mcda_normalization",
+    "NormalizedMcdaMatrixBundle": "mcda_normalization",
+    "NormalizedMcdaMatrixRow": "mcda_normalization",
+    "McdaNumericProjectionEngine": "mcda_numeric_projection",
+    "McdaWeightsBundle": "mcda_weights",
+    "McdaWeightsHandler": "mcda_weights",
+    "CandidatePlantMatches": "plant_matching",
+    "PlantMatch": "plant_matching",
+    "PlantMatchingBundle": "plant_matching",
+    "PlantMatchingEngine": "plant_matching",
+    "ParameterGapResult": "pollutant_gap",
+    "PollutantGapBundle": "pollutant_gap",
+    "PollutantGapEngine": "pollutant_gap",
+    "AssembledRecommendation": "recommendation_assembly",
+    "RecommendationAssemblyBundle": "recommendation_assembly",
+    "RecommendationAssemblyEngine": "recommendation_assembly",
+    "RecommendationEvidenceSummary": "recommendation_assembly",
+    "TargetUseCaseValidator": "target_validation",
+    "TreatmentNeedBundle": "treatment_need",
+    "TreatmentNeedClassifier": "treatment_need",
+    "TreatmentNeedResult": "treatment_need",
+    "TopsisCriterionContribution": "topsis_ranking",
+    "TopsisRankedCandidate": "topsis_ranking",
+    "TopsisRankingBundle": "topsis_ranking",
+    "TopsisRankingEngine": "topsis_ranking",
+    "SOURCE_PRIORITY": "water_input_assembly",
+    "WaterInputAssemblyEngine": "water_input_assembly",
+    "WaterInputBundle": "water_input_assembly",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining `name` on first access."""
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
 
-from app.engines.input_normalization import (
-    DATA_PRIORITY_NOTE,
-    InputContext,
-    InputNormalizationEngine,
-    normalize_match_key,
-    normalize_text,
-)
-from app.engines.candidate_filtering import (
-    CandidateFilterBundle,
-    CandidateFilteringEngine,
-    CandidateFilterResult,
-)
-from app.engines.confidence_scoring import (
-    CandidateConfidenceResult,
-    ConfidenceFactor,
-    ConfidenceScoringBundle,
-    ConfidenceScoringEngine,
-)
-from app.engines.mcda_matrix import (
-    McdaMatrixBuilder,
-    McdaMatrixBundle,
-    McdaMatrixRow,
-)
-from app.engines.mcda_normalization import (
-    McdaNormalizationEngine,
-    NormalizedMcdaCriterion,
-    NormalizedMcdaMatrixBundle,
-    NormalizedMcdaMatrixRow,
-)
-from app.engines.mcda_numeric_projection import McdaNumericProjectionEngine
-from app.engines.mcda_weights import (
-    McdaWeightsBundle,
-    McdaWeightsHandler,
-)
-from app.engines.plant_matching import (
-    CandidatePlantMatches,
-    PlantMatch,
-    PlantMatchingBundle,
-    PlantMatchingEngine,
-)
-from app.engines.pollutant_gap import (
-    ParameterGapResult,
-    PollutantGapBundle,
-    PollutantGapEngine,
-)
-from app.engines.recommendation_assembly import (
-    AssembledRecommendation,
-    RecommendationAssemblyBundle,
-    RecommendationAssemblyEngine,
-    RecommendationEvidenceSummary,
-)
-from app.engines.target_validation import TargetUseCaseValidator
-from app.engines.treatment_need import (
-    TreatmentNeedBundle,
-    TreatmentNeedClassifier,
-    TreatmentNeedResult,
-)
-from app.engines.topsis_ranking import (
-    TopsisCriterionContribution,
-    TopsisRankedCandidate,
-    TopsisRankingBundle,
-    TopsisRankingEngine,
-)
-from app.engines.water_input_assembly import (
-    SOURCE_PRIORITY,
-    WaterInputAssemblyEngine,
-    WaterInputBundle,
-)
 
 __all__ = [
     "DATA_PRIORITY_NOTE",
+    "CandidateEligibilityProfile",
     "CandidateFilterBundle",
     "CandidateFilteringEngine",
     "CandidateFilterResult",
@@ -90,6 +176,7 @@ __all__ = [
     "NormalizedMcdaCriterion",
     "NormalizedMcdaMatrixBundle",
     "NormalizedMcdaMatrixRow",
+    "OptionTextFeatures",
     "ParameterGapResult",
     "CandidatePlantMatches",
     "PlantMatch",
@@ -112,6 +199,9 @@ __all__ = [
     "SOURCE_PRIORITY",
     "WaterInputAssemblyEngine",
     "WaterInputBundle",
+    "build_eligibility_profile",
+    "build_option_text_features",
+    "need_group_mask",
     "normalize_match_key",
     "normalize_text",
 ]
@@ -66,6 +66,12 @@ PARAMETER_TO_NEED_GROUP = {
     for parameter in parameters
 }
 
+# One bit per need group, in NEED_PARAMETER_KEYS order, for mask-based filtering.
+NEED_GROUP_BITS = {
+    need_group: 1 << index
+    for index, need_group in enumerate(NEED_PARAMETER_KEYS)
+}
+
 CATALOGUE_SUPPORT_FIELDS = {
     "supported_treatment_need",
     "supported_treatment_needs",
@@ -112,6 +118,151 @@ DRINKING_USE_CASE_KEYS = {
     "potable",
 }
 
+# Named caution key groups. Each option's text is checked against these once,
+# so per-request filtering only needs set lookups on the matched group names.
+CAUTION_KEY_GROUPS = {
+    "open_contact": OPEN_CONTACT_KEYS,
+    "food_chain": FOOD_CHAIN_KEYS,
+    "infiltration": INFILTRATION_KEYS,
+    "steep_slope": STEEP_SLOPE_KEYS,
+    "poor_soil": POOR_SOIL_KEYS,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class OptionTextFeatures:
+    """Text keys and caution key groups derived once from one NbS profile."""
+
+    text_keys: frozenset[str]
+    caution_key_groups: frozenset[str]
+
+
+def build_option_text_features(profile: dict[str, Any]) -> OptionTextFeatures:
+    """Tokenize profile text and record which caution key groups it mentions.
+
+    Catalogue text does not change between requests, so a catalogue snapshot
+    can call this once per option when it loads.
+    """
+
+    text_keys = _profile_text_keys(
+        profile.get("option") or {},
+        list(profile.get("implementation") or []),
+        list(profile.get("footprint") or []),
+        list(profile.get("criteria") or []),
+    )
+    return OptionTextFeatures(
+        text_keys=frozenset(text_keys),
+        caution_key_groups=frozenset(
+            group
+            for group, keys in CAUTION_KEY_GROUPS.items()
+            if _has_any(text_keys, keys)
+        ),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class CandidateEligibilityProfile:
+    """Request-independent eligibility facts for one option, as bitmasks.
+
+    Bits follow `NEED_GROUP_BITS`. A catalogue snapshot can build these once
+    so each request only combines integers; reason text is written later from
+    the same facts.
+    """
+
+    nbs_id: int | None
+    nbs_name: str | None
+    evidence_mask: int
+    catalogue_mask: int
+    pending_evidence_groups: tuple[str, ...]
+    has_removal_rows: bool
+    option_missing: bool
+    implementation_missing: bool
+    caution_key_groups: frozenset[str]
+    evidence_source_ids: tuple[int, ...]
+    implementation_source_ids: tuple[int, ...]
+
+    @property
+    def support_mask(self) -> int:
+        """Return need groups supported by evidence or catalogue fields."""
+
+        return self.evidence_mask | self.catalogue_mask
+
+    @property
+    def always_pending(self) -> bool:
+        """Return whether data is pending regardless of the requested groups."""
+
+        return (
+            self.option_missing
+            or (not self.has_removal_rows and not self.catalogue_mask)
+            or bool(self.pending_evidence_groups)
+            or self.implementation_missing
+        )
+
+    def status_for(self, requested_mask: int) -> str:
+        """Choose an eligibility status with integer mask operations only."""
+
+        supported_mask = requested_mask & self.support_mask
+        if not supported_mask and self.has_removal_rows:
+            return INELIGIBLE
+        if self.always_pending or supported_mask & self.catalogue_mask & ~self.evidence_mask:
+            return DATA_PENDING
+        if supported_mask:
+            return ELIGIBLE
+        return DATA_PENDING
+
+
+def need_group_mask(need_groups: list[str] | tuple[str, ...]) -> int:
+    """Encode need group names as a bitmask; unknown groups add no bit."""
+
+    mask = 0
+    for need_group in need_groups:
+        mask |= NEED_GROUP_BITS.get(need_group, 0)
+    return mask
+
+
+def build_eligibility_profile(
+    option: dict[str, Any],
+    profile: dict[str, Any],
+    *,
+    text_features: OptionTextFeatures | None = None,
+) -> CandidateEligibilityProfile:
+    """Encode one raw catalogue profile as a CandidateEligibilityProfile."""
+
+    nbs_id = _option_id(option)
+    profile_option = profile.get("option") or option
+    removal_rows = list(profile.get("removal_efficiencies") or [])
+    implementation_rows = list(profile.get("implementation") or [])
+    footprint_rows = list(profile.get("footprint") or [])
+    criteria_rows = list(profile.get("criteria") or [])
+    missing_sections = list(profile.get("missing_sections") or [])
+
+    evidence_groups, pending_evidence_groups = _need_groups_from_removal(removal_rows)
+    if text_features is None:
+        text_features = build_option_text_features({**profile, "option": profile_option})
+
+    return CandidateEligibilityProfile(
+        nbs_id=nbs_id,
+        nbs_name=normalize_text(profile_option.get("solution") if profile_option else None),
+        evidence_mask=need_group_mask(evidence_groups),
+        catalogue_mask=need_group_mask(_need_groups_from_catalogue(profile)),
+        pending_evidence_groups=tuple(pending_evidence_groups),
+        has_removal_rows=bool(removal_rows),
+        option_missing="option" in missing_sections or not profile_option,
+        implementation_missing=(
+            "implementation" in missing_sections or not implementation_rows
+        ),
+        caution_key_groups=text_features.caution_key_groups,
+        evidence_source_ids=tuple(
+            _collect_source_ids(
+                [profile_option],
+                removal_rows,
+                footprint_rows,
+                criteria_rows,
+            )
+        ),
+        implementation_source_ids=tuple(_collect_source_ids(implementation_rows)),
+    )
+
 
 @dataclass(slots=True)
 class CandidateFilterResult:
@@ -167,6 +318,20 @@ class NbsCandidateProvider(Protocol):
         """Return raw option, evidence, implementation, footprint, and criteria."""
 
 
+class OptionTextFeatureProvider(Protocol):
+    """Optional provider method for precomputed profile text features."""
+
+    def get_option_text_features(self, nbs_id: int) -> OptionTextFeatures | None:
+        """Return precomputed text features, or `None` when unavailable."""
+
+
+class EligibilityProfileProvider(Protocol):
+    """Optional provider method for eligibility profiles built at catalogue load."""
+
+    def get_eligibility_profiles(self) -> list[CandidateEligibilityProfile]:
+        """Return one eligibility profile per option, in `list_options` order."""
+
+
 class CandidateFilteringEngine:
     """Evaluate candidate NbS eligibility from treatment need groups only."""
 
@@ -194,139 +359,145 @@ class CandidateFilteringEngine:
                 "No classified treatment need groups were available for candidate filtering."
             )
 
-        options = self.nbs_provider.list_options()
+        profiles = self._eligibility_profiles()
+        requested_mask = need_group_mask(treatment_need_groups)
+        statuses = [profile.status_for(requested_mask) for profile in profiles]
         results = [
-            self._evaluate_option(option, treatment_bundle, treatment_need_groups)
-            for option in options
+            _result_from_profile(
+                profile,
+                status,
+                treatment_need_groups=treatment_need_groups,
+                requested_mask=requested_mask,
+                use_case=treatment_bundle.use_case,
+            )
+            for profile, status in zip(profiles, statuses)
         ]
         return CandidateFilterBundle(
             use_case=treatment_bundle.use_case,
             selected_source_type=treatment_bundle.selected_source_type,
             treatment_need_groups=treatment_need_groups,
             candidate_count=len(results),
-            eligible_count=sum(
-                result.eligibility_status == ELIGIBLE for result in results
-            ),
-            ineligible_count=sum(
-                result.eligibility_status == INELIGIBLE for result in results
-            ),
-            data_pending_count=sum(
-                result.eligibility_status == DATA_PENDING for result in results
-            ),
+            eligible_count=statuses.count(ELIGIBLE),
+            ineligible_count=statuses.count(INELIGIBLE),
+            data_pending_count=statuses.count(DATA_PENDING),
             results=results,
             warnings=warnings,
         )
 
-    def _evaluate_option(
+    def _eligibility_profiles(self) -> list[CandidateEligibilityProfile]:
+        """Use catalogue-load profiles when available, otherwise build them now."""
+
+        get_profiles = getattr(self.nbs_provider, "get_eligibility_profiles", None)
+        if get_profiles is not None:
+            return list(get_profiles())
+        return [
+            self._build_eligibility_profile(option)
+            for option in self.nbs_provider.list_options()
+        ]
+
+    def _build_eligibility_profile(
         self,
         option: dict[str, Any],
-        treatment_bundle: TreatmentNeedBundle,
-        treatment_need_groups: list[str],
-    ) -> CandidateFilterResult:
-        """Evaluate one candidate using raw catalogue/evidence fields."""
+    ) -> CandidateEligibilityProfile:
+        """Fetch one raw profile and encode its request-independent facts."""
 
         nbs_id = _option_id(option)
         profile = self.nbs_provider.get_full_nbs_profile(nbs_id) if nbs_id else {}
-        profile_option = profile.get("option") or option
-        removal_rows = list(profile.get("removal_efficiencies") or [])
-        implementation_rows = list(profile.get("implementation") or [])
-        footprint_rows = list(profile.get("footprint") or [])
-        criteria_rows = list(profile.get("criteria") or [])
-
-        evidence_groups, pending_evidence_groups = _need_groups_from_removal(
-            removal_rows,
+        text_features = None
+        get_features = getattr(self.nbs_provider, "get_option_text_features", None)
+        if get_features is not None and nbs_id is not None:
+            text_features = get_features(nbs_id)
+        return build_eligibility_profile(
+            option,
+            profile,
+            text_features=text_features,
         )
-        catalogue_groups = _need_groups_from_catalogue(profile)
-        supported = [
-            need_group
-            for need_group in treatment_need_groups
-            if need_group in evidence_groups or need_group in catalogue_groups
-        ]
-        unsupported = [
-            need_group
-            for need_group in treatment_need_groups
-            if need_group not in supported
-        ]
-
-        data_pending_reasons: list[str] = []
-        exclusion_reasons: list[str] = []
-        caution_flags: list[str] = []
-        notes = [
-            "Step E checks eligibility only; no ranking or final recommendation "
-            "was calculated."
-        ]
-
-        missing_sections = list(profile.get("missing_sections") or [])
-        if "option" in missing_sections or not profile_option:
-            data_pending_reasons.append("Catalogue option details are missing.")
-        if not removal_rows and not catalogue_groups:
-            data_pending_reasons.append(
-                "No removal-efficiency evidence or explicit catalogue support is available."
-            )
-        if pending_evidence_groups:
-            data_pending_reasons.append(
-                "Removal-efficiency rows exist without numeric efficiency values for: "
-                + ", ".join(pending_evidence_groups)
-                + "."
-            )
-        catalogue_only_groups = [
-            need_group
-            for need_group in supported
-            if need_group in catalogue_groups and need_group not in evidence_groups
-        ]
-        if catalogue_only_groups:
-            data_pending_reasons.append(
-                "Catalogue support exists but pollutant-specific removal evidence "
-                "is missing for: "
-                + ", ".join(catalogue_only_groups)
-                + "."
-            )
-        if "implementation" in missing_sections or not implementation_rows:
-            data_pending_reasons.append("Implementation guidance is missing.")
 
-        if not supported and removal_rows:
-            exclusion_reasons.append(
-                "No explicit support was found for the requested treatment need groups."
-            )
 
-        evidence_source_ids = _collect_source_ids(
-            [profile_option],
-            removal_rows,
-            footprint_rows,
-            criteria_rows,
+def _result_from_profile(
+    profile: CandidateEligibilityProfile,
+    status: str,
+    *,
+    treatment_need_groups: list[str],
+    requested_mask: int,
+    use_case: str,
+) -> CandidateFilterResult:
+    """Write the readable Step E result for one already-classified option."""
+
+    supported_mask = requested_mask & profile.support_mask
+    supported = [
+        need_group
+        for need_group in treatment_need_groups
+        if NEED_GROUP_BITS.get(need_group, 0) & supported_mask
+    ]
+    unsupported = [
+        need_group
+        for need_group in treatment_need_groups
+        if need_group not in supported
+    ]
+
+    data_pending_reasons: list[str] = []
+    exclusion_reasons: list[str] = []
+    caution_flags: list[str] = []
+    notes = [
+        "Step E checks eligibility only; no ranking or final recommendation "
+        "was calculated."
+    ]
+
+    if profile.option_missing:
+        data_pending_reasons.append("Catalogue option details are missing.")
+    if not profile.has_removal_rows and not profile.catalogue_mask:
+        data_pending_reasons.append(
+            "No removal-efficiency evidence or explicit catalogue support is available."
         )
-        implementation_source_ids = _collect_source_ids(implementation_rows)
-        text_keys = _profile_text_keys(
-            profile_option,
-            implementation_rows,
-            footprint_rows,
-            criteria_rows,
+    if profile.pending_evidence_groups:
+        data_pending_reasons.append(
+            "Removal-efficiency rows exist without numeric efficiency values for: "
+            + ", ".join(profile.pending_evidence_groups)
+            + "."
         )
-        _add_caution_flags(
-            caution_flags=caution_flags,
-            treatment_need_groups=treatment_need_groups,
-            use_case=treatment_bundle.use_case,
-            text_keys=text_keys,
+    catalogue_only_mask = supported_mask & profile.catalogue_mask & ~profile.evidence_mask
+    catalogue_only_groups = [
+        need_group
+        for need_group in supported
+        if NEED_GROUP_BITS[need_group] & catalogue_only_mask
+    ]
+    if catalogue_only_groups:
+        data_pending_reasons.append(
+            "Catalogue support exists but pollutant-specific removal evidence "
+            "is missing for: "
+            + ", ".join(catalogue_only_groups)
+            + "."
         )
+    if profile.implementation_missing:
+        data_pending_reasons.append("Implementation guidance is missing.")
 
-        return CandidateFilterResult(
-            nbs_id=nbs_id,
-            nbs_name=normalize_text(profile_option.get("solution") if profile_option else None),
-            eligibility_status=_eligibility_status(
-                supported,
-                exclusion_reasons,
-                data_pending_reasons,
-            ),
-            supported_treatment_needs=supported,
-            unsupported_treatment_needs=unsupported,
-            data_pending_reasons=data_pending_reasons,
-            exclusion_reasons=exclusion_reasons,
-            caution_flags=caution_flags,
-            evidence_source_ids=evidence_source_ids,
-            implementation_source_ids=implementation_source_ids,
-            notes=notes,
+    if status == INELIGIBLE:
+        exclusion_reasons.append(
+            "No explicit support was found for the requested treatment need groups."
         )
 
+    _add_caution_flags(
+        caution_flags=caution_flags,
+        treatment_need_groups=treatment_need_groups,
+        use_case=use_case,
+        caution_key_groups=profile.caution_key_groups,
+    )
+
+    return CandidateFilterResult(
+        nbs_id=profile.nbs_id,
+        nbs_name=profile.nbs_name,
+        eligibility_status=status,
+        supported_treatment_needs=supported,
+        unsupported_treatment_needs=unsupported,
+        data_pending_reasons=data_pending_reasons,
+        exclusion_reasons=exclusion_reasons,
+        caution_flags=caution_flags,
+        evidence_source_ids=list(profile.evidence_source_ids),
+        implementation_source_ids=list(profile.implementation_source_ids),
+        notes=notes,
+    )
+
 
 def _treatment_need_groups(treatment_bundle: TreatmentNeedBundle) -> list[str]:
     """Return unique treatment need group names from Step D output."""
@@ -413,22 +584,6 @@ def _has_numeric_efficiency(row: dict[str, Any]) -> bool:
     return _as_float(row.get("eff_low")) is not None or _as_float(row.get("eff_high")) is not None
 
 
-def _eligibility_status(
-    supported: list[str],
-    exclusion_reasons: list[str],
-    data_pending_reasons: list[str],
-) -> str:
-    """Choose an eligibility status without scoring or ranking."""
-
-    if exclusion_reasons:
-        return INELIGIBLE
-    if data_pending_reasons:
-        return DATA_PENDING
-    if supported:
-        return ELIGIBLE
-    return DATA_PENDING
-
-
 def _profile_text_keys(
     option: dict[str, Any],
     implementation_rows: list[dict[str, Any]],
@@ -456,17 +611,17 @@ def _add_caution_flags(
     caution_flags: list[str],
     treatment_need_groups: list[str],
     use_case: str,
-    text_keys: set[str],
+    caution_key_groups: frozenset[str],
 ) -> None:
     """Add transparent hard-filter cautions when source fields support them."""
 
-    if "pathogens" in treatment_need_groups and _has_any(text_keys, OPEN_CONTACT_KEYS):
+    if "pathogens" in treatment_need_groups and "open_contact" in caution_key_groups:
         _append_once(
             caution_flags,
             "Pathogen treatment need with open-contact/open-water system; "
             "pre-treatment, disinfection, or restricted access may be required.",
         )
-    if "metals" in treatment_need_groups and _has_any(text_keys, FOOD_CHAIN_KEYS):
+    if "metals" in treatment_need_groups and "food_chain" in caution_key_groups:
         _append_once(
             caution_flags,
             "Metal treatment need with food-chain or aquaculture pathway; "
@@ -474,19 +629,19 @@ def _add_caution_flags(
         )
     if (
         {"pathogens", "metals"}.intersection(treatment_need_groups)
-        and _has_any(text_keys, INFILTRATION_KEYS)
+        and "infiltration" in caution_key_groups
     ):
         _append_once(
             caution_flags,
             "Infiltration system with untreated pathogen or toxic water; "
             "groundwater protection review may be required.",
         )
-    if _has_any(text_keys, STEEP_SLOPE_KEYS):
+    if "steep_slope" in caution_key_groups:
         _append_once(
             caution_flags,
             "Catalogue or implementation fields mention steep-slope sensitivity.",
         )
-    if _has_any(text_keys, POOR_SOIL_KEYS):
+    if "poor_soil" in caution_key_groups:
         _append_once(
             caution_flags,
             "Catalogue or implementation fields mention poor-soil or infiltration limits.",
@@ -8,9 +8,10 @@ confidence scores, or create final recommendations.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass, field
 from inspect import signature
-from typing import Any, Protocol
+from typing import Any, Protocol, runtime_checkable
 
 from app.engines.confidence_scoring import ConfidenceScoringBundle
 from app.engines.topsis_ranking import TopsisRankedCandidate, TopsisRankingBundle
@@ -31,6 +32,23 @@ class PlantMappingProvider(Protocol):
         """Return plants explicitly mapped to one NbS option."""
 
 
+@runtime_checkable
+class BulkPlantMappingProvider(Protocol):
+    """Optional provider shape for looking up several NbS options at once.
+
+    Step K uses it when the plant provider also matches this shape and falls
+    back to one `get_plants_for_nbs` call per candidate otherwise.
+    """
+
+    def get_plants_for_nbs_ids(
+        self,
+        nbs_ids: Iterable[int],
+        *,
+        include_invasive: bool = False,
+    ) -> dict[int, list[Any]]:
+        """Return plants for several NbS options, keyed by NbS ID."""
+
+
 @dataclass(slots=True)
 class PlantMatch:
     """One explicitly mapped plant attached to an already-ranked NbS option."""
@@ -144,8 +162,13 @@ class PlantMatchingEngine:
                 "Plant matching returned no candidate matches because Step I ranked_candidates is empty."
             )
 
+        plants_by_nbs_id = self._get_explicit_plants_for_ids(
+            candidate.nbs_id
+            for candidate in ranking_bundle.ranked_candidates
+            if candidate.nbs_id is not None
+        )
         candidate_matches = [
-            self._candidate_matches(candidate, confidence_by_nbs_id)
+            self._candidate_matches(candidate, confidence_by_nbs_id, plants_by_nbs_id)
             for candidate in ranking_bundle.ranked_candidates
         ]
         for candidate in candidate_matches:
@@ -177,6 +200,7 @@ class PlantMatchingEngine:
         self,
         candidate: TopsisRankedCandidate,
         confidence_by_nbs_id: dict[int, Any],
+        plants_by_nbs_id: dict[int, list[Any]],
     ) -> CandidatePlantMatches:
         """Build plant matches for one ranked candidate."""
 
@@ -192,7 +216,7 @@ class PlantMatchingEngine:
             )
             mapped_plants: list[Any] = []
         else:
-            mapped_plants = self._get_explicit_plants(candidate.nbs_id)
+            mapped_plants = plants_by_nbs_id.get(candidate.nbs_id, [])
 
         if confidence_by_nbs_id and confidence is None:
             warnings.append(
@@ -232,6 +256,29 @@ class PlantMatchingEngine:
             ],
         )
 
+    def _get_explicit_plants_for_ids(
+        self,
+        nbs_ids: Iterable[int],
+    ) -> dict[int, list[Any]]:
+        """Look up plants for all ranked candidates at once when supported."""
+
+        requested_ids = list(dict.fromkeys(nbs_ids))
+        if not isinstance(self.plant_provider, BulkPlantMappingProvider):
+            return {
+                nbs_id: self._get_explicit_plants(nbs_id)
+                for nbs_id in requested_ids
+            }
+        if not requested_ids:
+            return {}
+        plants_by_nbs_id = self.plant_provider.get_plants_for_nbs_ids(
+            requested_ids,
+            include_invasive=False,
+        )
+        return {
+            nbs_id: list(plants_by_nbs_id.get(nbs_id, []))
+            for nbs_id in requested_ids
+        }
+
     def _get_explicit_plants(self, nbs_id: int) -> list[Any]:
         """Return explicit plant mappings while supporting existing providers."""
 
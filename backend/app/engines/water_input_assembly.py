@@ -70,8 +70,22 @@ class WaterInputAssemblyEngine:
         self.water_service = water_service
 
     @classmethod
-    def from_session(cls, session: Any) -> "WaterInputAssemblyEngine":
-        """Create the engine using the production WaterDataService layer."""
+    def from_session(
+        cls,
+        session: Any,
+        *,
+        use_summary: bool = False,
+    ) -> "WaterInputAssemblyEngine":
+        """Create the engine using the production WaterDataService layer.
+
+        With `use_summary=True` the engine reads the pre-aggregated
+        station/parameter summary index instead of raw observation rows.
+        """
+
+        if use_summary:
+            from app.services import get_water_summary_index
+
+            return cls(get_water_summary_index(session))
 
         from app.services import WaterDataService
 
@@ -299,14 +313,17 @@ def _collect_source_ids(observations: Sequence[dict[str, Any]]) -> list[int]:
         source_id = observation.get("source_id")
         if source_id is None and isinstance(observation.get("original"), dict):
             source_id = observation["original"].get("source_id")
-        if source_id is None:
-            continue
-        try:
-            source_id_int = int(source_id)
-        except (TypeError, ValueError):
-            continue
-        if source_id_int not in source_ids:
-            source_ids.append(source_id_int)
+        # Summary rows carry every contributing source in `source_ids`.
+        candidates = [source_id, *(observation.get("source_ids") or [])]
+        for candidate in candidates:
+            if candidate is None:
+                continue
+            try:
+                source_id_int = int(candidate)
+            except (TypeError, ValueError):
+                continue
+            if source_id_int not in source_ids:
+                source_ids.append(source_id_int)
     return source_ids
 
 
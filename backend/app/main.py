@@ -6,21 +6,72 @@ services/engines; this file does not contain scoring logic or production
 deployment wiring.
 """
 
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Response, status
 
 from app.api import api_router
+from app.api.metrics import MetricsMiddleware, metrics_response
+from app.api.query_budget import QueryBudgetMiddleware
+from app.api.request_logging import RequestLoggingMiddleware
 from app.core.config import get_settings
 from app.core.logging import configure_logging
 from app.db.health import check_database_connection
+from app.db.session import get_session_factory
+from app.services import get_location_index
 
 settings = get_settings()
-configure_logging(settings.log_level)
+configure_logging(settings.log_level, settings.log_format)
+logger = logging.getLogger(__name__)
+
+
+def warm_location_index() -> None:
+    """Build the location index before the first request when enabled."""
+
+    try:
+        with get_session_factory()() as session:
+            index = get_location_index(session)
+    except Exception:
+        # A missing database should not stop the app; routes build it lazily.
+        logger.exception("Location index warm-up failed; it will be built on first use.")
+        return
+    logger.info("Location index ready with %s entries.", index.location_count)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Run optional start-up warm-ups."""
+
+    if settings.warm_location_index:
+        warm_location_index()
+    yield
+
 
 app = FastAPI(
     title=settings.app_name,
     version="0.1.0",
+    lifespan=lifespan,
 )
 app.include_router(api_router, prefix="/api/v1")
+if settings.sql_query_budget > 0:
+    app.add_middleware(
+        QueryBudgetMiddleware,
+        budget=settings.sql_query_budget,
+        repeat_threshold=settings.sql_repeat_threshold,
+    )
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+    app.add_api_route("/metrics", metrics_response, methods=["GET"], include_in_schema=False)
+if settings.request_logging_enabled:
+    # Added last so it wraps the other middleware and their log lines carry
+    # the request ID.
+    app.add_middleware(
+        RequestLoggingMiddleware,
+        sample_rate=settings.request_log_sample_rate,
+        slow_ms=settings.request_log_slow_ms,
+    )
 
 
 @app.get("/health")
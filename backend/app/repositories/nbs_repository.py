@@ -72,3 +72,33 @@ class NbsRepository(BaseRepository):
             .order_by(NbsCriteria.criterion)
         )
         return list(self.session.scalars(statement).all())
+
+    def list_removal_efficiencies(self) -> list[RemovalEfficiency]:
+        """Return every removal efficiency row ordered by NbS ID and parameter."""
+
+        statement = select(RemovalEfficiency).order_by(
+            RemovalEfficiency.nbs_id,
+            RemovalEfficiency.parameter,
+        )
+        return list(self.session.scalars(statement).all())
+
+    def list_implementation(self) -> list[NbsImplementation]:
+        """Return every implementation guidance row ordered by NbS ID and ID."""
+
+        statement = select(NbsImplementation).order_by(
+            NbsImplementation.nbs_id,
+            NbsImplementation.id,
+        )
+        return list(self.session.scalars(statement).all())
+
+    def list_footprints(self) -> list[NbsFootprint]:
+        """Return every footprint/loading row ordered by NbS ID and ID."""
+
+        statement = select(NbsFootprint).order_by(NbsFootprint.nbs_id, NbsFootprint.id)
+        return list(self.session.scalars(statement).all())
+
+    def list_criteria(self) -> list[NbsCriteria]:
+        """Return every qualitative criteria row ordered by NbS ID and criterion."""
+
+        statement = select(NbsCriteria).order_by(NbsCriteria.nbs_id, NbsCriteria.criterion)
+        return list(self.session.scalars(statement).all())
@@ -5,6 +5,8 @@ It excludes invasive plants by default for recommendation-support queries, but
 does not select or rank plants.
 """
 
+from collections.abc import Iterable
+
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
@@ -50,6 +52,36 @@ class PlantRepository(BaseRepository):
         statement = statement.order_by(Plant.plant_species)
         return list(self.session.scalars(statement).all())
 
+    def get_plants_for_nbs_ids(
+        self,
+        nbs_ids: Iterable[int],
+        *,
+        include_invasive: bool = False,
+    ) -> dict[int, list[Plant]]:
+        """Return plants mapped to several NbS options with one join query.
+
+        Every requested ID is a key in the result, with an empty list when no
+        plant is mapped. The invasive filter and plant ordering match
+        `get_plants_for_nbs`.
+        """
+
+        requested_ids = list(dict.fromkeys(int(nbs_id) for nbs_id in nbs_ids))
+        plants_by_nbs_id: dict[int, list[Plant]] = {nbs_id: [] for nbs_id in requested_ids}
+        if not requested_ids:
+            return plants_by_nbs_id
+
+        statement = (
+            select(PlantSolutionMap.nbs_id, Plant)
+            .join(PlantSolutionMap, PlantSolutionMap.plant_id == Plant.id)
+            .where(PlantSolutionMap.nbs_id.in_(requested_ids))
+        )
+        if not include_invasive:
+            statement = statement.where((Plant.invasive == 0) | (Plant.invasive.is_(None)))
+        statement = statement.order_by(Plant.plant_species)
+        for nbs_id, plant in self.session.execute(statement).all():
+            plants_by_nbs_id[int(nbs_id)].append(plant)
+        return plants_by_nbs_id
+
     def count_plant_mappings(self, nbs_id: int | None = None) -> int:
         """Return a raw count of plant-solution mapping rows."""
 
@@ -29,6 +29,16 @@ class WaterRepository(BaseRepository):
         )
         return list(self.session.scalars(statement).all())
 
+    def list_observations(self) -> list[WaterObservation]:
+        """Return every observation ordered by station, parameter, and ID."""
+
+        statement = select(WaterObservation).order_by(
+            WaterObservation.station,
+            WaterObservation.parameter,
+            WaterObservation.id,
+        )
+        return list(self.session.scalars(statement).all())
+
     def get_observations_by_basin(self, basin_id: int) -> list[WaterObservation]:
         """Return observations linked to a basin ID."""
 
@@ -54,6 +64,24 @@ class WaterRepository(BaseRepository):
         )
         return list(self.session.scalars(statement).all())
 
+    def list_station_observations(self, station: str) -> list[WaterObservation]:
+        """Return every observation for one station in ID order.
+
+        The filter is on `station` only, so the (station, parameter) index
+        serves it. Callers match parameter names in Python with the same key
+        Step B uses; folding the name inside SQL could not repeat
+        `normalize_match_key` exactly.
+        """
+
+        if not station:
+            return []
+        statement = (
+            select(WaterObservation)
+            .where(WaterObservation.station == station)
+            .order_by(WaterObservation.id)
+        )
+        return list(self.session.scalars(statement).all())
+
     def list_available_parameters(self) -> list[str]:
         """Return distinct water-quality parameter names."""
 
@@ -78,3 +106,17 @@ class WaterRepository(BaseRepository):
             {"parameter": parameter, "count": count}
             for parameter, count in self.session.execute(statement).all()
         ]
+
+    def list_station_locations(self) -> list[dict[str, str | None]]:
+        """Return distinct (state, district, station) triples from observations."""
+
+        statement = (
+            select(WaterObservation.state, WaterObservation.district, WaterObservation.station)
+            .where(WaterObservation.station.is_not(None))
+            .distinct()
+            .order_by(WaterObservation.state, WaterObservation.district, WaterObservation.station)
+        )
+        return [
+            {"state": state, "district": district, "station": station}
+            for state, district, station in self.session.execute(statement).all()
+        ]
@@ -41,6 +41,14 @@ from app.schemas.engine import (
     TopsisRankingBundleResponse,
     WaterInputBundleResponse,
 )
+from app.schemas.location import (
+    LocationDistrictsResponse,
+    LocationEntryResponse,
+    LocationSearchResponse,
+    LocationStationsResponse,
+    LocationStatesResponse,
+)
+from app.schemas.name_search import NameAutocompleteResponse, NameMatchResponse
 from app.schemas.nbs import (
     NbsCriteriaResponse,
     NbsFootprintResponse,
@@ -49,7 +57,12 @@ from app.schemas.nbs import (
     NbsOptionResponse,
     RemovalEfficiencyResponse,
 )
-from app.schemas.plant import PlantCatalogResponse, PlantMappingResponse, PlantResponse
+from app.schemas.plant import (
+    PlantCatalogResponse,
+    PlantMappingResponse,
+    PlantResponse,
+    PlantSearchResponse,
+)
 from app.schemas.pollution import PollutionContextResponse, PollutionSourceResponse
 from app.schemas.reference import (
     BasinResponse,
@@ -98,6 +111,13 @@ __all__ = [
     "McdaMatrixRowResponse",
     "McdaWeightsBundleResponse",
     "MissingSectionResponse",
+    "LocationDistrictsResponse",
+    "LocationEntryResponse",
+    "LocationSearchResponse",
+    "LocationStationsResponse",
+    "LocationStatesResponse",
+    "NameAutocompleteResponse",
+    "NameMatchResponse",
     "NbsCriteriaResponse",
     "NbsFootprintResponse",
     "NbsFullProfileResponse",
@@ -113,6 +133,7 @@ __all__ = [
     "PlantMatchingBundleResponse",
     "PlantMappingResponse",
     "PlantResponse",
+    "PlantSearchResponse",
     "PollutionContextResponse",
     "PollutionSourceResponse",
     "PollutantGapBundleResponse",
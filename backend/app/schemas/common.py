@@ -13,7 +13,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class RawResponseModel(BaseModel):
     """Base model that can read either dictionaries or SQLAlchemy objects."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class SourceRef(RawResponseModel):
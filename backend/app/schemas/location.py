@@ -0,0 +1,49 @@
+"""Pydantic schemas for state, district, and station lookup responses.
+
+These shapes return stored location names and region IDs from the in-memory
+location index. They do not label sites as suitable for any NbS option.
+"""
+
+from typing import Literal
+
+from pydantic import Field
+
+from app.schemas.common import RawResponseModel
+
+
+class LocationEntryResponse(RawResponseModel):
+    """One indexed state, district, or station."""
+
+    kind: Literal["state", "district", "station"]
+    name: str
+    state: str | None = None
+    district: str | None = None
+    region_id: int | None = None
+
+
+class LocationStatesResponse(RawResponseModel):
+    """All indexed state names."""
+
+    states: list[str] = Field(default_factory=list)
+
+
+class LocationDistrictsResponse(RawResponseModel):
+    """District names, optionally limited to one state."""
+
+    state: str | None = None
+    districts: list[str] = Field(default_factory=list)
+
+
+class LocationStationsResponse(RawResponseModel):
+    """Station entries, optionally limited to one state or district."""
+
+    state: str | None = None
+    district: str | None = None
+    stations: list[LocationEntryResponse] = Field(default_factory=list)
+
+
+class LocationSearchResponse(RawResponseModel):
+    """Prefix matches for one typed query."""
+
+    query: str
+    matches: list[LocationEntryResponse] = Field(default_factory=list)
@@ -0,0 +1,27 @@
+"""Pydantic schemas for fuzzy catalogue name search responses.
+
+These shapes return stored plant species and NbS solution names with a match
+score. They do not label recommendations.
+"""
+
+from typing import Literal
+
+from pydantic import Field
+
+from app.schemas.common import RawResponseModel
+
+
+class NameMatchResponse(RawResponseModel):
+    """One catalogue name that matched an autocomplete query."""
+
+    kind: Literal["plant", "nbs"]
+    id: int | None = None
+    name: str
+    score: float
+
+
+class NameAutocompleteResponse(RawResponseModel):
+    """Autocomplete matches for one query, highest score first."""
+
+    query: str
+    matches: list[NameMatchResponse] = Field(default_factory=list)
@@ -49,3 +49,13 @@ class PlantCatalogResponse(RawResponseModel):
     nbs_id: int | None = None
     include_invasive: bool = False
     missing_sections: list[str] = Field(default_factory=list)
+
+
+class PlantSearchResponse(RawResponseModel):
+    """One page of plant search results with facet counts."""
+
+    total: int = 0
+    limit: int = 50
+    offset: int = 0
+    results: list[PlantResponse] = Field(default_factory=list)
+    facets: dict[str, dict[str, int]] = Field(default_factory=dict)
@@ -2,7 +2,31 @@
 
 from app.services.data_availability_service import DataAvailabilityService
 from app.services.nbs_catalog_service import NbsCatalogService
+from app.services.nbs_catalog_snapshot import (
+    NbsCatalogSnapshot,
+    clear_nbs_catalog_snapshot,
+    get_nbs_catalog_snapshot,
+)
+from app.services.location_index import (
+    LOCATION_KINDS,
+    LocationIndex,
+    clear_location_index,
+    get_location_index,
+)
+from app.services.name_search_service import (
+    NAME_KINDS,
+    NAME_SCORE_CUTOFF,
+    NameSearchIndex,
+    clear_name_search_index,
+    get_name_search_index,
+)
 from app.services.plant_catalog_service import PlantCatalogService
+from app.services.plant_search_index import (
+    PLANT_SEARCH_FACETS,
+    PlantSearchIndex,
+    clear_plant_search_index,
+    get_plant_search_index,
+)
 from app.services.pollution_context_service import PollutionContextService
 from app.services.reference_data_service import ReferenceDataService
 from app.services.river_context_service import RiverContextService
@@ -13,11 +37,31 @@ from app.services.scientific_workflow_service import (
 from app.services.site_profile_service import SiteProfileService
 from app.services.standards_service import StandardsService
 from app.services.water_data_service import WaterDataService
+from app.services.water_summary_service import (
+    WaterSummaryIndex,
+    build_station_parameter_summaries,
+    clear_water_summary_index,
+    get_water_summary_index,
+)
+from app.services.workflow_timing import (
+    StepTiming,
+    WorkflowTimer,
+    log_workflow_timings,
+    server_timing_header,
+)
 
 __all__ = [
+    "LOCATION_KINDS",
+    "NAME_KINDS",
+    "NAME_SCORE_CUTOFF",
+    "PLANT_SEARCH_FACETS",
     "DataAvailabilityService",
+    "LocationIndex",
+    "NameSearchIndex",
     "NbsCatalogService",
+    "NbsCatalogSnapshot",
     "PlantCatalogService",
+    "PlantSearchIndex",
     "PollutionContextService",
     "ReferenceDataService",
     "RiverContextService",
@@ -25,5 +69,21 @@ __all__ = [
     "ScientificWorkflowService",
     "SiteProfileService",
     "StandardsService",
+    "StepTiming",
     "WaterDataService",
+    "WaterSummaryIndex",
+    "WorkflowTimer",
+    "build_station_parameter_summaries",
+    "clear_location_index",
+    "clear_name_search_index",
+    "clear_nbs_catalog_snapshot",
+    "clear_plant_search_index",
+    "clear_water_summary_index",
+    "get_location_index",
+    "get_name_search_index",
+    "get_nbs_catalog_snapshot",
+    "get_plant_search_index",
+    "get_water_summary_index",
+    "log_workflow_timings",
+    "server_timing_header",
 ]
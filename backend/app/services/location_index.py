@@ -0,0 +1,268 @@
+"""In-memory state, district, and station index with prefix autocomplete.
+
+`RegionRepository.search_by_district` runs an `ilike '%text%'` scan on every
+call, and there is no listing of states or districts at all. This module reads
+station locations once from `water_observations` and `regions`, keeps the
+state -> district -> station hierarchy in dictionaries, and answers type-ahead
+searches with `bisect` over a sorted array of word-start keys. It returns
+stored names and region IDs only; it does not choose sites for recommendations.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from threading import Lock
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import record_cache_lookup
+from app.repositories import RegionRepository, WaterRepository
+
+
+LOCATION_KINDS = ("state", "district", "station")
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def normalize_location(value: Any) -> str:
+    """Lowercase a location name and replace punctuation runs with spaces."""
+
+    if value is None:
+        return ""
+    return _NON_ALNUM.sub(" ", str(value).lower()).strip()
+
+
+def _display(value: Any) -> str | None:
+    """Return a stored name with surrounding and repeated whitespace removed."""
+
+    if value is None:
+        return None
+    text = " ".join(str(value).split())
+    return text or None
+
+
+class LocationIndex:
+    """Answer location listings and prefix searches from memory.
+
+    Names are matched case-insensitively. A state or district spelled several
+    ways keeps the first spelling seen. Districts are keyed by state and name,
+    because one district name can occur in several states. Regions have no
+    state column, so a region station takes the state recorded for its station
+    in `water_observations`, or for its district when only one state has a
+    district of that name.
+    """
+
+    def __init__(
+        self,
+        regions: Iterable[Mapping[str, Any]],
+        station_locations: Iterable[Mapping[str, Any]],
+    ) -> None:
+        self._states: dict[str, str] = {}
+        self._districts: dict[tuple[str, str], dict[str, Any]] = {}
+        self._district_states: dict[str, list[str]] = {}
+        self._stations: dict[str, dict[str, Any]] = {}
+
+        for row in station_locations:
+            self._add(row.get("state"), row.get("district"), row.get("station"), None)
+        for row in regions:
+            self._add(None, row.get("district"), row.get("station"), row.get("id"))
+
+        self._entries: list[dict[str, Any]] = [
+            {"kind": "state", "name": name, "state": name, "district": None, "region_id": None}
+            for name in self._states.values()
+        ]
+        self._entries.extend(
+            {"kind": "district", "name": district["name"], "state": district["state"],
+             "district": district["name"], "region_id": None}
+            for district in self._districts.values()
+        )
+        self._entries.extend(dict(station) for station in self._stations.values())
+        self._entries.sort(key=lambda entry: (entry["name"].lower(), entry["kind"]))
+
+        # One key per word start, so "nagar" finds "Hoshangabad Nagar" too.
+        keys: list[tuple[str, int, int]] = []
+        for position, entry in enumerate(self._entries):
+            normalized = normalize_location(entry["name"])
+            for match in _WORD.finditer(normalized):
+                keys.append((normalized[match.start():], int(match.start() > 0), position))
+        keys.sort()
+        self._keys = [key for key, _word, _position in keys]
+        self._key_entries = [(word, position) for _key, word, position in keys]
+
+    @classmethod
+    def from_session(cls, session: Session) -> "LocationIndex":
+        """Build the index from observation locations and stored regions."""
+
+        return cls(
+            [
+                {"id": region.id, "district": region.district, "station": region.station}
+                for region in RegionRepository(session).list_regions()
+            ],
+            WaterRepository(session).list_station_locations(),
+        )
+
+    @property
+    def location_count(self) -> int:
+        """Return the number of indexed states, districts, and stations."""
+
+        return len(self._entries)
+
+    def list_states(self) -> list[str]:
+        """Return state names in alphabetical order."""
+
+        return sorted(self._states.values(), key=str.lower)
+
+    def list_districts(self, state: str | None = None) -> list[str]:
+        """Return district names, optionally only those in one state.
+
+        Without a state, a name shared by districts in several states is
+        listed once.
+        """
+
+        state_key = normalize_location(state) if state else None
+        names = {
+            district_key: district["name"]
+            for (district_state, district_key), district in self._districts.items()
+            if state_key is None or district_state == state_key
+        }
+        return sorted(names.values(), key=str.lower)
+
+    def list_stations(
+        self,
+        state: str | None = None,
+        district: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return station entries, optionally filtered by state and district."""
+
+        state_key = normalize_location(state) if state else None
+        district_key = normalize_location(district) if district else None
+        return [
+            dict(entry)
+            for entry in self._entries
+            if entry["kind"] == "station"
+            and (state_key is None or normalize_location(entry["state"]) == state_key)
+            and (district_key is None or normalize_location(entry["district"]) == district_key)
+        ]
+
+    def search(
+        self,
+        prefix: str,
+        *,
+        kind: str | None = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Return locations with a word starting with the typed prefix.
+
+        Names that start with the prefix come before names where only a later
+        word matches; ties are ordered alphabetically.
+        """
+
+        query = normalize_location(prefix)
+        if not query:
+            return []
+
+        best: dict[int, int] = {}
+        start = bisect_left(self._keys, query)
+        for offset in range(start, len(self._keys)):
+            if not self._keys[offset].startswith(query):
+                break
+            word, position = self._key_entries[offset]
+            if kind is not None and self._entries[position]["kind"] != kind:
+                continue
+            if word < best.get(position, 2):
+                best[position] = word
+
+        ranked = sorted(best, key=lambda position: (best[position], position))
+        return [dict(self._entries[position]) for position in ranked[:limit]]
+
+    def _add(
+        self,
+        state: Any,
+        district: Any,
+        station: Any,
+        region_id: Any,
+    ) -> None:
+        """Record one location row in the state -> district -> station maps."""
+
+        state_name = _display(state)
+        district_name = _display(district)
+        station_name = _display(station)
+
+        if state_name is not None:
+            state_name = self._states.setdefault(normalize_location(state_name), state_name)
+
+        district_entry = None
+        if district_name is not None:
+            district_entry = self._district(state_name, district_name)
+
+        if station_name is None:
+            return
+        station_entry = self._stations.setdefault(
+            normalize_location(station_name),
+            {"kind": "station", "name": station_name, "state": None,
+             "district": None, "region_id": None},
+        )
+        if station_entry["district"] is None and district_entry is not None:
+            station_entry["district"] = district_entry["name"]
+        if station_entry["state"] is None:
+            station_entry["state"] = state_name or (
+                district_entry["state"] if district_entry is not None else None
+            )
+        if station_entry["region_id"] is None and region_id is not None:
+            station_entry["region_id"] = int(region_id)
+
+    def _district(self, state_name: str | None, district_name: str) -> dict[str, Any]:
+        """Return the district entry for a state and district name.
+
+        A row without a state uses the only known district of that name. When
+        the name is known in several states, the state stays unknown and no
+        new district is listed.
+        """
+
+        district_key = normalize_location(district_name)
+        known_states = self._district_states.setdefault(district_key, [])
+        if state_name is None:
+            if len(known_states) == 1:
+                return self._districts[(known_states[0], district_key)]
+            if known_states:
+                return {"name": self._districts[(known_states[0], district_key)]["name"],
+                        "state": None}
+            state_key = ""
+        else:
+            state_key = normalize_location(state_name)
+
+        key = (state_key, district_key)
+        if key not in self._districts:
+            self._districts[key] = {"name": district_name, "state": state_name}
+            known_states.append(state_key)
+        return self._districts[key]
+
+
+_location_index: LocationIndex | None = None
+_location_index_lock = Lock()
+
+
+def get_location_index(session: Session) -> LocationIndex:
+    """Return the process-wide location index, building it on first use."""
+
+    global _location_index
+    if _location_index is None:
+        with _location_index_lock:
+            if _location_index is None:
+                _location_index = LocationIndex.from_session(session)
+                record_cache_lookup("location_index", hit=False)
+                return _location_index
+    record_cache_lookup("location_index", hit=True)
+    return _location_index
+
+
+def clear_location_index() -> None:
+    """Drop the cached index so the next call rebuilds it after a data reload."""
+
+    global _location_index
+    with _location_index_lock:
+        _location_index = None
@@ -0,0 +1,169 @@
+"""Typo-tolerant name search over plant species and NbS solution names.
+
+The backend has no fuzzy lookup for catalogue names. This module normalizes
+`plants.plant_species` and `nbs_options.solution` once, then scores a query
+against every stored name with one batched `rapidfuzz.process.extract` call.
+It returns names and IDs only; it does not select or rank recommendations.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from threading import Lock
+from typing import Any
+
+from rapidfuzz import fuzz, process
+from sqlalchemy.orm import Session
+
+from app.core.metrics import record_cache_lookup
+from app.repositories import NbsRepository, PlantRepository
+
+
+NAME_KINDS = ("plant", "nbs")
+NAME_SCORE_CUTOFF = 60.0
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(value: Any) -> str:
+    """Lowercase a name and replace punctuation runs with single spaces."""
+
+    if value is None:
+        return ""
+    return _NON_ALNUM.sub(" ", str(value).lower()).strip()
+
+
+class NameSearchIndex:
+    """Hold normalized choice lists for batched fuzzy name matching.
+
+    Each entry keeps the stored display name, its kind (`plant` or `nbs`), and
+    the row ID. Names that normalize to the same text within one kind are
+    stored once, keeping the first row ID.
+    """
+
+    def __init__(
+        self,
+        plants: Iterable[Mapping[str, Any]],
+        nbs_options: Iterable[Mapping[str, Any]],
+    ) -> None:
+        self._entries: list[dict[str, Any]] = []
+        self._choices: list[str] = []
+        self._positions: dict[str, list[int]] = {kind: [] for kind in NAME_KINDS}
+        self._add_rows("plant", plants, "plant_species")
+        self._add_rows("nbs", nbs_options, "solution")
+        self._choices_by_kind = {
+            kind: [self._choices[position] for position in positions]
+            for kind, positions in self._positions.items()
+        }
+
+    @classmethod
+    def from_session(cls, session: Session) -> "NameSearchIndex":
+        """Build the index from stored plant and NbS option names."""
+
+        return cls(
+            [
+                {"id": plant.id, "plant_species": plant.plant_species}
+                for plant in PlantRepository(session).list_plants()
+            ],
+            [
+                {"id": option.id, "solution": option.solution}
+                for option in NbsRepository(session).list_options()
+            ],
+        )
+
+    @property
+    def name_count(self) -> int:
+        """Return the number of distinct indexed names."""
+
+        return len(self._entries)
+
+    def search(
+        self,
+        query: str,
+        *,
+        kind: str | None = None,
+        limit: int = 10,
+        score_cutoff: float = NAME_SCORE_CUTOFF,
+    ) -> list[dict[str, Any]]:
+        """Return the best-scoring names for a query, highest score first.
+
+        `kind` limits matches to plants or NbS options. Scores use
+        `rapidfuzz.fuzz.WRatio` on normalized text, so partial names and small
+        typos still match.
+        """
+
+        normalized_query = normalize_name(query)
+        if not normalized_query:
+            return []
+        if kind is None:
+            choices = self._choices
+            positions = range(len(self._entries))
+        else:
+            choices = self._choices_by_kind[kind]
+            positions = self._positions[kind]
+
+        matches = process.extract(
+            normalized_query,
+            choices,
+            scorer=fuzz.WRatio,
+            processor=None,
+            limit=limit,
+            score_cutoff=score_cutoff,
+        )
+        results = [
+            {**self._entries[positions[index]], "score": round(float(score), 2)}
+            for _choice, score, index in matches
+        ]
+        results.sort(key=lambda row: (-row["score"], row["name"]))
+        return results
+
+    def _add_rows(
+        self,
+        kind: str,
+        rows: Iterable[Mapping[str, Any]],
+        name_field: str,
+    ) -> None:
+        """Append one kind of catalogue names, skipping blanks and duplicates."""
+
+        seen: set[str] = set()
+        for row in rows:
+            normalized = normalize_name(row.get(name_field))
+            if not normalized or normalized in seen:
+                continue
+            seen.add(normalized)
+            self._positions[kind].append(len(self._entries))
+            self._choices.append(normalized)
+            self._entries.append(
+                {
+                    "kind": kind,
+                    "id": row.get("id"),
+                    "name": str(row.get(name_field)).strip(),
+                }
+            )
+
+
+_name_index: NameSearchIndex | None = None
+_name_index_lock = Lock()
+
+
+def get_name_search_index(session: Session) -> NameSearchIndex:
+    """Return the process-wide name index, building it on first use."""
+
+    global _name_index
+    if _name_index is None:
+        with _name_index_lock:
+            if _name_index is None:
+                _name_index = NameSearchIndex.from_session(session)
+                record_cache_lookup("name_search_index", hit=False)
+                return _name_index
+    record_cache_lookup("name_search_index", hit=True)
+    return _name_index
+
+
+def clear_name_search_index() -> None:
+    """Drop the cached index so the next call rebuilds it after a data reload."""
+
+    global _name_index
+    with _name_index_lock:
+        _name_index = None
@@ -0,0 +1,203 @@
+"""In-memory snapshot of the NbS catalogue for repeated workflow requests.
+
+`NbsCatalogService` reads five tables for every option on every request. The
+catalogue is small and read-only, so this module loads it once with one query
+per table, builds the same raw profiles, and precomputes the text features
+and eligibility bitmasks that Step E uses. It does not rank or filter
+candidates.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import record_cache_lookup
+from app.db.arrow_catalog import ArrowCatalog, get_arrow_catalog
+from app.db.base import Base
+from app.repositories import NbsRepository
+
+if TYPE_CHECKING:
+    from app.engines.candidate_filtering import CandidateEligibilityProfile, OptionTextFeatures
+
+
+PROFILE_SECTIONS = ("removal_efficiencies", "implementation", "footprint", "criteria")
+
+
+def _to_dicts(rows: list[Base]) -> list[dict[str, Any]]:
+    """Convert ORM rows to dictionaries."""
+
+    return [
+        {column.name: getattr(row, column.name) for column in row.__table__.columns}
+        for row in rows
+        if row is not None
+    ]
+
+
+def _group_by_nbs_id(rows: Iterable[Mapping[str, Any]]) -> dict[int, list[dict[str, Any]]]:
+    """Group child-table rows by their `nbs_id` column."""
+
+    grouped: dict[int, list[dict[str, Any]]] = {}
+    for row in rows:
+        if row.get("nbs_id") is not None:
+            grouped.setdefault(int(row["nbs_id"]), []).append(dict(row))
+    return grouped
+
+
+class NbsCatalogSnapshot:
+    """Serve NbS profiles from memory with the `NbsCatalogService` interface.
+
+    Profiles have the same shape and `missing_sections` rules as
+    `NbsCatalogService.get_full_nbs_profile`. Copies are returned so later
+    workflow steps cannot change the shared snapshot.
+    """
+
+    def __init__(
+        self,
+        options: Iterable[Mapping[str, Any]],
+        sections: Mapping[str, Iterable[Mapping[str, Any]]],
+    ) -> None:
+        # Imported here so the candidate filtering engine loads with the first
+        # snapshot rather than at app start-up.
+        from app.engines.candidate_filtering import (
+            build_eligibility_profile,
+            build_option_text_features,
+        )
+
+        self._options = [dict(option) for option in options]
+        grouped = {
+            name: _group_by_nbs_id(sections.get(name, []))
+            for name in PROFILE_SECTIONS
+        }
+        self._profiles: dict[int, dict[str, Any]] = {}
+        self._text_features: dict[int, OptionTextFeatures] = {}
+        self._eligibility_profiles: list[CandidateEligibilityProfile] = []
+        for option in self._options:
+            if option.get("id") is None:
+                self._eligibility_profiles.append(build_eligibility_profile(option, {}))
+                continue
+            nbs_id = int(option["id"])
+            profile = _build_profile(
+                option,
+                {name: grouped[name].get(nbs_id, []) for name in PROFILE_SECTIONS},
+            )
+            text_features = build_option_text_features(profile)
+            self._profiles[nbs_id] = profile
+            self._text_features[nbs_id] = text_features
+            self._eligibility_profiles.append(
+                build_eligibility_profile(option, profile, text_features=text_features)
+            )
+
+    @classmethod
+    def from_session(cls, session: Session) -> "NbsCatalogSnapshot":
+        """Load every catalogue table once with one query per table."""
+
+        nbs = NbsRepository(session)
+        return cls(
+            _to_dicts(nbs.list_options()),
+            {
+                "removal_efficiencies": _to_dicts(nbs.list_removal_efficiencies()),
+                "implementation": _to_dicts(nbs.list_implementation()),
+                "footprint": _to_dicts(nbs.list_footprints()),
+                "criteria": _to_dicts(nbs.list_criteria()),
+            },
+        )
+
+    @classmethod
+    def from_arrow(cls, catalog: ArrowCatalog) -> "NbsCatalogSnapshot":
+        """Load every catalogue table from a memory-mapped Arrow catalogue."""
+
+        return cls(
+            catalog.rows("nbs_options"),
+            {
+                "removal_efficiencies": catalog.rows("removal_efficiency"),
+                "implementation": catalog.rows("nbs_implementation"),
+                "footprint": catalog.rows("nbs_footprint"),
+                "criteria": catalog.rows("nbs_criteria"),
+            },
+        )
+
+    def list_options(self) -> list[dict[str, Any]]:
+        """Return all NbS options as stored."""
+
+        return [dict(option) for option in self._options]
+
+    def get_full_nbs_profile(self, nbs_id: int) -> dict[str, Any]:
+        """Return a copy of one raw NbS profile."""
+
+        profile = self._profiles.get(nbs_id)
+        if profile is None:
+            return _build_profile(None, {name: [] for name in PROFILE_SECTIONS})
+        return {
+            "option": dict(profile["option"]),
+            **{name: [dict(row) for row in profile[name]] for name in PROFILE_SECTIONS},
+            "missing_sections": list(profile["missing_sections"]),
+        }
+
+    def get_option_text_features(self, nbs_id: int) -> OptionTextFeatures | None:
+        """Return text features precomputed when the snapshot loaded."""
+
+        return self._text_features.get(nbs_id)
+
+    def get_eligibility_profiles(self) -> list[CandidateEligibilityProfile]:
+        """Return Step E eligibility bitmasks in `list_options` order."""
+
+        return list(self._eligibility_profiles)
+
+
+def _build_profile(
+    option: dict[str, Any] | None,
+    sections: Mapping[str, list[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Build one profile with the same missing-section rules as the service."""
+
+    missing_sections = []
+    if option is None:
+        missing_sections.append("option")
+    if not sections["removal_efficiencies"]:
+        missing_sections.append("removal_efficiency")
+    for name in ("implementation", "footprint", "criteria"):
+        if not sections[name]:
+            missing_sections.append(name)
+    return {
+        "option": option,
+        **{name: list(sections[name]) for name in PROFILE_SECTIONS},
+        "missing_sections": missing_sections,
+    }
+
+
+_snapshot: NbsCatalogSnapshot | None = None
+_snapshot_lock = Lock()
+
+
+def get_nbs_catalog_snapshot(session: Session) -> NbsCatalogSnapshot:
+    """Return the process-wide catalogue snapshot, loading it on first use.
+
+    The Arrow catalogue is used when `ARROW_CATALOG_DIR` is set.
+    """
+
+    global _snapshot
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                catalog = get_arrow_catalog()
+                _snapshot = (
+                    NbsCatalogSnapshot.from_arrow(catalog)
+                    if catalog is not None
+                    else NbsCatalogSnapshot.from_session(session)
+                )
+                record_cache_lookup("nbs_catalog_snapshot", hit=False)
+                return _snapshot
+    record_cache_lookup("nbs_catalog_snapshot", hit=True)
+    return _snapshot
+
+
+def clear_nbs_catalog_snapshot() -> None:
+    """Drop the cached snapshot so the next call reloads the catalogue."""
+
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
@@ -4,6 +4,7 @@ This service returns stored plant rows and plant-to-NbS mappings. It does not
 assign final plant recommendations.
 """
 
+from collections.abc import Iterable
 from typing import Any
 
 from sqlalchemy.orm import Session
@@ -60,3 +61,24 @@ class PlantCatalogService:
                 include_invasive=include_invasive,
             )
         )
+
+    def get_plants_for_nbs_ids(
+        self,
+        nbs_ids: Iterable[int],
+        *,
+        include_invasive: bool = False,
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Return plants mapped to several NbS options, keyed by NbS ID.
+
+        This uses one repository query for all IDs, so Step K cost does not
+        grow with the number of ranked candidates.
+        """
+
+        plants_by_nbs_id = self.plants.get_plants_for_nbs_ids(
+            nbs_ids,
+            include_invasive=include_invasive,
+        )
+        return {
+            nbs_id: _to_dicts(plants)
+            for nbs_id, plants in plants_by_nbs_id.items()
+        }
@@ -0,0 +1,276 @@
+"""In-memory inverted index for searching the plant catalogue.
+
+`GET /plants` returns the whole `plants` table and leaves filtering to the
+client. This module loads the table once and maps each text token to the
+sorted IDs of the plants that mention it, so searches and facet counts are
+answered from memory. It does not select or rank plants for recommendations.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from threading import Lock
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import record_cache_lookup
+from app.db.base import Base
+from app.repositories import PlantRepository
+
+
+PLANT_SEARCH_FACETS = (
+    "native_status",
+    "plant_type",
+    "pollution_tolerance",
+    "metals_pollutants",
+    "water_needs",
+)
+
+PLANT_TEXT_FIELDS = (
+    "plant_species",
+    "locational_availability",
+    "climate_preference",
+    "soil_type",
+    "water_needs",
+    "ecological_role",
+    "plant_type",
+    "native_status",
+    "metals_pollutants",
+    "evidence_note",
+    "pollution_tolerance",
+    "optimal_water_type",
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _to_dicts(rows: list[Base]) -> list[dict[str, Any]]:
+    """Convert ORM rows to dictionaries."""
+
+    return [
+        {column.name: getattr(row, column.name) for column in row.__table__.columns}
+        for row in rows
+        if row is not None
+    ]
+
+
+def tokenize(value: Any) -> list[str]:
+    """Split stored text into lowercase alphanumeric tokens."""
+
+    if value is None:
+        return []
+    return _TOKEN_PATTERN.findall(str(value).lower())
+
+
+def _facet_value(value: Any) -> str | None:
+    """Return the display value used for facet counts."""
+
+    if value is None:
+        return None
+    text = " ".join(str(value).split())
+    return text or None
+
+
+def _facet_key(value: Any) -> str | None:
+    """Return the case-insensitive key a facet value is matched on."""
+
+    text = _facet_value(value)
+    return text.casefold() if text is not None else None
+
+
+class PlantSearchIndex:
+    """Answer plant searches from token postings built once per catalogue.
+
+    Free-text tokens are combined with AND. Values given for one facet are
+    combined with OR, and different facets are combined with AND. A facet
+    value matches a plant when it equals that field's whole value, ignoring
+    case and repeated whitespace, so filters agree with the facet counts.
+    """
+
+    def __init__(self, plants: Iterable[Mapping[str, Any]]) -> None:
+        self._plants: dict[int, dict[str, Any]] = {}
+        for plant in plants:
+            if plant.get("id") is not None:
+                self._plants.setdefault(int(plant["id"]), dict(plant))
+        self._order = {
+            plant_id: position
+            for position, plant_id in enumerate(
+                sorted(
+                    self._plants,
+                    key=lambda plant_id: (
+                        str(self._plants[plant_id].get("plant_species") or ""),
+                        plant_id,
+                    ),
+                )
+            )
+        }
+
+        text_postings: dict[str, set[int]] = {}
+        value_postings: dict[str, dict[str, set[int]]] = {
+            facet: {} for facet in PLANT_SEARCH_FACETS
+        }
+        # Facet keys per plant, and the first spelling seen for each key.
+        self._facet_values: dict[str, dict[int, str]] = {
+            facet: {} for facet in PLANT_SEARCH_FACETS
+        }
+        self._facet_labels: dict[str, dict[str, str]] = {
+            facet: {} for facet in PLANT_SEARCH_FACETS
+        }
+        for plant_id, plant in self._plants.items():
+            for field in PLANT_TEXT_FIELDS:
+                for token in tokenize(plant.get(field)):
+                    text_postings.setdefault(token, set()).add(plant_id)
+            for facet in PLANT_SEARCH_FACETS:
+                value = _facet_value(plant.get(facet))
+                if value is not None:
+                    key = value.casefold()
+                    self._facet_values[facet][plant_id] = key
+                    self._facet_labels[facet].setdefault(key, value)
+                    value_postings[facet].setdefault(key, set()).add(plant_id)
+
+        self._text_postings = _sorted_postings(text_postings)
+        self._value_postings = {
+            facet: _sorted_postings(postings)
+            for facet, postings in value_postings.items()
+        }
+
+    @classmethod
+    def from_session(cls, session: Session) -> "PlantSearchIndex":
+        """Build the index from every stored `plants` row."""
+
+        return cls(_to_dicts(PlantRepository(session).list_plants()))
+
+    @property
+    def plant_count(self) -> int:
+        """Return the number of indexed plants."""
+
+        return len(self._plants)
+
+    def postings(self, token: str) -> tuple[int, ...]:
+        """Return sorted plant IDs for one free-text token."""
+
+        return self._text_postings.get(token, ())
+
+    def facet_postings(self, facet: str, value: str) -> tuple[int, ...]:
+        """Return sorted plant IDs whose facet field equals `value`."""
+
+        key = _facet_key(value)
+        return self._value_postings[facet].get(key, ()) if key is not None else ()
+
+    def search(
+        self,
+        q: str | None = None,
+        filters: Mapping[str, Iterable[str]] | None = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Return one page of matching plants plus facet counts.
+
+        Facet counts for one facet apply the free-text query and every other
+        facet filter, but not the facet's own values, so clients can show how
+        many plants each alternative value would add. Values that differ only
+        in case share one count, labelled with the first spelling indexed.
+        """
+
+        text_ids = self._text_matches(q)
+        facet_ids = {
+            facet: self._facet_matches(facet, values)
+            for facet, values in (filters or {}).items()
+            if facet in PLANT_SEARCH_FACETS
+        }
+        matched = _intersect(self._plants, text_ids, *facet_ids.values())
+        ordered = sorted(matched, key=self._order.__getitem__)
+
+        facets: dict[str, dict[str, int]] = {}
+        for facet in PLANT_SEARCH_FACETS:
+            other_filters = [ids for name, ids in facet_ids.items() if name != facet]
+            counts: dict[str, int] = {}
+            for plant_id in _intersect(self._plants, text_ids, *other_filters):
+                key = self._facet_values[facet].get(plant_id)
+                if key is not None:
+                    counts[key] = counts.get(key, 0) + 1
+            labels = self._facet_labels[facet]
+            facets[facet] = dict(sorted(
+                (labels[key], count) for key, count in counts.items()
+            ))
+
+        return {
+            "total": len(ordered),
+            "limit": limit,
+            "offset": offset,
+            "results": [
+                dict(self._plants[plant_id])
+                for plant_id in ordered[offset:offset + limit]
+            ],
+            "facets": facets,
+        }
+
+    def _text_matches(self, q: str | None) -> set[int] | None:
+        """Return IDs matching every free-text token, or None for no query."""
+
+        tokens = tokenize(q)
+        if not tokens:
+            return None
+        return _intersect(self._plants, *(set(self.postings(token)) for token in tokens))
+
+    def _facet_matches(self, facet: str, values: Iterable[str]) -> set[int] | None:
+        """Return IDs matching any requested value of one facet."""
+
+        matched: set[int] = set()
+        has_value = False
+        for value in values:
+            if _facet_key(value) is None:
+                continue
+            has_value = True
+            matched.update(self.facet_postings(facet, value))
+        return matched if has_value else None
+
+
+def _sorted_postings(postings: Mapping[str, set[int]]) -> dict[str, tuple[int, ...]]:
+    """Freeze postings into sorted ID tuples."""
+
+    return {token: tuple(sorted(ids)) for token, ids in postings.items()}
+
+
+def _intersect(all_ids: Iterable[int], *id_sets: set[int] | None) -> set[int]:
+    """Intersect ID sets smallest first, treating None as "no filter"."""
+
+    active = sorted(
+        (ids for ids in id_sets if ids is not None),
+        key=len,
+    )
+    if not active:
+        return set(all_ids)
+    result = set(active[0])
+    for ids in active[1:]:
+        result &= ids
+    return result
+
+
+_search_index: PlantSearchIndex | None = None
+_search_index_lock = Lock()
+
+
+def get_plant_search_index(session: Session) -> PlantSearchIndex:
+    """Return the process-wide plant search index, building it on first use."""
+
+    global _search_index
+    if _search_index is None:
+        with _search_index_lock:
+            if _search_index is None:
+                _search_index = PlantSearchIndex.from_session(session)
+                record_cache_lookup("plant_search_index", hit=False)
+                return _search_index
+    record_cache_lookup("plant_search_index", hit=True)
+    return _search_index
+
+
+def clear_plant_search_index() -> None:
+    """Drop the cached index so the next call rebuilds it after a data reload."""
+
+    global _search_index
+    with _search_index_lock:
+        _search_index = None
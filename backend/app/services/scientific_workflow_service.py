@@ -10,39 +10,37 @@ Step L only assembles internal recommendation-shaped objects.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Mapping
-
-from app.engines import (
-    CandidateFilterBundle,
-    CandidateFilteringEngine,
-    ConfidenceScoringBundle,
-    ConfidenceScoringEngine,
-    InputContext,
-    InputNormalizationEngine,
-    McdaMatrixBuilder,
-    McdaMatrixBundle,
-    McdaNormalizationEngine,
-    McdaNumericProjectionEngine,
-    McdaWeightsBundle,
-    McdaWeightsHandler,
-    NormalizedMcdaMatrixBundle,
-    PlantMatchingBundle,
-    PlantMatchingEngine,
-    PollutantGapBundle,
-    PollutantGapEngine,
-    RecommendationAssemblyBundle,
-    RecommendationAssemblyEngine,
-    TreatmentNeedBundle,
-    TreatmentNeedClassifier,
-    TopsisRankingBundle,
-    TopsisRankingEngine,
-    WaterInputAssemblyEngine,
-    WaterInputBundle,
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+from app.core.logging import add_request_context
+from app.core.metrics import record_workflow_run
+from app.services.workflow_timing import (
+    NULL_WORKFLOW_TIMER,
+    NullWorkflowTimer,
+    WorkflowTimer,
 )
-from app.engines.candidate_filtering import NbsCandidateProvider
-from app.engines.plant_matching import PlantMappingProvider
-from app.engines.pollutant_gap import StandardsProvider
-from app.engines.water_input_assembly import WaterObservationProvider
+
+if TYPE_CHECKING:
+    from app.engines import (
+        CandidateFilterBundle,
+        ConfidenceScoringBundle,
+        InputContext,
+        InputNormalizationEngine,
+        McdaMatrixBundle,
+        McdaWeightsBundle,
+        NormalizedMcdaMatrixBundle,
+        PlantMatchingBundle,
+        PollutantGapBundle,
+        RecommendationAssemblyBundle,
+        TreatmentNeedBundle,
+        TreatmentNeedClassifier,
+        TopsisRankingBundle,
+        WaterInputBundle,
+    )
+    from app.engines.candidate_filtering import NbsCandidateProvider
+    from app.engines.plant_matching import PlantMappingProvider
+    from app.engines.pollutant_gap import StandardsProvider
+    from app.engines.water_input_assembly import WaterObservationProvider
 
 
 WORKFLOW_COMPLETED = "completed"
@@ -66,7 +64,7 @@ VALID_WORKFLOW_STEPS = {
 }
 DEFAULT_WORKFLOW_END_STEP = "E"
 
-MatrixTransform = Callable[[McdaMatrixBundle], McdaMatrixBundle]
+MatrixTransform = Callable[["McdaMatrixBundle"], "McdaMatrixBundle"]
 
 
 def _to_plain_value(value: Any) -> Any:
@@ -113,6 +111,7 @@ class ScientificWorkflowResult:
     recommendation_assembly_bundle: RecommendationAssemblyBundle | None = None
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    timings: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Return a JSON-friendly view of the staged workflow output."""
@@ -136,6 +135,7 @@ class ScientificWorkflowResult:
             ),
             "errors": list(self.errors),
             "warnings": list(self.warnings),
+            "timings": self.timings,
         }
 
 
@@ -160,22 +160,48 @@ class ScientificWorkflowService:
         self.standards_service = standards_service
         self.nbs_provider = nbs_provider
         self.plant_provider = plant_provider
+        # Engines are imported on first use to keep them out of app start-up.
+        from app.engines import InputNormalizationEngine, TreatmentNeedClassifier
+
         self.input_engine = input_engine or InputNormalizationEngine()
         self.treatment_classifier = treatment_classifier or TreatmentNeedClassifier()
 
     @classmethod
-    def from_session(cls, session: Any) -> "ScientificWorkflowService":
-        """Build the workflow with existing read-only services for one session."""
+    def from_session(
+        cls,
+        session: Any,
+        *,
+        use_water_summary: bool = False,
+        use_catalog_snapshot: bool = False,
+    ) -> "ScientificWorkflowService":
+        """Build the workflow with existing read-only services for one session.
+
+        `use_water_summary=True` makes Step B read the pre-aggregated
+        station/parameter summary index instead of every raw observation row.
+        `use_catalog_snapshot=True` serves NbS profiles from the in-memory
+        catalogue snapshot instead of querying them per option.
+        """
 
         from app.services.nbs_catalog_service import NbsCatalogService
+        from app.services.nbs_catalog_snapshot import get_nbs_catalog_snapshot
         from app.services.plant_catalog_service import PlantCatalogService
         from app.services.standards_service import StandardsService
         from app.services.water_data_service import WaterDataService
+        from app.services.water_summary_service import get_water_summary_index
 
+        water_service: WaterObservationProvider = (
+            get_water_summary_index(session)
+            if use_water_summary
+            else WaterDataService(session)
+        )
         return cls(
-            water_service=WaterDataService(session),
+            water_service=water_service,
             standards_service=StandardsService(session),
-            nbs_provider=NbsCatalogService(session),
+            nbs_provider=(
+                get_nbs_catalog_snapshot(session)
+                if use_catalog_snapshot
+                else NbsCatalogService(session)
+            ),
             plant_provider=PlantCatalogService(session),
         )
 
@@ -188,6 +214,7 @@ class ScientificWorkflowService:
         weights_source: str | None = None,
         expert_validated: bool = False,
         matrix_transform: MatrixTransform | None = None,
+        record_timings: bool = False,
         **fields: Any,
     ) -> ScientificWorkflowResult:
         """Run staged workflow bundles through the requested step.
@@ -198,8 +225,60 @@ class ScientificWorkflowService:
         `max_step="L"` to assemble internal recommendation-shaped objects
         after A-K. Supplied weights remain transparent; temporary weights are
         never treated as expert validated unless the explicit flag is true.
+        `record_timings=True` adds wall time, CPU time and SQL statement count
+        per step to `result.timings`. Every run is counted by outcome in the
+        `workflow_runs_total` metric and noted on the request's log context.
         """
 
+        options = {
+            "max_step": max_step,
+            "supplied_weights": supplied_weights,
+            "weights_source": weights_source,
+            "expert_validated": expert_validated,
+            "matrix_transform": matrix_transform,
+        }
+        if not record_timings:
+            result = self._run_steps(NULL_WORKFLOW_TIMER, raw_input, fields, **options)
+        else:
+            timer = WorkflowTimer()
+            with timer:
+                result = self._run_steps(timer, raw_input, fields, **options)
+            result.timings = timer.to_dict()
+        record_workflow_run(result.workflow_status, result.step_completed)
+        add_request_context(
+            workflow_status=result.workflow_status,
+            step_completed=result.step_completed,
+        )
+        return result
+
+    def _run_steps(
+        self,
+        timer: WorkflowTimer | NullWorkflowTimer,
+        raw_input: Mapping[str, Any] | None,
+        fields: Mapping[str, Any],
+        *,
+        max_step: str,
+        supplied_weights: Mapping[str, Any] | None,
+        weights_source: str | None,
+        expert_validated: bool,
+        matrix_transform: MatrixTransform | None,
+    ) -> ScientificWorkflowResult:
+        """Run the steps, timing each one with `timer`."""
+
+        from app.engines import (
+            CandidateFilteringEngine,
+            ConfidenceScoringEngine,
+            McdaMatrixBuilder,
+            McdaNormalizationEngine,
+            McdaNumericProjectionEngine,
+            McdaWeightsHandler,
+            PlantMatchingEngine,
+            PollutantGapEngine,
+            RecommendationAssemblyEngine,
+            TopsisRankingEngine,
+            WaterInputAssemblyEngine,
+        )
+
         errors: list[str] = []
         warnings: list[str] = []
         step_completed: str | None = None
@@ -227,7 +306,8 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            input_context = self.input_engine.normalize(raw_input, **fields)
+            with timer.step("A"):
+                input_context = self.input_engine.normalize(raw_input, **fields)
             step_completed = "A"
             _extend_unique(errors, input_context.errors)
             _extend_unique(warnings, input_context.warnings)
@@ -249,7 +329,10 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            water_input_bundle = WaterInputAssemblyEngine(self.water_service).assemble(input_context)
+            with timer.step("B"):
+                water_input_bundle = WaterInputAssemblyEngine(
+                    self.water_service,
+                ).assemble(input_context)
             step_completed = "B"
             _extend_unique(warnings, water_input_bundle.warnings)
 
@@ -284,10 +367,11 @@ class ScientificWorkflowService:
                 )
 
             use_case = input_context.normalized_input.get("use_case")
-            pollutant_gap_bundle = PollutantGapEngine(self.standards_service).calculate(
-                water_input_bundle,
-                use_case=use_case,
-            )
+            with timer.step("C"):
+                pollutant_gap_bundle = PollutantGapEngine(self.standards_service).calculate(
+                    water_input_bundle,
+                    use_case=use_case,
+                )
             step_completed = "C"
             _extend_unique(warnings, pollutant_gap_bundle.warnings)
             if max_step == "C":
@@ -301,7 +385,8 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            treatment_need_bundle = self.treatment_classifier.classify(pollutant_gap_bundle)
+            with timer.step("D"):
+                treatment_need_bundle = self.treatment_classifier.classify(pollutant_gap_bundle)
             step_completed = "D"
             _extend_unique(warnings, treatment_need_bundle.warnings)
             if max_step == "D":
@@ -329,9 +414,10 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            candidate_filter_bundle = CandidateFilteringEngine(self.nbs_provider).filter_candidates(
-                treatment_need_bundle,
-            )
+            with timer.step("E"):
+                candidate_filter_bundle = CandidateFilteringEngine(
+                    self.nbs_provider,
+                ).filter_candidates(treatment_need_bundle)
             step_completed = "E"
             _extend_unique(warnings, candidate_filter_bundle.warnings)
 
@@ -348,14 +434,15 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            mcda_matrix_bundle = McdaMatrixBuilder(self.nbs_provider).build(
-                candidate_filter_bundle,
-            )
-            if matrix_transform is not None:
-                mcda_matrix_bundle = matrix_transform(mcda_matrix_bundle)
-            mcda_matrix_bundle = McdaNumericProjectionEngine().project(
-                mcda_matrix_bundle,
-            )
+            with timer.step("F"):
+                mcda_matrix_bundle = McdaMatrixBuilder(self.nbs_provider).build(
+                    candidate_filter_bundle,
+                )
+                if matrix_transform is not None:
+                    mcda_matrix_bundle = matrix_transform(mcda_matrix_bundle)
+                mcda_matrix_bundle = McdaNumericProjectionEngine().project(
+                    mcda_matrix_bundle,
+                )
             step_completed = "F"
             _extend_unique(warnings, mcda_matrix_bundle.warnings)
             if max_step == "F":
@@ -372,9 +459,10 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            normalized_mcda_matrix_bundle = McdaNormalizationEngine().normalize(
-                mcda_matrix_bundle,
-            )
+            with timer.step("G"):
+                normalized_mcda_matrix_bundle = McdaNormalizationEngine().normalize(
+                    mcda_matrix_bundle,
+                )
             step_completed = "G"
             _extend_unique(warnings, normalized_mcda_matrix_bundle.warnings)
             if max_step == "G":
@@ -392,12 +480,13 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            mcda_weights_bundle = McdaWeightsHandler().prepare_from_normalized_bundle(
-                normalized_mcda_matrix_bundle,
-                supplied_weights=supplied_weights,
-                weights_source=weights_source,
-                expert_validated=expert_validated,
-            )
+            with timer.step("H"):
+                mcda_weights_bundle = McdaWeightsHandler().prepare_from_normalized_bundle(
+                    normalized_mcda_matrix_bundle,
+                    supplied_weights=supplied_weights,
+                    weights_source=weights_source,
+                    expert_validated=expert_validated,
+                )
             step_completed = "H"
             _extend_unique(warnings, mcda_weights_bundle.warnings)
             if max_step == "H":
@@ -416,10 +505,11 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            topsis_ranking_bundle = TopsisRankingEngine().rank(
-                normalized_mcda_matrix_bundle,
-                mcda_weights_bundle,
-            )
+            with timer.step("I"):
+                topsis_ranking_bundle = TopsisRankingEngine().rank(
+                    normalized_mcda_matrix_bundle,
+                    mcda_weights_bundle,
+                )
             step_completed = "I"
             _extend_unique(warnings, topsis_ranking_bundle.warnings)
             if max_step == "I":
@@ -439,13 +529,14 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            confidence_scoring_bundle = ConfidenceScoringEngine().score(
-                topsis_ranking_bundle,
-                water_bundle=water_input_bundle,
-                candidate_bundle=candidate_filter_bundle,
-                normalized_bundle=normalized_mcda_matrix_bundle,
-                weights_bundle=mcda_weights_bundle,
-            )
+            with timer.step("J"):
+                confidence_scoring_bundle = ConfidenceScoringEngine().score(
+                    topsis_ranking_bundle,
+                    water_bundle=water_input_bundle,
+                    candidate_bundle=candidate_filter_bundle,
+                    normalized_bundle=normalized_mcda_matrix_bundle,
+                    weights_bundle=mcda_weights_bundle,
+                )
             step_completed = "J"
             _extend_unique(warnings, confidence_scoring_bundle.warnings)
 
@@ -489,9 +580,10 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            plant_matching_bundle = PlantMatchingEngine(
-                self.plant_provider,
-            ).match_plants(topsis_ranking_bundle, confidence_scoring_bundle)
+            with timer.step("K"):
+                plant_matching_bundle = PlantMatchingEngine(
+                    self.plant_provider,
+                ).match_plants(topsis_ranking_bundle, confidence_scoring_bundle)
             step_completed = "K"
             _extend_unique(warnings, plant_matching_bundle.warnings)
 
@@ -514,11 +606,12 @@ class ScientificWorkflowService:
                     warnings=warnings,
                 )
 
-            recommendation_assembly_bundle = RecommendationAssemblyEngine().assemble(
-                topsis_ranking_bundle,
-                confidence_scoring_bundle,
-                plant_matching_bundle,
-            )
+            with timer.step("L"):
+                recommendation_assembly_bundle = RecommendationAssemblyEngine().assemble(
+                    topsis_ranking_bundle,
+                    confidence_scoring_bundle,
+                    plant_matching_bundle,
+                )
             step_completed = "L"
             _extend_unique(warnings, recommendation_assembly_bundle.warnings)
 
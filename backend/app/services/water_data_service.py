@@ -4,11 +4,13 @@ This service fetches and groups observation records. It does not compare values
 against standards and does not calculate pollutant exceedance.
 """
 
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 from sqlalchemy.orm import Session
 
 from app.db.base import Base
+from app.engines.input_normalization import normalize_match_key
 from app.repositories import WaterRepository
 
 
@@ -20,12 +22,45 @@ def _to_dict(row: Base | None) -> dict[str, Any] | None:
     return {column.name: getattr(row, column.name) for column in row.__table__.columns}
 
 
-def _to_dicts(rows: list[Base]) -> list[dict[str, Any]]:
-    """Convert ORM rows to dictionaries."""
+def observation_dicts(rows: list[Base]) -> list[dict[str, Any]]:
+    """Convert observation ORM rows to dictionaries."""
 
     return [_to_dict(row) for row in rows if row is not None]
 
 
+def parameter_match_keys(parameters: list[str]) -> dict[str, str]:
+    """Map each parameter matching key to the first requested name with it."""
+
+    parameter_by_key: dict[str, str] = {}
+    for parameter in parameters:
+        key = normalize_match_key(parameter)
+        if key and key not in parameter_by_key:
+            parameter_by_key[key] = parameter
+    return parameter_by_key
+
+
+def group_observations_by_parameter(
+    rows: Iterable[Mapping[str, Any]],
+    parameters: list[str],
+) -> dict[str, list[dict[str, Any]]]:
+    """Group observation rows under the requested parameter names.
+
+    Rows are matched by the same key Step B uses, so " BOD " and "bod" select
+    the same rows. When two requested names share a key, the rows are listed
+    under the first one only so they are not duplicated.
+    """
+
+    grouped: dict[str, list[dict[str, Any]]] = {
+        parameter: [] for parameter in parameters
+    }
+    parameter_by_key = parameter_match_keys(parameters)
+    for row in rows:
+        parameter = parameter_by_key.get(normalize_match_key(row.get("parameter")) or "")
+        if parameter is not None:
+            grouped[parameter].append(dict(row))
+    return grouped
+
+
 class WaterDataService:
     """Prepare raw water observation packets from repository results."""
 
@@ -35,26 +70,29 @@ class WaterDataService:
     def get_observations_by_station(self, station: str) -> list[dict[str, Any]]:
         """Return raw observations for one station."""
 
-        return _to_dicts(self.water.get_observations_by_station(station))
+        return observation_dicts(self.water.get_observations_by_station(station))
 
     def get_observations_by_basin(self, basin_id: int) -> list[dict[str, Any]]:
         """Return raw observations for one basin ID."""
 
-        return _to_dicts(self.water.get_observations_by_basin(basin_id))
+        return observation_dicts(self.water.get_observations_by_basin(basin_id))
 
     def get_observations_for_parameters(
         self,
         station: str,
         parameters: list[str],
     ) -> dict[str, list[dict[str, Any]]]:
-        """Return raw station observations grouped by requested parameters."""
-
-        if not parameters:
-            return {}
-        return {
-            parameter: _to_dicts(self.water.get_parameter_values(station, parameter))
-            for parameter in parameters
-        }
+        """Return raw station observations grouped by requested parameters.
+
+        The station's rows are fetched with one query and grouped in Python
+        by `group_observations_by_parameter`, so stored names match exactly as
+        Step B matches them.
+        """
+
+        if not parameters or not parameter_match_keys(parameters):
+            return {parameter: [] for parameter in parameters}
+        rows = self.water.list_station_observations(station)
+        return group_observations_by_parameter(observation_dicts(rows), parameters)
 
     def summarize_available_parameters(self) -> list[dict[str, Any]]:
         """Return parameter names and raw row counts only."""
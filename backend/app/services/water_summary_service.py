@@ -0,0 +1,203 @@
+"""In-memory station/parameter summary index for stored water observations.
+
+Stations often have many `water_observations` rows per parameter, one per
+`period`. This module pre-aggregates them once per (station, parameter, unit)
+so Step B receives one summary row per parameter instead of the full history.
+It does not compare values against standards or calculate exceedance.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from threading import Lock
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.core.metrics import record_cache_lookup
+from app.db.arrow_catalog import ArrowCatalog, get_arrow_catalog
+from app.engines.input_normalization import normalize_match_key, normalize_text
+from app.repositories import WaterRepository
+from app.services.water_data_service import (
+    group_observations_by_parameter,
+    observation_dicts,
+)
+
+
+SummaryKey = tuple[str, str, str]
+
+
+def build_station_parameter_summaries(
+    observations: Iterable[Mapping[str, Any]],
+) -> list[dict[str, Any]]:
+    """Aggregate raw observation rows per (station, parameter, unit).
+
+    Each summary row keeps the observation field names so later steps can read
+    it like a raw row. `value_mean` is the mean of the stored means,
+    `value_min`/`value_max` are the overall extremes, `n_samples` is the total
+    sample count, and `period`/`source_id` come from the latest period.
+    """
+
+    groups: dict[SummaryKey, list[Mapping[str, Any]]] = {}
+    for observation in observations:
+        station = normalize_text(observation.get("station"))
+        parameter_key = normalize_match_key(observation.get("parameter"))
+        if station is None or parameter_key is None:
+            continue
+        unit_key = (normalize_text(observation.get("unit")) or "").lower()
+        groups.setdefault((station, parameter_key, unit_key), []).append(observation)
+    return [_summarize_group(station, rows) for (station, _p, _u), rows in groups.items()]
+
+
+def _summarize_group(station: str, rows: list[Mapping[str, Any]]) -> dict[str, Any]:
+    """Build one summary row from the raw rows of one group."""
+
+    means = _numbers(row.get("value_mean") for row in rows)
+    minimums = _numbers(row.get("value_min") for row in rows) or means
+    maximums = _numbers(row.get("value_max") for row in rows) or means
+    samples = [int(row["n_samples"]) for row in rows if row.get("n_samples") is not None]
+    latest = max(rows, key=lambda row: (str(row.get("period") or ""), row.get("id") or 0))
+    first = rows[0]
+
+    source_ids: list[int] = []
+    for row in [latest, *rows]:
+        source_id = row.get("source_id")
+        if source_id is not None and int(source_id) not in source_ids:
+            source_ids.append(int(source_id))
+
+    return {
+        "station": station,
+        "district": first.get("district"),
+        "state": first.get("state"),
+        "cwc_code": first.get("cwc_code"),
+        "parameter": normalize_text(first.get("parameter")),
+        "unit": normalize_text(first.get("unit")),
+        "value_mean": sum(means) / len(means) if means else None,
+        "value_min": min(minimums) if minimums else None,
+        "value_max": max(maximums) if maximums else None,
+        "n_samples": sum(samples) if samples else None,
+        "period": latest.get("period"),
+        "basin_id": next(
+            (row.get("basin_id") for row in rows if row.get("basin_id") is not None),
+            None,
+        ),
+        "source_id": latest.get("source_id"),
+        "source_ids": source_ids,
+        "observation_count": len(rows),
+    }
+
+
+def _numbers(values: Iterable[Any]) -> list[float]:
+    """Return numeric values, skipping missing and non-numeric entries."""
+
+    numbers = []
+    for value in values:
+        if value is None or isinstance(value, bool):
+            continue
+        try:
+            numbers.append(float(value))
+        except (TypeError, ValueError):
+            continue
+    return numbers
+
+
+class WaterSummaryIndex:
+    """Serve summary rows with the same interface as `WaterDataService`.
+
+    The index is built once from all stored observations. Lookups are plain
+    dictionary reads, so the number of rows returned depends on the number of
+    parameters at a station, not on the length of its history.
+    """
+
+    def __init__(self, summaries: Iterable[Mapping[str, Any]]) -> None:
+        self._by_station: dict[str, list[dict[str, Any]]] = {}
+        self._by_basin: dict[int, list[dict[str, Any]]] = {}
+        self.summary_count = 0
+        for summary in summaries:
+            row = dict(summary)
+            self._by_station.setdefault(row["station"], []).append(row)
+            if row.get("basin_id") is not None:
+                self._by_basin.setdefault(int(row["basin_id"]), []).append(row)
+            self.summary_count += 1
+        for rows in [*self._by_station.values(), *self._by_basin.values()]:
+            rows.sort(key=lambda row: (row["station"], row["parameter"] or ""))
+
+    @classmethod
+    def from_observations(
+        cls,
+        observations: Iterable[Mapping[str, Any]],
+    ) -> "WaterSummaryIndex":
+        """Build the index from raw observation dictionaries."""
+
+        return cls(build_station_parameter_summaries(observations))
+
+    @classmethod
+    def from_session(cls, session: Session) -> "WaterSummaryIndex":
+        """Build the index from every stored `water_observations` row."""
+
+        return cls.from_observations(
+            observation_dicts(WaterRepository(session).list_observations())
+        )
+
+    @classmethod
+    def from_arrow(cls, catalog: ArrowCatalog) -> "WaterSummaryIndex":
+        """Build the index from the memory-mapped `water_observations` table."""
+
+        return cls.from_observations(catalog.rows("water_observations"))
+
+    def get_observations_by_station(self, station: str) -> list[dict[str, Any]]:
+        """Return summary rows for one station."""
+
+        key = normalize_text(station)
+        return [dict(row) for row in self._by_station.get(key or "", [])]
+
+    def get_observations_by_basin(self, basin_id: int) -> list[dict[str, Any]]:
+        """Return summary rows for one basin ID."""
+
+        return [dict(row) for row in self._by_basin.get(basin_id, [])]
+
+    def get_observations_for_parameters(
+        self,
+        station: str,
+        parameters: list[str],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return station summary rows grouped by requested parameters."""
+
+        if not parameters:
+            return {}
+        key = normalize_text(station)
+        return group_observations_by_parameter(self._by_station.get(key or "", []), parameters)
+
+
+_summary_index: WaterSummaryIndex | None = None
+_summary_index_lock = Lock()
+
+
+def get_water_summary_index(session: Session) -> WaterSummaryIndex:
+    """Return the process-wide summary index, building it on first use.
+
+    The Arrow catalogue is used when `ARROW_CATALOG_DIR` is set.
+    """
+
+    global _summary_index
+    if _summary_index is None:
+        with _summary_index_lock:
+            if _summary_index is None:
+                catalog = get_arrow_catalog()
+                _summary_index = (
+                    WaterSummaryIndex.from_arrow(catalog)
+                    if catalog is not None
+                    else WaterSummaryIndex.from_session(session)
+                )
+                record_cache_lookup("water_summary_index", hit=False)
+                return _summary_index
+    record_cache_lookup("water_summary_index", hit=True)
+    return _summary_index
+
+
+def clear_water_summary_index() -> None:
+    """Drop the cached index so the next call rebuilds it after a data reload."""
+
+    global _summary_index
+    with _summary_index_lock:
+        _summary_index = None
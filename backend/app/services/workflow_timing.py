@@ -0,0 +1,191 @@
+"""Per-step timing for the Scientific Workflow service.
+
+`WorkflowTimer` records wall time, thread CPU time, SQL statement count and the
+largest number of same-shape SQL statements for each of Steps A-L. A step whose
+`repeated_sql` grows with the catalogue is running one query per item. When
+timings are not requested the workflow uses `NULL_WORKFLOW_TIMER`, whose steps
+are a shared no-op context manager, and no clock or SQL listener is touched.
+Helpers here format recorded timings as a `Server-Timing` header and write
+sampled structured log lines. Timings describe how long the workflow took; they
+never change scientific outputs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any
+
+from app.db.statement_counter import StatementCounter, count_statements
+
+logger = logging.getLogger("app.workflow.timing")
+
+_NO_TIMING = nullcontext()
+
+
+@dataclass(slots=True)
+class StepTiming:
+    """Measured cost of one workflow step.
+
+    `peak_kib` is set only when `tracemalloc` was tracing during the step.
+    """
+
+    step: str
+    wall_ms: float
+    cpu_ms: float
+    sql_statements: int
+    repeated_sql: int = 0
+    peak_kib: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly view of the step timing."""
+
+        timing = {
+            "step": self.step,
+            "wall_ms": round(self.wall_ms, 3),
+            "cpu_ms": round(self.cpu_ms, 3),
+            "sql_statements": self.sql_statements,
+            "repeated_sql": self.repeated_sql,
+        }
+        if self.peak_kib is not None:
+            timing["peak_kib"] = round(self.peak_kib, 1)
+        return timing
+
+
+class WorkflowTimer:
+    """Collect step timings for one workflow run.
+
+    Use the timer as a context manager around the whole run so SQL statements
+    are counted, and `step()` around each step inside it.
+    """
+
+    def __init__(self) -> None:
+        self.steps: list[StepTiming] = []
+        self.total: StepTiming | None = None
+        self._counter: StatementCounter | None = None
+        self._counting: AbstractContextManager[StatementCounter] | None = None
+        self._started_wall = 0.0
+        self._started_cpu = 0.0
+
+    def __enter__(self) -> "WorkflowTimer":
+        self._counting = count_statements(fingerprint=True)
+        self._counter = self._counting.__enter__()
+        self._started_wall = time.perf_counter()
+        self._started_cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        assert self._counting is not None and self._counter is not None
+        self.total = StepTiming(
+            step="total",
+            wall_ms=(time.perf_counter() - self._started_wall) * 1000.0,
+            cpu_ms=(time.thread_time() - self._started_cpu) * 1000.0,
+            sql_statements=self._counter.count,
+            repeated_sql=self._counter.max_repeated(),
+        )
+        self._counting.__exit__(*exc_info)
+        self._counting = None
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time the block as workflow step `name`.
+
+        When `tracemalloc` is tracing, the step's peak allocation above the
+        memory in use when it started is recorded too.
+        """
+
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+        started_wall = time.perf_counter()
+        started_cpu = time.thread_time()
+        with count_statements(fingerprint=True) as counter:
+            try:
+                yield
+            finally:
+                wall_ms = (time.perf_counter() - started_wall) * 1000.0
+                cpu_ms = (time.thread_time() - started_cpu) * 1000.0
+                peak_kib = None
+                if tracing:
+                    _, peak = tracemalloc.get_traced_memory()
+                    peak_kib = max(0, peak - baseline) / 1024.0
+                self.steps.append(
+                    StepTiming(
+                        step=name,
+                        wall_ms=wall_ms,
+                        cpu_ms=cpu_ms,
+                        sql_statements=counter.count,
+                        repeated_sql=counter.max_repeated(),
+                        peak_kib=peak_kib,
+                    )
+                )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the `timings` block stored on the workflow result."""
+
+        return {
+            "steps": [timing.to_dict() for timing in self.steps],
+            "total": self.total.to_dict() if self.total is not None else None,
+        }
+
+
+class NullWorkflowTimer:
+    """Timer stand-in used when timings are not requested."""
+
+    __slots__ = ()
+
+    def step(self, name: str) -> AbstractContextManager[None]:
+        """Return a shared no-op context manager."""
+
+        return _NO_TIMING
+
+
+NULL_WORKFLOW_TIMER = NullWorkflowTimer()
+
+
+def server_timing_header(timings: dict[str, Any] | None) -> str | None:
+    """Format a `timings` block as a `Server-Timing` header value.
+
+    Each step becomes `<step>;dur=<wall ms>;desc="cpu=<ms>ms sql=<count>"` and
+    the run total is reported as `total`.
+    """
+
+    if not timings:
+        return None
+    entries = list(timings.get("steps") or [])
+    if timings.get("total"):
+        entries.append(timings["total"])
+    metrics = [
+        f'{entry["step"]};dur={entry["wall_ms"]:.3f};'
+        f'desc="cpu={entry["cpu_ms"]:.3f}ms sql={entry["sql_statements"]}"'
+        for entry in entries
+    ]
+    return ", ".join(metrics) or None
+
+
+def log_workflow_timings(
+    timings: dict[str, Any] | None,
+    *,
+    sample_rate: float,
+    **context: Any,
+) -> bool:
+    """Log a `timings` block as one JSON line for a `sample_rate` share of calls.
+
+    `context` adds plain fields such as the workflow status or use case.
+    Returns True when the line was written.
+    """
+
+    if not timings or sample_rate <= 0.0:
+        return False
+    if sample_rate < 1.0 and random.random() >= sample_rate:
+        return False
+    record = {"event": "workflow_timings", **context, **timings}
+    logger.info(json.dumps(record, sort_keys=True), extra={"workflow_timings": record})
+    return True
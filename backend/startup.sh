@@ -3,33 +3,47 @@ set -e
 
 APP_ROOT=/home/site/wwwroot
 RUN_DIR=/tmp/nbsrun
+PACKAGE="$APP_ROOT/output.tar.zst"
+HASH_FILE="$RUN_DIR/.package_sha256"
 
-echo "NbS backend startup: preparing runtime directory"
-rm -rf "$RUN_DIR"
-mkdir -p "$RUN_DIR"
-
-if [ -f "$APP_ROOT/output.tar.zst" ]; then
-  echo "Found Oryx output package; extracting to $RUN_DIR"
-  tar --zstd -xf "$APP_ROOT/output.tar.zst" -C "$RUN_DIR"
+if [ -f "$PACKAGE" ]; then
+  # Reuse the runtime extracted on an earlier boot (with its compiled
+  # bytecode) while the Oryx package is unchanged.
+  PACKAGE_HASH=$(sha256sum "$PACKAGE" | cut -d ' ' -f 1)
+  if [ -f "$RUN_DIR/app/main.py" ] && [ "$(cat "$HASH_FILE" 2>/dev/null)" = "$PACKAGE_HASH" ]; then
+    echo "NbS backend startup: package unchanged; reusing $RUN_DIR"
+  else
+    echo "NbS backend startup: extracting Oryx output package to $RUN_DIR"
+    rm -rf "$RUN_DIR.new"
+    mkdir -p "$RUN_DIR.new"
+    tar --zstd -xf "$PACKAGE" -C "$RUN_DIR.new"
+    python -m compileall -q "$RUN_DIR.new/app" || true
+    # The hash is written last so a partial extraction is never reused.
+    echo "$PACKAGE_HASH" > "$RUN_DIR.new/.package_sha256"
+    rm -rf "$RUN_DIR"
+    mv "$RUN_DIR.new" "$RUN_DIR"
+  fi
   cd "$RUN_DIR"
 else
   echo "No Oryx output package found; running from $APP_ROOT"
   cd "$APP_ROOT"
 fi
 
-echo "Startup working directory:"
-pwd
-echo "Startup directory contents:"
-ls -la
+if [ ! -f app/main.py ]; then
+  echo "ERROR: app/main.py was not found in $(pwd)."
+  exit 1
+fi
 
-if [ -f app/main.py ]; then
+# Set STARTUP_DIAGNOSTICS=true to print the startup directory and main.py.
+if [ "${STARTUP_DIAGNOSTICS:-false}" = "true" ]; then
+  echo "Startup working directory:"
+  pwd
+  echo "Startup directory contents:"
+  ls -la
   echo "Detected app/main.py. First lines:"
   sed -n '1,40p' app/main.py
   echo "Route keyword check:"
   grep -En "health|api/v1|FastAPI|include_router" app/main.py || true
-else
-  echo "ERROR: app/main.py was not found in the startup directory."
-  exit 1
 fi
 
 export PYTHONPATH="$PWD:${PYTHONPATH:-}"
@@ -0,0 +1,180 @@
+r"""Checks for the memory-mapped Arrow catalogue.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\arrow_catalog_test.py
+
+These tests export fake rows from an in-memory SQLite database into Arrow
+files in a temporary folder. They do not connect to Azure, do not need
+production data, and do not add scientific values.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+try:
+    import pyarrow  # noqa: F401
+except ModuleNotFoundError as exc:
+    print(
+        "arrow catalog test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import get_settings
+from app.db.arrow_catalog import (
+    ARROW_CATALOG_TABLES,
+    ArrowCatalog,
+    clear_arrow_catalog,
+    export_arrow_catalog,
+)
+from app.db.base import Base
+from app.models import (
+    NbsImplementation,
+    NbsOption,
+    RemovalEfficiency,
+    Source,
+    WaterObservation,
+)
+from app.services import (
+    NbsCatalogSnapshot,
+    WaterSummaryIndex,
+    clear_nbs_catalog_snapshot,
+    clear_water_summary_index,
+    get_nbs_catalog_snapshot,
+    get_water_summary_index,
+)
+
+
+def source_engine() -> Engine:
+    """Create an in-memory source database with a few fake rows."""
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Source(id=1, short="fake source"))
+        session.add_all([
+            NbsOption(id=10, solution="Fake Wetland", description="fake", source_id=1),
+            NbsOption(id=11, solution="Fake Swale", location_suitability=0.5),
+        ])
+        session.add_all([
+            RemovalEfficiency(id=1, nbs_id=10, parameter="BOD", eff_low=20.0, eff_high=40.0),
+            RemovalEfficiency(id=2, nbs_id=10, parameter="TN", eff_low=None, eff_high=30.0),
+            RemovalEfficiency(id=3, nbs_id=11, parameter="BOD", eff_low=10.0, eff_high=None),
+        ])
+        session.add(NbsImplementation(id=1, nbs_id=10))
+        session.add_all([
+            WaterObservation(
+                id=i,
+                station="Station A",
+                parameter="BOD" if i % 2 else "TN",
+                unit="mg/L",
+                value_mean=float(i),
+                period=f"20{i:02d}",
+                basin_id=None,
+            )
+            for i in range(1, 7)
+        ])
+        session.commit()
+    return engine
+
+
+def assert_export_round_trips_rows(folder: Path, engine: Engine) -> ArrowCatalog:
+    """Exported rows read back with the same values and Python types."""
+
+    counts = export_arrow_catalog(engine, folder)
+    assert counts["water_observations"] == 6
+    assert counts["removal_efficiency"] == 3
+    assert set(counts) == set(ARROW_CATALOG_TABLES)
+    assert not list(folder.glob("*.partial"))
+
+    catalog = ArrowCatalog(folder)
+    options = catalog.rows("nbs_options")
+    assert [row["solution"] for row in options] == ["Fake Wetland", "Fake Swale"]
+    assert options[0]["source_id"] == 1 and options[1]["source_id"] is None
+    assert options[1]["location_suitability"] == 0.5
+    return catalog
+
+
+def assert_services_match_database(catalog: ArrowCatalog, engine: Engine) -> None:
+    """Snapshots built from Arrow match snapshots built from the database."""
+
+    with Session(engine) as session:
+        from_db = NbsCatalogSnapshot.from_session(session)
+        index_from_db = WaterSummaryIndex.from_session(session)
+    from_arrow = NbsCatalogSnapshot.from_arrow(catalog)
+    index_from_arrow = WaterSummaryIndex.from_arrow(catalog)
+
+    assert from_arrow.list_options() == from_db.list_options()
+    for nbs_id in (10, 11, 99):
+        assert from_arrow.get_full_nbs_profile(nbs_id) == from_db.get_full_nbs_profile(nbs_id)
+    assert (
+        index_from_arrow.get_observations_by_station("Station A")
+        == index_from_db.get_observations_by_station("Station A")
+    )
+
+
+def assert_setting_switches_cached_services(folder: Path) -> None:
+    """ARROW_CATALOG_DIR makes the cached services load without a session."""
+
+    previous = os.environ.get("ARROW_CATALOG_DIR")
+    os.environ["ARROW_CATALOG_DIR"] = str(folder)
+    get_settings.cache_clear()
+    clear_arrow_catalog()
+    clear_nbs_catalog_snapshot()
+    clear_water_summary_index()
+    try:
+        snapshot = get_nbs_catalog_snapshot(None)  # type: ignore[arg-type]
+        index = get_water_summary_index(None)  # type: ignore[arg-type]
+        assert len(snapshot.list_options()) == 2
+        assert index.summary_count == 2
+    finally:
+        if previous is None:
+            os.environ.pop("ARROW_CATALOG_DIR", None)
+        else:
+            os.environ["ARROW_CATALOG_DIR"] = previous
+        get_settings.cache_clear()
+        clear_arrow_catalog()
+        clear_nbs_catalog_snapshot()
+        clear_water_summary_index()
+
+
+def assert_missing_files_are_reported(folder: Path) -> None:
+    """An incomplete catalogue folder raises RuntimeError naming the tables."""
+
+    try:
+        ArrowCatalog(folder)
+    except RuntimeError as exc:
+        assert "nbs_options" in str(exc)
+    else:
+        raise AssertionError("empty catalogue folder did not raise")
+
+
+def main() -> None:
+    """Run all Arrow catalogue checks."""
+
+    engine = source_engine()
+    # Windows cannot delete a file while it is memory-mapped.
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as folder:
+        catalog = assert_export_round_trips_rows(Path(folder) / "catalog", engine)
+        assert_services_match_database(catalog, engine)
+        assert_setting_switches_cached_services(Path(folder) / "catalog")
+        assert_missing_files_are_reported(Path(folder))
+    print("arrow catalog checks ok: catalogue tables served from memory-mapped files")
+
+
+if __name__ == "__main__":
+    main()
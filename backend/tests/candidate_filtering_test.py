@@ -13,6 +13,8 @@ from typing import Any
 
 from app.engines import (
     CandidateFilteringEngine,
+    build_eligibility_profile,
+    need_group_mask,
     TreatmentNeedBundle,
     TreatmentNeedResult,
 )
@@ -285,6 +287,69 @@ def assert_drinking_domestic_caution_flag() -> None:
     assert any("Drinking/domestic target use case" in flag for flag in result.caution_flags)
 
 
+class PrecomputedMaskProvider(FakeNbsCatalogService):
+    """Provider that serves eligibility bitmasks built once, like a snapshot."""
+
+    def __init__(self, profiles: dict[int, dict[str, Any]]) -> None:
+        super().__init__(profiles)
+        self.profile_calls = 0
+        self.eligibility_profiles = [
+            build_eligibility_profile(option, self.profiles[option["id"]])
+            for option in self.list_options()
+        ]
+
+    def get_full_nbs_profile(self, nbs_id: int) -> dict[str, Any]:
+        """Count profile fetches so tests can prove the mask path skips them."""
+
+        self.profile_calls += 1
+        return super().get_full_nbs_profile(nbs_id)
+
+    def get_eligibility_profiles(self):
+        """Return the eligibility profiles built at construction time."""
+
+        return list(self.eligibility_profiles)
+
+
+def assert_bitmask_path_matches_profile_path() -> None:
+    """Precomputed bitmasks must give the same bundle as per-request profiles."""
+
+    profiles = {
+        1: profile(
+            nbs_id=1,
+            solution="Wetland",
+            removal_rows=[
+                {"parameter": "BOD", "eff_low": 50, "source_id": 31},
+                {"parameter": "nitrate", "source_id": 32},
+            ],
+        ),
+        2: profile(
+            nbs_id=2,
+            solution="Catalogue-only pond",
+            option_extra={
+                "supported_treatment_needs": ["pathogens", "solids"],
+                "description": "Open pond",
+            },
+        ),
+        3: profile(
+            nbs_id=3,
+            solution="Metal unit",
+            removal_rows=[{"parameter": "lead", "eff_high": 40, "source_id": 33}],
+            implementation_rows=[],
+        ),
+    }
+    plain = FakeNbsCatalogService(profiles)
+    masked = PrecomputedMaskProvider(profiles)
+
+    for groups in (["organic_load"], ["pathogens", "metals"], ["nutrients", "solids"], []):
+        bundle = treatment_bundle(groups)
+        expected = CandidateFilteringEngine(plain).filter_candidates(bundle)
+        actual = CandidateFilteringEngine(masked).filter_candidates(bundle)
+        assert actual.to_dict() == expected.to_dict()
+
+    assert masked.profile_calls == 0
+    assert need_group_mask(["organic_load", "not_a_group"]) == need_group_mask(["organic_load"])
+
+
 def assert_no_future_fields() -> None:
     """Step E output must not include recommendation/ranking/scoring fields."""
 
@@ -343,6 +408,7 @@ def main() -> None:
     assert_pathogen_caution_flag()
     assert_metal_food_chain_caution_flag()
     assert_drinking_domestic_caution_flag()
+    assert_bitmask_path_matches_profile_path()
     assert_no_future_fields()
     print("candidate filtering checks ok: Step E only")
 
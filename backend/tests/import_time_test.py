@@ -0,0 +1,135 @@
+r"""Import-time budget for application start-up.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\import_time_test.py
+
+Each check imports `app.main` in a fresh Python process with
+`python -X importtime`, the same work uvicorn does before it can answer the
+first request on a cold start. The test fails when start-up imports take
+longer than the budgets below, when modules that should load on first use
+(the scientific engines, pandas) are imported at start-up, or when the engine
+response schemas are built at start-up. `app.schemas.engine` itself is still
+imported by the route schemas; only its pydantic validators are deferred
+(`defer_build`). It does not connect to a database or start a server.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+# Best of RUNS fresh imports, in milliseconds. Under `-X importtime`,
+# `app.main` took about 1000 ms (about 280 ms of it in `app.*` modules) in a
+# local run after the engines became lazy. Raise a budget only for an intended
+# new start-up dependency.
+RUNS = 3
+IMPORT_BUDGET_MS = 2500
+APP_MODULES_BUDGET_MS = 700
+
+# Light engine helpers the water services use directly.
+EAGER_ENGINE_MODULES = {"app.engines.input_normalization"}
+LAZY_THIRD_PARTY = ("pandas", "numpy", "pyarrow")
+
+PROBE = """
+import sys
+import app.main
+from app.schemas.engine import RecommendationAssemblyBundleResponse
+print(",".join(sorted(name for name in sys.modules if name.startswith("app.engines."))))
+print(",".join(name for name in {lazy!r} if name in sys.modules))
+print(RecommendationAssemblyBundleResponse.__pydantic_complete__)
+""".format(lazy=LAZY_THIRD_PARTY)
+
+
+def import_app_main() -> tuple[dict[str, tuple[int, int]], list[str]]:
+    """Import `app.main` in a new process; return import times and probe output.
+
+    Times map module name to (self, cumulative) microseconds.
+    """
+
+    environment = {**os.environ, "PYTHONPATH": str(BACKEND_ROOT)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=BACKEND_ROOT,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times, completed.stdout.splitlines()
+
+
+def assert_start_up_within_budget() -> tuple[float, float]:
+    """The best of several cold imports stays within both budgets."""
+
+    totals: list[float] = []
+    app_totals: list[float] = []
+    for _ in range(RUNS):
+        times, _ = import_app_main()
+        totals.append(times["app.main"][1] / 1000)
+        app_totals.append(
+            sum(self_us for name, (self_us, _) in times.items() if name.split(".")[0] == "app")
+            / 1000
+        )
+    best, best_app = min(totals), min(app_totals)
+    assert best <= IMPORT_BUDGET_MS, (
+        f"importing app.main took {best:.0f} ms (budget {IMPORT_BUDGET_MS} ms); "
+        "run `python -X importtime -c \"import app.main\"` to find the slow import"
+    )
+    assert best_app <= APP_MODULES_BUDGET_MS, (
+        f"app.* modules took {best_app:.0f} ms to import (budget {APP_MODULES_BUDGET_MS} ms)"
+    )
+    return best, best_app
+
+
+def assert_heavy_modules_load_on_first_use() -> None:
+    """Engines and pandas are not imported, and engine schemas not built, at start-up."""
+
+    _, (engines, third_party, schema_built) = import_app_main()
+    loaded = set(filter(None, engines.split(",")))
+    assert loaded <= EAGER_ENGINE_MODULES, f"engines imported at start-up: {loaded - EAGER_ENGINE_MODULES}"
+    assert third_party == "", f"imported at start-up: {third_party}"
+    assert schema_built == "False", "engine response schemas were built at start-up"
+
+
+def assert_lazy_engine_exports_resolve() -> None:
+    """Every name in `app.engines.__all__` still imports."""
+
+    import app.engines as engines
+
+    for name in engines.__all__:
+        assert getattr(engines, name) is not None, name
+    try:
+        engines.NotAnEngine  # noqa: B018
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("unknown engine names must raise AttributeError")
+
+
+def main() -> None:
+    """Run all import-time checks."""
+
+    best, best_app = assert_start_up_within_budget()
+    assert_heavy_modules_load_on_first_use()
+    assert_lazy_engine_exports_resolve()
+    print(
+        f"import time checks ok: app.main imported in {best:.0f} ms "
+        f"({best_app:.0f} ms in app modules)"
+    )
+
+
+if __name__ == "__main__":
+    main()
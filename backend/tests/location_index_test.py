@@ -0,0 +1,134 @@
+r"""Checks for the in-memory location index and `/locations` routes.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\location_index_test.py
+
+These tests use fake station names and a FastAPI dependency override. They do
+not connect to Azure, do not need production data, and do not choose sites for
+recommendations.
+"""
+
+from __future__ import annotations
+
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError as exc:
+    print(
+        "location index test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+from app.api.routes.locations import get_location_lookup
+from app.main import app
+from app.services import LocationIndex
+
+
+def location_index() -> LocationIndex:
+    """Build an index from fake observation and region rows."""
+
+    return LocationIndex(
+        [
+            {"id": 1, "district": "Hoshangabad", "station": "Hoshangabad Nagar"},
+            {"id": 2, "district": "Jabalpur", "station": "Bargi"},
+            {"id": 3, "district": "Bharuch", "station": "Garudeshwar"},
+        ],
+        [
+            {"state": "Madhya Pradesh", "district": "Hoshangabad", "station": "Hoshangabad Nagar"},
+            {"state": "madhya  pradesh", "district": "Jabalpur", "station": "Jamtara"},
+            {"state": "Gujarat", "district": "Bharuch", "station": None},
+            {"state": "Gujarat", "district": None, "station": "Nagar Ghat"},
+        ],
+    )
+
+
+def assert_hierarchy_listing() -> None:
+    """States, districts, and stations are listed from the merged rows."""
+
+    index = location_index()
+
+    assert index.list_states() == ["Gujarat", "Madhya Pradesh"]
+    assert index.list_districts("MADHYA PRADESH") == ["Hoshangabad", "Jabalpur"]
+    assert index.list_districts("gujarat") == ["Bharuch"]
+
+    stations = index.list_stations(district="jabalpur")
+    assert [(row["name"], row["state"], row["region_id"]) for row in stations] == [
+        ("Bargi", "Madhya Pradesh", 2),
+        ("Jamtara", "Madhya Pradesh", None),
+    ]
+    garudeshwar = index.list_stations(state="Gujarat")[0]
+    assert garudeshwar["name"] == "Garudeshwar"
+    assert garudeshwar["district"] == "Bharuch"
+
+
+def assert_shared_district_names_stay_per_state() -> None:
+    """A district name used in two states is listed under both."""
+
+    index = LocationIndex(
+        [{"id": 7, "district": "Aurangabad", "station": "Paithan"}],
+        [
+            {"state": "Maharashtra", "district": "Aurangabad", "station": "Paithan"},
+            {"state": "Bihar", "district": "Aurangabad", "station": "Barun"},
+        ],
+    )
+
+    assert index.list_districts("Bihar") == ["Aurangabad"]
+    assert index.list_districts("Maharashtra") == ["Aurangabad"]
+    assert index.list_districts() == ["Aurangabad"]
+    bihar = index.list_stations(state="Bihar", district="Aurangabad")
+    assert [row["name"] for row in bihar] == ["Barun"]
+    paithan = index.list_stations(state="Maharashtra")[0]
+    assert (paithan["name"], paithan["region_id"]) == ("Paithan", 7)
+    districts = index.search("aur", kind="district")
+    assert sorted(row["state"] for row in districts) == ["Bihar", "Maharashtra"]
+
+
+def assert_prefix_search_ranks_name_starts_first() -> None:
+    """Whole-name prefixes rank before later-word prefixes."""
+
+    index = location_index()
+
+    names = [row["name"] for row in index.search("nag")]
+    assert names == ["Nagar Ghat", "Hoshangabad Nagar"]
+    assert [row["kind"] for row in index.search("hosh")] == ["district", "station"]
+    assert [row["name"] for row in index.search("hosh", kind="station")] == ["Hoshangabad Nagar"]
+    assert len(index.search("g", limit=1)) == 1
+    assert index.search("zz") == []
+    assert index.search(" - ") == []
+
+
+def assert_location_routes_use_index() -> None:
+    """The routes should read from the overridden index and validate inputs."""
+
+    index = location_index()
+    app.dependency_overrides[get_location_lookup] = lambda: index
+    try:
+        with TestClient(app) as client:
+            states = client.get("/api/v1/locations/states")
+            districts = client.get("/api/v1/locations/districts", params={"state": "Gujarat"})
+            search = client.get("/api/v1/locations/search", params={"q": "jam"})
+            invalid = client.get("/api/v1/locations/search", params={"q": "j", "kind": "river"})
+    finally:
+        app.dependency_overrides.pop(get_location_lookup, None)
+
+    assert states.status_code == 200, states.text
+    assert states.json()["states"] == ["Gujarat", "Madhya Pradesh"]
+    assert districts.json()["districts"] == ["Bharuch"]
+    assert search.json()["matches"][0]["name"] == "Jamtara"
+    assert invalid.status_code == 422
+
+
+def main() -> None:
+    """Run all location index checks."""
+
+    assert_hierarchy_listing()
+    assert_shared_district_names_stay_per_state()
+    assert_prefix_search_ranks_name_starts_first()
+    assert_location_routes_use_index()
+    print("location index checks ok: hierarchy and prefix search served from memory")
+
+
+if __name__ == "__main__":
+    main()
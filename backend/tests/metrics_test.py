@@ -0,0 +1,167 @@
+r"""Checks for the in-process metrics and the `/metrics` endpoint.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\metrics_test.py
+
+These tests start the app with `METRICS_ENABLED=true` and `get_db` overridden
+by an in-memory SQLite database holding the synthetic dataset. They do not
+connect to Azure, mutate data, or add scientific values.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+os.environ["METRICS_ENABLED"] = "true"
+
+try:
+    from fastapi.testclient import TestClient  # noqa: F401
+except ModuleNotFoundError as exc:
+    print(
+        "metrics test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+from app.core.config import get_settings
+from app.core.metrics import Counter, Gauge, Histogram, MetricsRegistry
+from app.db.session import _pool_usage, get_engine
+from query_budget import RECOMMEND_BODY, clear_service_caches
+from query_budget_test import synthetic_client, synthetic_engine
+
+
+def assert_text_format() -> None:
+    """Counters, gauges and histograms render HELP, TYPE and cumulative buckets."""
+
+    registry = MetricsRegistry()
+    requests = registry.register(Counter("demo_total", "Demo requests.", ("route",)))
+    in_flight = registry.register(Gauge("demo_in_flight", "Demo in flight."))
+    latency = registry.register(
+        Histogram("demo_seconds", "Demo latency.", ("route",), buckets=(0.1, 1.0))
+    )
+    requests.inc('/a/"{id}"')
+    requests.inc('/a/"{id}"', amount=2)
+    in_flight.inc()
+    in_flight.dec()
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, "/a")
+
+    lines = registry.render().splitlines()
+    assert lines[:3] == [
+        "# HELP demo_total Demo requests.",
+        "# TYPE demo_total counter",
+        'demo_total{route="/a/\\"{id}\\""} 3',
+    ]
+    assert "# TYPE demo_in_flight gauge" in lines and "demo_in_flight 0" in lines
+    assert lines[-5:] == [
+        'demo_seconds_bucket{route="/a",le="0.1"} 2',
+        'demo_seconds_bucket{route="/a",le="1"} 3',
+        'demo_seconds_bucket{route="/a",le="+Inf"} 4',
+        'demo_seconds_sum{route="/a"} 3.65',
+        'demo_seconds_count{route="/a"} 4',
+    ]
+
+
+def assert_thread_shards_add_up() -> None:
+    """Increments from many threads are all counted without a shared lock."""
+
+    counter = Counter("threads_total", "Thread increments.", ("worker",))
+    histogram = Histogram("threads_seconds", "Thread observations.", buckets=(1.0,))
+
+    def work() -> None:
+        for _ in range(2000):
+            counter.inc("w")
+            histogram.observe(0.5)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.values() == {("w",): 16000.0}
+    assert histogram.values()[()][-1] == 16000
+    counter.clear()
+    assert counter.values() == {}
+
+
+def metric_lines(text: str, name: str) -> list[str]:
+    """Return the sample lines of one metric family."""
+
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+def assert_endpoint_reports_requests_workflow_and_caches() -> None:
+    """`/metrics` labels routes by template and counts workflow runs and cache use."""
+
+    engine = synthetic_engine()
+    clear_service_caches()
+    with synthetic_client(engine, NBS_CATALOG_SNAPSHOT_ENABLED="true") as client:
+        for plant_id in (5, 7):
+            assert client.get(f"/api/v1/plants/{plant_id}").status_code == 200
+        assert client.get("/not-a-route").status_code == 404
+        for _ in range(2):
+            assert client.post("/api/v1/recommend", json=RECOMMEND_BODY).status_code == 200
+        response = client.get("/metrics")
+    engine.dispose()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert (
+        'http_requests_total{method="GET",route="/api/v1/plants/{plant_id}",status="200"} 2'
+        in text
+    )
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"} 1' in text
+    assert "/api/v1/plants/5" not in text and "/not-a-route" not in text
+    assert (
+        'http_request_duration_seconds_count{method="POST",route="/api/v1/recommend"} 2'
+        in text
+    )
+    # The scrape itself is in flight while the registry is rendered.
+    assert "http_requests_in_flight 1" in text
+    assert 'workflow_runs_total{workflow_status="completed",step_completed="L"} 2' in text
+    assert 'service_cache_lookups_total{cache="nbs_catalog_snapshot",result="miss"} 1' in text
+    assert 'service_cache_hit_ratio{cache="nbs_catalog_snapshot"} 0.5' in text
+    assert metric_lines(text, "db_pool_connections") == []
+
+
+def assert_pool_gauge_reads_engine() -> None:
+    """Pool usage appears once the engine exists and tracks checked-out connections."""
+
+    previous = os.environ.get("DATABASE_URL")
+    with tempfile.TemporaryDirectory() as folder:
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(folder) / 'pool.db'}"
+        get_settings.cache_clear()
+        get_engine.cache_clear()
+        try:
+            with get_engine().connect():
+                usage = _pool_usage()
+            assert usage[("checked_out",)] == 1.0, usage
+            assert _pool_usage()[("checked_out",)] == 0.0
+        finally:
+            get_engine().dispose()
+            get_engine.cache_clear()
+            if previous is None:
+                os.environ.pop("DATABASE_URL", None)
+            else:
+                os.environ["DATABASE_URL"] = previous
+            get_settings.cache_clear()
+
+
+def main() -> None:
+    """Run all metrics checks."""
+
+    assert_text_format()
+    assert_thread_shards_add_up()
+    assert_endpoint_reports_requests_workflow_and_caches()
+    assert_pool_gauge_reads_engine()
+    print("metrics checks ok: requests, workflow runs, caches and pool usage exported")
+
+
+if __name__ == "__main__":
+    main()
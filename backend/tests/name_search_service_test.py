@@ -0,0 +1,126 @@
+r"""Checks for batched fuzzy name search and the autocomplete route.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\name_search_service_test.py
+
+These tests use fake plant and NbS names and a FastAPI dependency override.
+They do not connect to Azure, do not need production data, and do not select
+plants or NbS options for recommendations.
+"""
+
+from __future__ import annotations
+
+try:
+    from fastapi.testclient import TestClient
+    from rapidfuzz import process
+except ModuleNotFoundError as exc:
+    print(
+        "name search service test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+import app.services.name_search_service as name_search_service
+from app.api.routes.names import get_name_index
+from app.main import app
+from app.services import NameSearchIndex
+
+
+def name_index() -> NameSearchIndex:
+    """Build an index from fake catalogue names."""
+
+    return NameSearchIndex(
+        [
+            {"id": 1, "plant_species": "Cattail (Typha latifolia)"},
+            {"id": 2, "plant_species": "Indian Shot (Canna indica)"},
+            {"id": 3, "plant_species": "cattail  (typha latifolia)"},
+            {"id": 4, "plant_species": None},
+        ],
+        [
+            {"id": 10, "solution": "Constructed Wetland"},
+            {"id": 11, "solution": "Vegetated Swale"},
+        ],
+    )
+
+
+def assert_names_are_normalized_once() -> None:
+    """Duplicate and blank names are dropped when the index is built."""
+
+    assert name_index().name_count == 4
+    assert name_search_service.normalize_name(" Canna-indica (L.) ") == "canna indica l"
+
+
+def assert_typos_match_with_one_batched_call() -> None:
+    """A misspelled query is scored against all names in one extract call."""
+
+    index = name_index()
+    original = process.extract
+    calls: list[int] = []
+
+    def counting_extract(*args: object, **kwargs: object) -> list[tuple[str, float, int]]:
+        """Count calls while keeping the original behavior."""
+
+        calls.append(len(args[1]))  # type: ignore[arg-type]
+        return original(*args, **kwargs)
+
+    name_search_service.process.extract = counting_extract
+    try:
+        matches = index.search("constructd wetlnd")
+    finally:
+        name_search_service.process.extract = original
+
+    assert calls == [4]
+    assert matches[0]["kind"] == "nbs"
+    assert matches[0]["id"] == 10
+    assert matches[0]["score"] >= 80
+
+
+def assert_kind_limit_and_cutoff() -> None:
+    """Kind filters, limits, and the score cutoff are respected."""
+
+    index = name_index()
+
+    plants = index.search("typha", kind="plant")
+    assert [match["id"] for match in plants] == [1]
+    assert index.search("typha", kind="nbs") == []
+    assert len(index.search("a", limit=1, score_cutoff=0)) == 1
+    assert index.search("zzzz") == []
+    assert index.search("  ") == []
+
+
+def assert_autocomplete_route_uses_index() -> None:
+    """The route should return scored matches and validate its inputs."""
+
+    index = name_index()
+    app.dependency_overrides[get_name_index] = lambda: index
+    try:
+        with TestClient(app) as client:
+            response = client.get(
+                "/api/v1/names/autocomplete",
+                params={"q": "cana indica", "kind": "plant"},
+            )
+            invalid = client.get("/api/v1/names/autocomplete", params={"q": "x", "kind": "soil"})
+    finally:
+        app.dependency_overrides.pop(get_name_index, None)
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["query"] == "cana indica"
+    assert payload["matches"][0]["name"] == "Indian Shot (Canna indica)"
+    assert invalid.status_code == 422
+
+
+def main() -> None:
+    """Run all fuzzy name search checks."""
+
+    assert_names_are_normalized_once()
+    assert_typos_match_with_one_batched_call()
+    assert_kind_limit_and_cutoff()
+    assert_autocomplete_route_uses_index()
+    print("name search service checks ok: one batched fuzzy call per query")
+
+
+if __name__ == "__main__":
+    main()
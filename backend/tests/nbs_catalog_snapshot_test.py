@@ -0,0 +1,199 @@
+r"""Checks for the in-memory NbS catalogue snapshot and precomputed text features.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\nbs_catalog_snapshot_test.py
+
+These tests use fake catalogue rows and an in-memory SQLite database. They do
+not connect to Azure, do not mutate stored data, and do not rank candidates.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+except ModuleNotFoundError as exc:
+    print(
+        "nbs catalog snapshot test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+import app.engines.candidate_filtering as candidate_filtering
+from app import models  # noqa: F401  # Import models so Base.metadata knows the tables.
+from app.db.base import Base
+from app.engines import CandidateFilteringEngine
+from app.models import NbsImplementation, NbsOption, RemovalEfficiency
+from app.services import NbsCatalogSnapshot
+from candidate_filtering_test import FakeNbsCatalogService, treatment_bundle
+
+
+def option(nbs_id: int, solution: str, description: str) -> dict[str, Any]:
+    """Build one fake catalogue option row."""
+
+    return {
+        "id": nbs_id,
+        "solution": solution,
+        "description": description,
+        "source_id": 10,
+    }
+
+
+def snapshot() -> NbsCatalogSnapshot:
+    """Build a snapshot from fake options and child-table rows."""
+
+    return NbsCatalogSnapshot(
+        [
+            option(1, "Open polishing pond", "Open pond"),
+            option(2, "Aquaculture system", "Fish food chain"),
+            option(3, "Vertical wetland", "Lined bed"),
+        ],
+        {
+            "removal_efficiencies": [
+                {"nbs_id": 1, "parameter": "fecal coliform", "eff_low": 70},
+                {"nbs_id": 2, "parameter": "lead", "eff_low": 30},
+                {"nbs_id": 3, "parameter": "BOD", "eff_low": 60},
+            ],
+            "implementation": [
+                {"nbs_id": 1, "implementation_steps": "Fence the pond."},
+                {"nbs_id": 3, "implementation_steps": "Avoid steep slope sites."},
+            ],
+        },
+    )
+
+
+def assert_text_features_precomputed() -> None:
+    """Caution key groups are derived once when the snapshot loads."""
+
+    catalogue = snapshot()
+
+    assert catalogue.get_option_text_features(1).caution_key_groups == {"open_contact"}
+    assert catalogue.get_option_text_features(2).caution_key_groups == {"food_chain"}
+    assert catalogue.get_option_text_features(3).caution_key_groups == {"steep_slope"}
+    assert catalogue.get_option_text_features(99) is None
+
+
+def assert_filtering_skips_tokenization() -> None:
+    """Per-request filtering should not re-tokenize profile text."""
+
+    catalogue = snapshot()
+    original = candidate_filtering._profile_text_keys
+    calls: list[int] = []
+
+    def counting_text_keys(*args: Any) -> set[str]:
+        """Count calls while keeping the original behavior."""
+
+        calls.append(1)
+        return original(*args)
+
+    candidate_filtering._profile_text_keys = counting_text_keys
+    try:
+        engine = CandidateFilteringEngine(catalogue)
+        engine.filter_candidates(treatment_bundle(["pathogens", "metals"]))
+        engine.filter_candidates(treatment_bundle(["organic_load"]))
+    finally:
+        candidate_filtering._profile_text_keys = original
+
+    assert calls == []
+
+
+def assert_snapshot_matches_uncached_provider() -> None:
+    """Snapshot results should equal results from a plain profile provider."""
+
+    catalogue = snapshot()
+    plain = FakeNbsCatalogService(
+        {nbs_id: catalogue.get_full_nbs_profile(nbs_id) for nbs_id in (1, 2, 3)}
+    )
+
+    for groups in (["pathogens"], ["metals"], ["organic_load", "pathogens"]):
+        bundle = treatment_bundle(groups)
+        cached = CandidateFilteringEngine(catalogue).filter_candidates(bundle)
+        uncached = CandidateFilteringEngine(plain).filter_candidates(bundle)
+        assert cached.to_dict() == uncached.to_dict()
+
+    pathogen_result = CandidateFilteringEngine(catalogue).filter_candidates(
+        treatment_bundle(["pathogens"])
+    ).results[0]
+    assert any("Pathogen treatment need" in flag for flag in pathogen_result.caution_flags)
+
+
+def assert_profiles_are_copies() -> None:
+    """Changing a returned profile must not change the shared snapshot."""
+
+    catalogue = snapshot()
+    profile = catalogue.get_full_nbs_profile(1)
+    profile["option"]["solution"] = "changed"
+    profile["removal_efficiencies"][0]["eff_low"] = 0
+
+    fresh = catalogue.get_full_nbs_profile(1)
+    assert fresh["option"]["solution"] == "Open polishing pond"
+    assert fresh["removal_efficiencies"][0]["eff_low"] == 70
+    assert catalogue.get_full_nbs_profile(99)["missing_sections"][0] == "option"
+
+
+def assert_loads_with_one_query_per_table() -> None:
+    """Loading from a session should cost one SELECT per catalogue table."""
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                NbsOption(id=1, solution="Wetland A", source_id=10),
+                NbsOption(id=2, solution="Wetland B", source_id=10),
+                RemovalEfficiency(id=1, nbs_id=1, parameter="BOD", eff_low=50.0),
+                RemovalEfficiency(id=2, nbs_id=2, parameter="TSS", eff_high=80.0),
+                NbsImplementation(id=1, nbs_id=1, implementation_steps="Build."),
+            ]
+        )
+        session.commit()
+
+        statements: list[str] = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def record_select(
+            _connection: object,
+            _cursor: object,
+            statement: str,
+            _parameters: object,
+            _context: object,
+            _executemany: bool,
+        ) -> None:
+            """Record SELECT statements issued while loading the snapshot."""
+
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        catalogue = NbsCatalogSnapshot.from_session(session)
+
+    assert len(statements) == 5, statements
+    assert [row["id"] for row in catalogue.list_options()] == [1, 2]
+    assert catalogue.get_full_nbs_profile(2)["missing_sections"] == [
+        "implementation",
+        "footprint",
+        "criteria",
+    ]
+
+
+def main() -> None:
+    """Run all NbS catalogue snapshot checks."""
+
+    assert_text_features_precomputed()
+    assert_filtering_skips_tokenization()
+    assert_snapshot_matches_uncached_provider()
+    assert_profiles_are_copies()
+    assert_loads_with_one_query_per_table()
+    print("nbs catalog snapshot checks ok: text features precomputed once")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+r"""Query-count tests for the bulk plant-mapping lookup used by Step K.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\plant_catalog_service_test.py
+
+These tests use an in-memory SQLite database with a few fake plant mappings.
+They do not connect to Azure, do not need production data, and do not change
+rank, TOPSIS closeness, or confidence scores.
+"""
+
+from __future__ import annotations
+
+try:
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+except ModuleNotFoundError as exc:
+    print(
+        "plant catalog service test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+from app import models  # noqa: F401  # Import models so Base.metadata knows the tables.
+from app.db.base import Base
+from app.engines import PlantMatchingEngine
+from app.models import NbsOption, Plant, PlantSolutionMap
+from app.services import PlantCatalogService
+from confidence_scoring_test import ranked_candidate, ranking_bundle
+
+
+def build_session() -> tuple[Session, list[str]]:
+    """Create a seeded in-memory session and a list that records SELECTs."""
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record_select(
+        _connection: object,
+        _cursor: object,
+        statement: str,
+        _parameters: object,
+        _context: object,
+        _executemany: bool,
+    ) -> None:
+        """Record every SELECT so tests can fix the query count."""
+
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    session = Session(engine)
+    session.add_all(
+        [
+            *[NbsOption(id=nbs_id, solution=f"Option {nbs_id}") for nbs_id in range(1, 7)],
+            Plant(id=1, plant_species="Typha latifolia", invasive=0),
+            Plant(id=2, plant_species="Canna indica", invasive=None),
+            Plant(id=3, plant_species="Eichhornia crassipes", invasive=1),
+            PlantSolutionMap(id=1, plant_id=1, nbs_id=1),
+            PlantSolutionMap(id=2, plant_id=2, nbs_id=1),
+            PlantSolutionMap(id=3, plant_id=3, nbs_id=1),
+            PlantSolutionMap(id=4, plant_id=1, nbs_id=3),
+            PlantSolutionMap(id=5, plant_id=3, nbs_id=4),
+        ]
+    )
+    session.commit()
+    statements.clear()
+    return session, statements
+
+
+def assert_bulk_lookup_matches_single_lookups() -> None:
+    """The bulk lookup should return the same rows as one call per ID."""
+
+    session, statements = build_session()
+    service = PlantCatalogService(session)
+
+    bulk = service.get_plants_for_nbs_ids([1, 2, 3, 4])
+
+    assert len(statements) == 1, statements
+    assert " IN " in statements[0].upper()
+    assert list(bulk) == [1, 2, 3, 4]
+    for nbs_id in (1, 2, 3, 4):
+        assert bulk[nbs_id] == service.get_plants_for_nbs(nbs_id)
+    assert [plant["id"] for plant in bulk[1]] == [2, 1]
+    assert bulk[4] == []
+
+    with_invasive = service.get_plants_for_nbs_ids([4], include_invasive=True)
+    assert [plant["id"] for plant in with_invasive[4]] == [3]
+
+
+def assert_empty_ids_skip_query() -> None:
+    """No requested IDs should not touch the database."""
+
+    session, statements = build_session()
+
+    assert PlantCatalogService(session).get_plants_for_nbs_ids([]) == {}
+    assert statements == []
+
+
+def assert_step_k_query_count_is_fixed() -> None:
+    """Step K should issue one plant query however many candidates are ranked."""
+
+    for candidate_count in (2, 6):
+        session, statements = build_session()
+        ranking = ranking_bundle(
+            candidates=[
+                ranked_candidate(
+                    nbs_id=nbs_id,
+                    nbs_name=f"Option {nbs_id}",
+                    rank=nbs_id,
+                    closeness=1.0 - nbs_id / 10,
+                )
+                for nbs_id in range(1, candidate_count + 1)
+            ]
+        )
+
+        bundle = PlantMatchingEngine(PlantCatalogService(session)).match_plants(ranking)
+
+        assert len(statements) == 1, statements
+        assert [
+            plant.plant_id for plant in bundle.candidate_matches[0].plant_matches
+        ] == [2, 1]
+        assert bundle.candidate_matches[1].plant_matches == []
+
+
+def main() -> None:
+    """Run all bulk plant-mapping lookup checks."""
+
+    assert_bulk_lookup_matches_single_lookups()
+    assert_empty_ids_skip_query()
+    assert_step_k_query_count_is_fixed()
+    print("plant catalog service checks ok: one query per Step K plant lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ import sys
 from typing import Any
 
 from app.engines import PlantMatchingEngine
+from app.engines.plant_matching import BulkPlantMappingProvider
 from confidence_scoring_test import ranking_bundle, score_complete_expert_case
 
 
@@ -54,6 +55,41 @@ class FakePlantMappingProvider:
         return list(self.mappings.get(nbs_id, []))
 
 
+class FakeBulkPlantMappingProvider(FakePlantMappingProvider):
+    """Fake that also answers several NbS IDs in one call and counts calls."""
+
+    def __init__(self, mappings: dict[int, list[dict[str, Any]]]) -> None:
+        super().__init__(mappings)
+        self.single_calls = 0
+        self.bulk_calls = 0
+
+    def get_plants_for_nbs(
+        self,
+        nbs_id: int,
+        *,
+        include_invasive: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Count and return the explicit fake mappings for one NbS ID."""
+
+        self.single_calls += 1
+        return super().get_plants_for_nbs(nbs_id)
+
+    def get_plants_for_nbs_ids(
+        self,
+        nbs_ids: list[int],
+        *,
+        include_invasive: bool = False,
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Return the explicit fake mappings for several NbS IDs."""
+
+        self.bulk_calls += 1
+        return {
+            nbs_id: list(self.mappings[nbs_id])
+            for nbs_id in nbs_ids
+            if nbs_id in self.mappings
+        }
+
+
 def fake_provider() -> FakePlantMappingProvider:
     """Build fake plant mappings for the ranked candidates."""
 
@@ -126,6 +162,23 @@ def assert_missing_mapping_returns_empty_list_plus_warning() -> None:
     assert any("No explicit plant mappings" in warning for warning in bundle.warnings)
 
 
+def assert_bulk_provider_is_used_when_available() -> None:
+    """A provider with `get_plants_for_nbs_ids` is asked once for all candidates."""
+
+    assert not isinstance(fake_provider(), BulkPlantMappingProvider)
+
+    provider = FakeBulkPlantMappingProvider(fake_provider().mappings)
+    assert isinstance(provider, BulkPlantMappingProvider)
+    bundle = PlantMatchingEngine(provider).match_plants(
+        ranking_bundle(),
+        score_complete_expert_case(),
+    )
+
+    assert (provider.bulk_calls, provider.single_calls) == (1, 0)
+    assert [plant.plant_id for plant in bundle.candidate_matches[0].plant_matches] == [501, 502]
+    assert bundle.candidate_matches[1].plant_matches == []
+
+
 def assert_rank_closeness_and_confidence_are_preserved() -> None:
     """Plant matching must not change Step I rank or Step J confidence."""
 
@@ -194,6 +247,7 @@ def main() -> None:
 
     assert_plant_matching_uses_explicit_mappings_only()
     assert_missing_mapping_returns_empty_list_plus_warning()
+    assert_bulk_provider_is_used_when_available()
     assert_rank_closeness_and_confidence_are_preserved()
     assert_missing_confidence_bundle_is_safe()
     assert_no_forbidden_future_fields()
@@ -0,0 +1,200 @@
+r"""Checks for the in-memory plant search index and `/plants/search` route.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\plant_search_index_test.py
+
+These tests use fake plant rows and a FastAPI dependency override. They do not
+connect to Azure, do not need production data, and do not select plants for
+recommendations.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError as exc:
+    print(
+        "plant search index test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+from app.api.routes.plants import get_search_index
+from app.main import app
+from app.services import PlantSearchIndex
+
+
+def plants() -> list[dict[str, Any]]:
+    """Return fake plant catalogue rows."""
+
+    rows = [
+        (1, "Typha latifolia", "Native", "Emergent", "High, tolerates sewage", "Pb Cd",
+         "Shallow to moderate"),
+        (2, "Canna indica", "Native", "Emergent", "Medium, domestic wastewater", None,
+         "Moist to wet"),
+        (3, "Eichhornia crassipes", "Invasive", "Floating", "High, heavy metals", "Pb Cd Hg",
+         "Floating"),
+        (4, "Azolla pinnata", "Native", "Floating", "Low, sensitive", None,
+         "Shallow water bodies"),
+    ]
+    return [plant(*row) for row in rows]
+
+
+def plant(
+    plant_id: int,
+    species: str,
+    native_status: str,
+    plant_type: str,
+    tolerance: str,
+    metals: str | None,
+    water_needs: str,
+) -> dict[str, Any]:
+    """Build one fake plant row."""
+
+    return {
+        "id": plant_id,
+        "plant_species": species,
+        "native_status": native_status,
+        "plant_type": plant_type,
+        "pollution_tolerance": tolerance,
+        "metals_pollutants": metals,
+        "water_needs": water_needs,
+        "source_id": 9,
+    }
+
+
+def assert_postings_are_sorted_ids() -> None:
+    """Each token maps to the sorted IDs of plants that mention it."""
+
+    index = PlantSearchIndex(plants())
+
+    assert index.plant_count == 4
+    assert index.postings("floating") == (3, 4)
+    assert index.postings("missing") == ()
+    assert index.facet_postings("metals_pollutants", "pb  CD") == (1,)
+    assert index.facet_postings("metals_pollutants", "pb") == ()
+
+
+def assert_facets_and_or_filters() -> None:
+    """Facet values OR within a facet and AND across facets."""
+
+    index = PlantSearchIndex(plants())
+
+    either = index.search(
+        filters={"pollution_tolerance": ["High, heavy metals", "Low, sensitive"]}
+    )
+    assert [row["id"] for row in either["results"]] == [4, 3]
+
+    both = index.search(
+        filters={"metals_pollutants": ["Pb Cd", "Pb Cd Hg"], "native_status": ["native"]}
+    )
+    assert [row["id"] for row in both["results"]] == [1]
+
+    text = index.search("wastewater")
+    assert [row["id"] for row in text["results"]] == [2]
+    assert index.search("heavy sewage")["total"] == 0
+
+
+def assert_facet_counts_skip_own_filter() -> None:
+    """Counts for a facet ignore that facet's own selected values."""
+
+    index = PlantSearchIndex(plants())
+    result = index.search(filters={"native_status": ["native"], "plant_type": ["floating"]})
+
+    assert result["total"] == 1
+    assert result["facets"]["native_status"] == {"Invasive": 1, "Native": 1}
+    assert result["facets"]["plant_type"] == {"Emergent": 2, "Floating": 1}
+
+
+def assert_facet_filters_match_whole_values() -> None:
+    """`Native` does not match `Non-native`, so totals agree with counts."""
+
+    rows = plants() + [
+        plant(5, "Pistia stratiotes", "Non-native", "Floating", "High", None, "Floating")
+    ]
+    index = PlantSearchIndex(rows)
+    result = index.search(filters={"native_status": ["Native"]})
+
+    assert [row["id"] for row in result["results"]] == [4, 2, 1]
+    assert result["total"] == result["facets"]["native_status"]["Native"] == 3
+    assert result["facets"]["native_status"]["Non-native"] == 1
+    assert index.search(filters={"native_status": ["non-native"]})["total"] == 1
+
+
+def assert_facet_counts_ignore_case() -> None:
+    """`Shrub` and `shrub` share one count under the first spelling indexed."""
+
+    rows = plants() + [
+        plant(5, "Vetiveria zizanioides", "Native", "Shrub", "High", None, "Moist"),
+        plant(6, "Ipomoea carnea", "Invasive", "shrub", "High", None, "Moist"),
+        plant(7, "Lantana camara", "Invasive", "SHRUB ", "Low", None, "Dry"),
+    ]
+    index = PlantSearchIndex(rows)
+    result = index.search()
+
+    assert result["facets"]["plant_type"] == {"Emergent": 2, "Floating": 2, "Shrub": 3}
+    filtered = index.search(filters={"plant_type": ["shrub"]})
+    assert filtered["total"] == filtered["facets"]["plant_type"]["Shrub"] == 3
+    assert filtered["facets"]["native_status"] == {"Invasive": 2, "Native": 1}
+
+
+def assert_pagination() -> None:
+    """Limit and offset page through results in species order."""
+
+    index = PlantSearchIndex(plants())
+    page = index.search(limit=2, offset=1)
+
+    assert page["total"] == 4
+    assert [row["plant_species"] for row in page["results"]] == [
+        "Canna indica",
+        "Eichhornia crassipes",
+    ]
+
+
+def assert_search_route_uses_index() -> None:
+    """The route should read repeated facet parameters and return counts."""
+
+    index = PlantSearchIndex(plants())
+    app.dependency_overrides[get_search_index] = lambda: index
+    try:
+        with TestClient(app) as client:
+            response = client.get(
+                "/api/v1/plants/search",
+                params=[
+                    ("plant_type", "emergent"),
+                    ("plant_type", "floating"),
+                    ("q", "pb"),
+                    ("limit", "1"),
+                ],
+            )
+            invalid = client.get("/api/v1/plants/search", params={"limit": 0})
+    finally:
+        app.dependency_overrides.pop(get_search_index, None)
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["total"] == 2
+    assert [row["id"] for row in payload["results"]] == [3]
+    assert payload["facets"]["metals_pollutants"] == {"Pb Cd": 1, "Pb Cd Hg": 1}
+    assert invalid.status_code == 422
+
+
+def main() -> None:
+    """Run all plant search index checks."""
+
+    assert_postings_are_sorted_ids()
+    assert_facets_and_or_filters()
+    assert_facet_counts_skip_own_filter()
+    assert_facet_filters_match_whole_values()
+    assert_facet_counts_ignore_case()
+    assert_pagination()
+    assert_search_route_uses_index()
+    print("plant search index checks ok: faceted search served from memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+r"""Checks for the on-demand request profiler.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\profiling_test.py
+
+These tests sample a busy local function and call `/api/v1/recommend` with
+`get_db` overridden by an in-memory SQLite database holding the synthetic
+dataset. They do not connect to Azure, mutate data, or add scientific values.
+"""
+
+from __future__ import annotations
+
+import time
+
+try:
+    from fastapi.testclient import TestClient  # noqa: F401
+except ModuleNotFoundError as exc:
+    print(
+        "profiling test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+from app.core.profiling import StackSampler
+from query_budget import RECOMMEND_BODY
+from query_budget_test import synthetic_client, synthetic_engine
+
+
+def busy_leaf(seconds: float) -> int:
+    """Spin in pure Python for `seconds`."""
+
+    total = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+def busy_caller() -> int:
+    """Call `busy_leaf` so it appears one frame below this function."""
+
+    return busy_leaf(0.15)
+
+
+def assert_sampler_records_caller_stacks() -> None:
+    """Stacks start at the `with` block and reach the busy function."""
+
+    with StackSampler(interval=0.001) as sampler:
+        busy_caller()
+
+    assert sampler.sample_count > 0
+    assert sampler.duration_ms >= 150
+    collapsed = sampler.collapsed().splitlines()
+    heaviest_stack, count = collapsed[0].rsplit(" ", 1)
+    frames = heaviest_stack.split(";")
+    assert frames[0].startswith("assert_sampler_records_caller_stacks (tests/profiling_test.py:")
+    assert frames[1].startswith("busy_caller ") and frames[2].startswith("busy_leaf ")
+    assert int(count) > 0
+    assert all(line.startswith("assert_sampler_records_caller_stacks ") for line in collapsed)
+
+    profile = sampler.speedscope("busy")
+    frame_names = [frame["name"] for frame in profile["shared"]["frames"]]
+    assert "busy_leaf" in frame_names
+    sampled = profile["profiles"][0]
+    assert sampled["type"] == "sampled" and sampled["unit"] == "milliseconds"
+    assert len(sampled["samples"]) == len(sampled["weights"])
+    assert all(0 <= index < len(frame_names) for stack in sampled["samples"] for index in stack)
+    assert sampled["endValue"] > 0
+
+
+def assert_recommend_returns_profile_only_when_enabled() -> None:
+    """The profile header is ignored unless PROFILING_ENABLED is true."""
+
+    engine = synthetic_engine()
+    headers = {"X-Profile": "speedscope"}
+    with synthetic_client(engine, PROFILING_ENABLED="false") as client:
+        response = client.post("/api/v1/recommend", json=RECOMMEND_BODY, headers=headers)
+    assert response.status_code == 200
+    assert "recommendation_assembly_bundle" in response.json()
+
+    with synthetic_client(
+        engine,
+        PROFILING_ENABLED="true",
+        PROFILING_SAMPLE_INTERVAL_MS="0.5",
+    ) as client:
+        speedscope = client.post("/api/v1/recommend", json=RECOMMEND_BODY, headers=headers)
+        collapsed = client.post("/api/v1/recommend?profile=collapsed", json=RECOMMEND_BODY)
+        unknown = client.post("/api/v1/recommend?profile=pstats", json=RECOMMEND_BODY)
+    engine.dispose()
+
+    assert speedscope.status_code == 200, speedscope.text
+    assert speedscope.headers["content-type"] == "application/json"
+    profile = speedscope.json()
+    assert profile["name"] == "POST /api/v1/recommend"
+    assert profile["profiles"][0]["type"] == "sampled"
+    assert int(speedscope.headers["X-Profile-Samples"]) >= 0
+    assert float(speedscope.headers["X-Profile-Duration-Ms"]) > 0
+
+    assert collapsed.status_code == 200
+    assert collapsed.headers["content-type"].startswith("text/plain")
+    for line in collapsed.text.splitlines():
+        assert line.startswith("run_local_recommendation_workflow (app/api/routes/recommendation.py:")
+    assert unknown.status_code == 400
+    assert "collapsed, speedscope" in unknown.json()["detail"]
+
+
+def main() -> None:
+    """Run all profiling checks."""
+
+    assert_sampler_records_caller_stacks()
+    assert_recommend_returns_profile_only_when_enabled()
+    print("profiling checks ok: collapsed and speedscope profiles returned on request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+r"""SQL query budgets for every `/api/v1` route, with test helpers.
+
+Import from a test in this folder:
+
+    from query_budget import ROUTE_BUDGETS, assert_max_queries
+
+`ROUTE_BUDGETS` lists one request per route registered by
+`app/api/router.py`, with the largest number of SQL statements the route may
+run against the synthetic dataset from `tests/synthetic_dataset.py` and the
+largest number of times one statement shape may repeat. Process-wide caches
+are cleared first, so budgets cover a cold request. Raise a budget only when a
+new query is intended; a repeat count that grows with the data is an N+1 loop.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.db.statement_counter import StatementCounter, count_statements
+from app.services import (
+    clear_location_index,
+    clear_name_search_index,
+    clear_nbs_catalog_snapshot,
+    clear_plant_search_index,
+    clear_water_summary_index,
+)
+
+RECOMMEND_BODY = {
+    "use_case": "surface discharge",
+    "station": "Station 3",
+    "selected_parameters": ["BOD", "TSS", "nitrate", "DO"],
+    "temporary_weights": {
+        "removal_evidence_score": 5.0,
+        "removal_evidence_coverage": 3.0,
+        "site_suitability": 2.0,
+    },
+}
+
+
+@dataclass(frozen=True)
+class RouteBudget:
+    """Allowed SQL statements for one example request to one route."""
+
+    method: str
+    path: str
+    url: str
+    max_queries: int
+    max_repeats: int = 1
+    json: dict[str, Any] | None = field(default=None, compare=False)
+
+
+# `/recommend` is measured with NBS_CATALOG_SNAPSHOT_ENABLED=true. Without the
+# snapshot, Step E/F read each NbS profile with five queries per option.
+ROUTE_BUDGETS: tuple[RouteBudget, ...] = (
+    RouteBudget("GET", "/api/v1/reference", "/api/v1/reference", 5),
+    RouteBudget("GET", "/api/v1/reference/basins", "/api/v1/reference/basins", 1),
+    RouteBudget("GET", "/api/v1/reference/regions", "/api/v1/reference/regions", 1),
+    RouteBudget("GET", "/api/v1/reference/sources", "/api/v1/reference/sources", 1),
+    RouteBudget("GET", "/api/v1/reference/stations", "/api/v1/reference/stations", 1),
+    RouteBudget("GET", "/api/v1/reference/use-cases", "/api/v1/reference/use-cases", 1),
+    RouteBudget("GET", "/api/v1/sites/{region_id}", "/api/v1/sites/3", 4),
+    RouteBudget("GET", "/api/v1/locations/states", "/api/v1/locations/states", 2),
+    RouteBudget("GET", "/api/v1/locations/districts", "/api/v1/locations/districts", 2),
+    RouteBudget("GET", "/api/v1/locations/stations", "/api/v1/locations/stations", 2),
+    RouteBudget("GET", "/api/v1/locations/search", "/api/v1/locations/search?q=sta", 2),
+    RouteBudget(
+        "GET",
+        "/api/v1/water/stations/{station}/observations",
+        "/api/v1/water/stations/Station 3/observations?parameter=BOD",
+        1,
+    ),
+    RouteBudget(
+        "GET",
+        "/api/v1/water/basins/{basin_id}/observations",
+        "/api/v1/water/basins/3/observations",
+        1,
+    ),
+    RouteBudget("GET", "/api/v1/water/parameters", "/api/v1/water/parameters", 1),
+    RouteBudget("GET", "/api/v1/standards/use-cases", "/api/v1/standards/use-cases", 1),
+    RouteBudget("GET", "/api/v1/standards/{use_case}", "/api/v1/standards/irrigation", 1),
+    RouteBudget(
+        "GET",
+        "/api/v1/standards/{use_case}/{parameter}",
+        "/api/v1/standards/irrigation/BOD",
+        1,
+    ),
+    RouteBudget("GET", "/api/v1/nbs/options", "/api/v1/nbs/options", 1),
+    RouteBudget("GET", "/api/v1/nbs/{nbs_id}", "/api/v1/nbs/5", 5),
+    RouteBudget("GET", "/api/v1/plants", "/api/v1/plants", 1),
+    RouteBudget("GET", "/api/v1/plants/search", "/api/v1/plants/search?q=species", 1),
+    RouteBudget("GET", "/api/v1/plants/nbs/{nbs_id}", "/api/v1/plants/nbs/5", 1),
+    RouteBudget("GET", "/api/v1/plants/{plant_id}", "/api/v1/plants/5", 1),
+    RouteBudget("GET", "/api/v1/names/autocomplete", "/api/v1/names/autocomplete?q=wetland", 2),
+    RouteBudget(
+        "GET",
+        "/api/v1/pollution/regions/{region_id}",
+        "/api/v1/pollution/regions/3",
+        2,
+        max_repeats=2,
+    ),
+    RouteBudget(
+        "GET",
+        "/api/v1/river/stream-order/{stream_order}",
+        "/api/v1/river/stream-order/2",
+        1,
+    ),
+    RouteBudget("GET", "/api/v1/river/sites/{region_id}", "/api/v1/river/sites/3", 1),
+    RouteBudget(
+        "GET",
+        "/api/v1/availability",
+        "/api/v1/availability?region_id=3&station=Station 3&use_case=irrigation&nbs_id=5",
+        6,
+    ),
+    RouteBudget("POST", "/api/v1/recommend", "/api/v1/recommend", 8, json=RECOMMEND_BODY),
+)
+
+
+def clear_service_caches() -> None:
+    """Drop every process-wide service cache so the next request starts cold."""
+
+    clear_location_index()
+    clear_name_search_index()
+    clear_nbs_catalog_snapshot()
+    clear_plant_search_index()
+    clear_water_summary_index()
+
+
+def describe_statements(counter: StatementCounter, limit: int = 3) -> str:
+    """Return the most repeated statement shapes, one per line."""
+
+    return "\n".join(
+        f"  {seen}x {shape[:160]}" for shape, seen in counter.repeated(1)[:limit]
+    )
+
+
+@contextmanager
+def assert_max_queries(
+    max_queries: int,
+    *,
+    max_repeats: int | None = None,
+    label: str = "block",
+) -> Iterator[StatementCounter]:
+    """Fail when the block runs more than `max_queries` SQL statements.
+
+    With `max_repeats`, also fail when one statement shape runs more often.
+    """
+
+    with count_statements(fingerprint=True) as counter:
+        yield counter
+    if counter.count > max_queries:
+        raise AssertionError(
+            f"{label} ran {counter.count} SQL statements (budget {max_queries}):\n"
+            f"{describe_statements(counter)}"
+        )
+    if max_repeats is not None and counter.max_repeated() > max_repeats:
+        raise AssertionError(
+            f"{label} repeated one SQL statement {counter.max_repeated()} times "
+            f"(limit {max_repeats}), likely an N+1 loop:\n{describe_statements(counter)}"
+        )
+
+
+def assert_route_within_budget(client: Any, budget: RouteBudget) -> StatementCounter:
+    """Send the budget's example request cold and check its SQL statement count."""
+
+    clear_service_caches()
+    label = f"{budget.method} {budget.url}"
+    with assert_max_queries(
+        budget.max_queries,
+        max_repeats=budget.max_repeats,
+        label=label,
+    ) as counter:
+        response = client.request(budget.method, budget.url, json=budget.json)
+    assert response.status_code == 200, f"{label}: {response.status_code} {response.text}"
+    return counter
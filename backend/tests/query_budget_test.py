@@ -0,0 +1,206 @@
+r"""SQL query budget and N+1 checks for every `/api/v1` route.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\query_budget_test.py
+
+These tests send one request per route to the app with `get_db` overridden by
+an in-memory SQLite database holding the synthetic dataset. They fail when a
+route runs more SQL statements than `tests/query_budget.py` allows. They do
+not connect to Azure, mutate data, or add scientific values.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+try:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError as exc:
+    print(
+        "query budget test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.query_budget import QueryBudgetMiddleware
+from app.core.config import get_settings
+from app.db.session import get_db
+from app.db.statement_counter import fingerprint_statement
+from app.main import app
+from query_budget import (
+    RECOMMEND_BODY,
+    ROUTE_BUDGETS,
+    assert_max_queries,
+    assert_route_within_budget,
+    clear_service_caches,
+)
+from synthetic_dataset import create_schema, generate_dataset, write_dataset
+
+
+def synthetic_engine() -> Engine:
+    """Return an in-memory SQLite engine holding a small synthetic dataset."""
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    create_schema(engine)
+    write_dataset(engine, generate_dataset(scale=0.2, seed=5))
+    return engine
+
+
+@contextmanager
+def synthetic_client(engine: Engine, **environment: str) -> Iterator[TestClient]:
+    """Yield a client whose `get_db` reads `engine`, with temporary settings."""
+
+    factory = sessionmaker(bind=engine, autoflush=False)
+
+    def synthetic_db() -> Iterator[Session]:
+        session = factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    previous = {name: os.environ.get(name) for name in environment}
+    os.environ.update(environment)
+    get_settings.cache_clear()
+    app.dependency_overrides[get_db] = synthetic_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        get_settings.cache_clear()
+        clear_service_caches()
+
+
+def assert_fingerprints_ignore_values() -> None:
+    """Statements differing only in values or IN-list length share a shape."""
+
+    assert fingerprint_statement(
+        "SELECT * FROM plants WHERE id = 5 AND name = 'Reed'"
+    ) == fingerprint_statement("SELECT * FROM plants\n WHERE id = 12 AND name = 'O''Brien'")
+    assert fingerprint_statement(
+        "SELECT * FROM t WHERE id IN (?, ?, ?)"
+    ) == fingerprint_statement("SELECT * FROM t WHERE id IN (?)")
+    assert fingerprint_statement(
+        "SELECT * FROM t WHERE a = %(a_1)s AND b = :b AND c = $1 AND d::text = %s"
+    ) == "SELECT * FROM t WHERE a = ? AND b = ? AND c = ? AND d::text = ?"
+    assert fingerprint_statement("SELECT a FROM t1") != fingerprint_statement("SELECT b FROM t1")
+
+
+def assert_every_route_has_a_budget() -> None:
+    """New routes must be added to ROUTE_BUDGETS before this test passes."""
+
+    registered = {
+        (method.upper(), path)
+        for path, methods in app.openapi()["paths"].items()
+        if path.startswith("/api/v1")
+        for method in methods
+    }
+    budgeted = {(budget.method, budget.path) for budget in ROUTE_BUDGETS}
+    assert registered - budgeted == set(), f"routes without a query budget: {registered - budgeted}"
+    assert budgeted - registered == set(), f"budgets for missing routes: {budgeted - registered}"
+
+
+def assert_routes_stay_within_budget(engine: Engine) -> None:
+    """Every route runs no more SQL statements than its budget, starting cold."""
+
+    with synthetic_client(engine, NBS_CATALOG_SNAPSHOT_ENABLED="true") as client:
+        for budget in ROUTE_BUDGETS:
+            assert_route_within_budget(client, budget)
+
+
+def assert_per_option_profile_loop_is_detected(engine: Engine) -> None:
+    """Without the catalogue snapshot, `/recommend` repeats one query per option."""
+
+    with synthetic_client(engine, NBS_CATALOG_SNAPSHOT_ENABLED="false") as client:
+        try:
+            with assert_max_queries(1000, max_repeats=5, label="per-option /recommend"):
+                response = client.post("/api/v1/recommend", json=RECOMMEND_BODY)
+        except AssertionError as exc:
+            message = str(exc)
+        else:
+            raise AssertionError("repeated per-option NbS profile queries were not flagged")
+    assert response.status_code == 200, response.text
+    assert "N+1" in message and "SELECT nbs_options.id" in message, message
+
+
+class _Capture(logging.Handler):
+    """Keep emitted log records in memory."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def assert_middleware_warns_over_budget(engine: Engine) -> None:
+    """Requests over the budget or repeating a shape log one JSON warning."""
+
+    budget_app = FastAPI()
+    budget_app.add_middleware(QueryBudgetMiddleware, budget=3, repeat_threshold=4)
+
+    @budget_app.get("/loop/{times}")
+    def loop(times: int) -> dict[str, int]:
+        with engine.connect() as connection:
+            for value in range(times):
+                connection.execute(text("SELECT id FROM plants WHERE id = :id"), {"id": value})
+        return {"times": times}
+
+    logger = logging.getLogger("app.sql.budget")
+    capture = _Capture()
+    logger.addHandler(capture)
+    try:
+        client = TestClient(budget_app)
+        assert client.get("/loop/2").status_code == 200
+        assert capture.records == []
+        assert client.get("/loop/6").status_code == 200
+    finally:
+        logger.removeHandler(capture)
+
+    assert len(capture.records) == 1
+    assert capture.records[0].levelno == logging.WARNING
+    record = json.loads(capture.records[0].getMessage())
+    assert record["event"] == "sql_query_budget_exceeded"
+    assert record["path"] == "/loop/6"
+    assert record["statements"] == 6 and record["budget"] == 3
+    assert record["repeated"][0]["count"] == 6
+    assert "FROM plants WHERE id = ?" in record["repeated"][0]["fingerprint"]
+
+
+def main() -> None:
+    """Run all query budget checks."""
+
+    engine = synthetic_engine()
+    assert_fingerprints_ignore_values()
+    assert_every_route_has_a_budget()
+    assert_routes_stay_within_budget(engine)
+    assert_per_option_profile_loop_is_detected(engine)
+    assert_middleware_warns_over_budget(engine)
+    engine.dispose()
+    print(f"query budget checks ok: {len(ROUTE_BUDGETS)} routes within their SQL budgets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+r"""Query-plan regression checks for hot repository reads.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\query_plan_test.py
+
+The script builds an in-memory SQLite database from the models, applies the
+`CREATE INDEX` statements from `schema.sql`, `schema_river_network_patch.sql`
+and `schema_index_patch.sql`, and seeds it with the synthetic dataset from
+`tests/synthetic_dataset.py`. It then calls each hot repository method,
+captures the SQL it sends, runs that SQL under `EXPLAIN QUERY PLAN`, and fails
+if a hot table is read with a full scan instead of an index search.
+
+Set `QUERY_PLAN_DATABASE_URL` to a local/dev PostgreSQL database that already
+has the schema, patches and data loaded to run the same checks with `EXPLAIN`
+there (a `Seq Scan` on a hot table fails). It never writes to that database.
+The seeded rows are fake and are not scientific values.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.db.schema_indexes import REPO_ROOT, SCHEMA_FILES
+from app.repositories import (
+    NbsRepository,
+    PlantRepository,
+    PollutionRepository,
+    RegionRepository,
+    RiverRepository,
+    SiteRepository,
+    SourceRepository,
+    StandardsRepository,
+    WaterRepository,
+)
+from synthetic_dataset import create_schema, generate_dataset, write_dataset
+
+# 200 stations, 24k observations, 240 NbS options, 1.6k plants, 8k river segments.
+SYNTHETIC_SCALE = 4
+
+# name -> (tables that must not be fully scanned, repository call)
+HOT_QUERIES: dict[str, tuple[tuple[str, ...], Callable[[Session], Any]]] = {
+    "water.observations_by_station": (
+        ("water_observations",),
+        lambda s: WaterRepository(s).get_observations_by_station("Station 7"),
+    ),
+    "water.observations_by_basin": (
+        ("water_observations",),
+        lambda s: WaterRepository(s).get_observations_by_basin(3),
+    ),
+    "water.parameter_values": (
+        ("water_observations",),
+        lambda s: WaterRepository(s).get_parameter_values("Station 7", "BOD"),
+    ),
+    "water.station_observations": (
+        ("water_observations",),
+        lambda s: WaterRepository(s).list_station_observations("Station 7"),
+    ),
+    "nbs.option_by_id": (("nbs_options",), lambda s: NbsRepository(s).get_option_by_id(5)),
+    "nbs.removal_efficiencies": (
+        ("removal_efficiency",),
+        lambda s: NbsRepository(s).get_removal_efficiencies(5),
+    ),
+    "nbs.implementation": (
+        ("nbs_implementation",),
+        lambda s: NbsRepository(s).get_implementation(5),
+    ),
+    "nbs.footprint": (("nbs_footprint",), lambda s: NbsRepository(s).get_footprint(5)),
+    "nbs.criteria": (("nbs_criteria",), lambda s: NbsRepository(s).get_criteria(5)),
+    "plants.by_id": (("plants",), lambda s: PlantRepository(s).get_plant_by_id(5)),
+    "plants.for_nbs": (
+        ("plants", "plant_solution_map"),
+        lambda s: PlantRepository(s).get_plants_for_nbs(5),
+    ),
+    "plants.for_nbs_ids": (
+        ("plants", "plant_solution_map"),
+        lambda s: PlantRepository(s).get_plants_for_nbs_ids([5, 6, 7]),
+    ),
+    "plants.mapping_count": (
+        ("plant_solution_map",),
+        lambda s: PlantRepository(s).count_plant_mappings(5),
+    ),
+    "standards.for_use_case": (
+        ("standards",),
+        lambda s: StandardsRepository(s).get_standards_for_use_case("irrigation"),
+    ),
+    "standards.one": (
+        ("standards",),
+        lambda s: StandardsRepository(s).get_standard("irrigation", "BOD"),
+    ),
+    "regions.by_id": (("regions",), lambda s: RegionRepository(s).get_by_id(5)),
+    "regions.by_station": (
+        ("regions",),
+        lambda s: RegionRepository(s).get_by_station("station 7"),
+    ),
+    "pollution.sources": (
+        ("pollution_sources",),
+        lambda s: PollutionRepository(s).get_pollution_sources(5),
+    ),
+    "site.attributes": (("site_attributes",), lambda s: SiteRepository(s).get_site_attributes(5)),
+    "site.stream_by_station": (
+        ("site_stream_attributes",),
+        lambda s: SiteRepository(s).get_site_stream_attributes(station="Station 7"),
+    ),
+    "sources.many_by_ids": (
+        ("sources",),
+        lambda s: SourceRepository(s).get_many_by_ids([1, 2, 3]),
+    ),
+    "river.by_stream_order": (
+        ("river_network",),
+        lambda s: RiverRepository(s).get_segments_by_stream_order(4),
+    ),
+    "river.near_hybas": (
+        ("river_network",),
+        lambda s: RiverRepository(s).get_segments_near_hybas(4_120_002_000),
+    ),
+}
+
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)(?! USING (?:COVERING )?INDEX)")
+_POSTGRES_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+def sqlite_engine(with_patch: bool = True) -> Engine:
+    """Create and seed an in-memory SQLite database, optionally without the index patch."""
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    create_schema(engine, SCHEMA_FILES if with_patch else SCHEMA_FILES[:-1])
+    write_dataset(engine, generate_dataset(scale=SYNTHETIC_SCALE))
+    return engine
+
+
+def captured_selects(engine: Engine, call: Callable[[Session], Any]) -> list[tuple[str, Any]]:
+    """Run one repository call and return the SELECT statements it sent."""
+
+    statements: list[tuple[str, Any]] = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany) -> None:
+        """Record SELECT statements with their driver parameters."""
+
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(engine) as session:
+            call(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return statements
+
+
+def scanned_tables(engine: Engine, statement: str, parameters: Any) -> tuple[set[str], str]:
+    """Return tables read with a full scan, plus the plan text."""
+
+    with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            plan_rows = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).all()
+            lines = [str(row[-1]) for row in plan_rows]
+            scans = {match.group(1) for line in lines if (match := _SQLITE_SCAN.match(line))}
+        else:
+            lines = [
+                str(row[0])
+                for row in connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).all()
+            ]
+            scans = {match.group(1) for line in lines for match in _POSTGRES_SCAN.finditer(line)}
+    return scans, "\n".join(lines)
+
+
+def plan_regressions(engine: Engine) -> list[str]:
+    """Return one message per hot query that fully scans a hot table."""
+
+    failures: list[str] = []
+    for name, (hot_tables, call) in HOT_QUERIES.items():
+        statements = captured_selects(engine, call)
+        assert statements, f"{name} sent no SELECT"
+        for statement, parameters in statements:
+            scans, plan = scanned_tables(engine, statement, parameters)
+            bad = scans & set(hot_tables)
+            if bad:
+                failures.append(f"{name}: full scan of {sorted(bad)}\n{plan}")
+    return failures
+
+
+def assert_schema_patch_declares_indexes() -> None:
+    """The index patch is idempotent and covers the hot filter columns."""
+
+    patch = (REPO_ROOT / "schema_index_patch.sql").read_text(encoding="utf-8")
+    statements = re.findall(r"CREATE INDEX[^;]+", patch)
+    assert statements and all("IF NOT EXISTS" in statement for statement in statements)
+    for target in (
+        "water_observations(station, parameter)",
+        "water_observations(basin_id)",
+        "plant_solution_map(nbs_id)",
+        "standards(use_case",
+    ):
+        assert target in patch, target
+
+
+def assert_detector_flags_missing_indexes() -> None:
+    """Without the patch the harness must report full scans."""
+
+    failures = plan_regressions(sqlite_engine(with_patch=False))
+    assert any(failure.startswith("standards.for_use_case") for failure in failures), failures
+    assert any(failure.startswith("plants.for_nbs:") for failure in failures), failures
+
+
+def assert_hot_queries_use_indexes() -> None:
+    """With every schema index applied, no hot query scans a hot table."""
+
+    failures = plan_regressions(sqlite_engine())
+    assert not failures, "\n\n".join(failures)
+
+
+def assert_external_database_plans() -> None:
+    """Check plans on a local/dev database when QUERY_PLAN_DATABASE_URL is set."""
+
+    database_url = os.getenv("QUERY_PLAN_DATABASE_URL", "")
+    if not database_url:
+        return
+    lowered = database_url.lower()
+    if not any(marker in lowered for marker in ("sqlite:///", "localhost", "127.0.0.1", "_dev", "_test")):
+        print("QUERY_PLAN_DATABASE_URL is not a local/dev database; skipped.")
+        return
+    engine = create_engine(database_url)
+    try:
+        failures = plan_regressions(engine)
+    finally:
+        engine.dispose()
+    assert not failures, "\n\n".join(failures)
+
+
+def main() -> None:
+    """Run all query-plan checks."""
+
+    assert_schema_patch_declares_indexes()
+    assert_detector_flags_missing_indexes()
+    assert_hot_queries_use_indexes()
+    assert_external_database_plans()
+    print(f"query plan checks ok: {len(HOT_QUERIES)} hot repository queries use indexes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+r"""Checks for JSON logging, request IDs and request summary lines.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\request_logging_test.py
+
+These tests start the app with `REQUEST_LOGGING_ENABLED=true` and `get_db`
+overridden by an in-memory SQLite database holding the synthetic dataset.
+They do not connect to Azure, mutate data, or add scientific values.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import queue
+import sys
+
+os.environ["REQUEST_LOGGING_ENABLED"] = "true"
+
+try:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError as exc:
+    print(
+        "request logging test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+from app.api.request_logging import RequestLoggingMiddleware, should_log_request
+from app.core.logging import (
+    ContextQueueHandler,
+    add_request_context,
+    configure_logging,
+    reset_request_context,
+    start_request_context,
+    stop_logging,
+)
+from query_budget import RECOMMEND_BODY, clear_service_caches
+from query_budget_test import synthetic_client, synthetic_engine
+
+
+class _Capture(logging.Handler):
+    """Keep emitted log records in memory."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def assert_json_lines_carry_request_id() -> None:
+    """Queued records become JSON lines with extras and the request ID."""
+
+    root = logging.getLogger()
+    saved_handlers, saved_level, saved_stderr = root.handlers[:], root.level, sys.stderr
+    stream = io.StringIO()
+    stop_logging()
+    root.handlers = []
+    sys.stderr = stream
+    try:
+        configure_logging("INFO", "json")
+        logger = logging.getLogger("app.test.json")
+        token = start_request_context("req-1")
+        logger.info("rows=%s", 3, extra={"table": "plants"})
+        reset_request_context(token)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        stop_logging()
+    finally:
+        sys.stderr = saved_stderr
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+
+    first, second = (json.loads(line) for line in stream.getvalue().splitlines())
+    assert first["message"] == "rows=3" and first["level"] == "INFO"
+    assert first["logger"] == "app.test.json" and first["time"].endswith("Z")
+    assert first["request_id"] == "req-1" and first["table"] == "plants"
+    assert "request_id" not in second
+    assert "ValueError: boom" in second["exception"]
+
+
+def assert_queue_handler_resolves_records_early() -> None:
+    """Messages, exceptions and the request ID are fixed before queueing."""
+
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = ContextQueueHandler(records)
+    token = start_request_context("req-2")
+    try:
+        raise KeyError("missing")
+    except KeyError:
+        record = logging.getLogger("app.test").makeRecord(
+            "app.test", logging.ERROR, __file__, 1, "value %s", ("x",), sys.exc_info()
+        )
+        handler.handle(record)
+    reset_request_context(token)
+
+    queued = records.get_nowait()
+    assert queued.getMessage() == "value x" and queued.args is None
+    assert queued.exc_info is None and "KeyError" in queued.exc_text
+    assert queued.request_id == "req-2"
+
+
+def assert_sampling_keeps_errors_and_slow_requests() -> None:
+    """Errors and slow requests are always logged; others follow the rate."""
+
+    assert should_log_request(500, 1.0, sample_rate=0.0, slow_ms=100)
+    assert should_log_request(404, 1.0, sample_rate=0.0, slow_ms=100)
+    assert should_log_request(200, 150.0, sample_rate=0.0, slow_ms=100)
+    assert not should_log_request(200, 1.0, sample_rate=0.0, slow_ms=100)
+    assert should_log_request(200, 1.0, sample_rate=1.0, slow_ms=100)
+
+    sampled_app = FastAPI()
+    sampled_app.add_middleware(RequestLoggingMiddleware, sample_rate=0.0, slow_ms=60_000)
+
+    @sampled_app.get("/items/{item_id}")
+    def item(item_id: int) -> dict[str, int]:
+        add_request_context(rows=item_id)
+        return {"item_id": item_id}
+
+    logger = logging.getLogger("app.request")
+    capture = _Capture()
+    logger.addHandler(capture)
+    try:
+        client = TestClient(sampled_app)
+        response = client.get("/items/4", headers={"X-Request-ID": "bad id with spaces"})
+        assert client.get("/missing").status_code == 404
+    finally:
+        logger.removeHandler(capture)
+
+    assert response.status_code == 200
+    assert len(response.headers["X-Request-ID"]) == 32
+    assert [record.status for record in capture.records] == [404]
+    assert capture.records[0].route == "unmatched"
+
+
+def assert_recommend_summary_has_request_context() -> None:
+    """One summary line per request with route, workflow step and cache results."""
+
+    engine = synthetic_engine()
+    clear_service_caches()
+    logger = logging.getLogger("app.request")
+    capture = _Capture()
+    logger.addHandler(capture)
+    try:
+        with synthetic_client(engine, NBS_CATALOG_SNAPSHOT_ENABLED="true") as client:
+            response = client.post(
+                "/api/v1/recommend",
+                json=RECOMMEND_BODY,
+                headers={"X-Request-ID": "trace-42"},
+            )
+            plant = client.get("/api/v1/plants/5")
+    finally:
+        logger.removeHandler(capture)
+        engine.dispose()
+
+    assert response.status_code == 200 and plant.status_code == 200
+    assert response.headers["X-Request-ID"] == "trace-42"
+    recommend, plant_line = capture.records
+    assert recommend.getMessage().startswith("POST /api/v1/recommend 200 ")
+    assert recommend.request_id == "trace-42"
+    assert recommend.route == "/api/v1/recommend" and recommend.status == 200
+    assert recommend.workflow_status == "completed" and recommend.step_completed == "L"
+    assert recommend.cache == {"nbs_catalog_snapshot": "miss"}
+    assert recommend.recommendations >= 0
+    assert recommend.sql_statements > 0 and recommend.duration_ms > 0
+    assert plant_line.route == "/api/v1/plants/{plant_id}"
+    assert plant_line.request_id == plant.headers["X-Request-ID"] != "trace-42"
+    assert not hasattr(plant_line, "workflow_status")
+
+
+def main() -> None:
+    """Run all request logging checks."""
+
+    assert_json_lines_carry_request_id()
+    assert_queue_handler_resolves_records_early()
+    assert_sampling_keeps_errors_and_slow_requests()
+    assert_recommend_summary_has_request_context()
+    print("request logging checks ok: JSON lines tagged with request IDs and context")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+r"""Checks for exporting and reading the local read-only snapshot.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\snapshot_test.py
+
+These tests copy fake rows from an in-memory SQLite database into a snapshot
+file in a temporary folder. They do not connect to Azure, do not need
+production data, and do not add scientific values.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.db.schema_indexes import schema_index_statements
+from app.db.session import get_engine
+from app.db.snapshot import create_snapshot_engine, export_snapshot, read_snapshot_info
+from app.models import NbsOption, Plant, PlantSolutionMap, Source, WaterObservation
+from app.repositories import PlantRepository, WaterRepository
+
+
+def source_engine() -> Engine:
+    """Create an in-memory source database with a few fake rows."""
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Source(id=1, short="fake source"))
+        session.add(NbsOption(id=10, solution="Fake Wetland", source_id=1))
+        session.add_all([
+            Plant(id=1, plant_species="Fake reed", invasive=0),
+            Plant(id=2, plant_species="Fake weed", invasive=1),
+        ])
+        session.add_all([
+            PlantSolutionMap(id=1, plant_id=1, nbs_id=10),
+            PlantSolutionMap(id=2, plant_id=2, nbs_id=10),
+        ])
+        session.add_all([
+            WaterObservation(id=i, station="Station A", parameter=f"P{i}", value_mean=float(i))
+            for i in range(1, 6)
+        ])
+        session.commit()
+    return engine
+
+
+def assert_export_copies_rows_and_metadata(path: Path) -> None:
+    """Every table is copied and row counts are recorded in the file."""
+
+    counts = export_snapshot(source_engine(), path, batch_size=2)
+    assert counts["water_observations"] == 5
+    assert counts["plants"] == 2
+    assert not path.with_name(path.name + ".partial").exists()
+
+    engine = create_snapshot_engine(path)
+    try:
+        info = read_snapshot_info(engine)
+        with engine.connect() as connection:
+            indexes = set(connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            ).scalars())
+    finally:
+        engine.dispose()
+    assert info["rows.water_observations"] == "5"
+    assert info["source_dialect"] == "sqlite"
+
+    expected = {
+        re.search(r"IF NOT EXISTS (\w+)", statement).group(1)
+        for statement in schema_index_statements()
+    }
+    assert expected and expected <= indexes, sorted(expected - indexes)
+
+
+def assert_repositories_read_snapshot(path: Path) -> None:
+    """Repositories work unchanged against the snapshot engine."""
+
+    engine = create_snapshot_engine(path)
+    try:
+        with Session(engine) as session:
+            observations = WaterRepository(session).get_observations_by_station("Station A")
+            plants = PlantRepository(session).get_plants_for_nbs(10)
+        with engine.connect() as connection:
+            try:
+                connection.execute(text("DELETE FROM plants"))
+            except OperationalError:
+                pass
+            else:
+                raise AssertionError("snapshot accepted a write")
+    finally:
+        engine.dispose()
+
+    assert [row.parameter for row in observations] == ["P1", "P2", "P3", "P4", "P5"]
+    assert [plant.plant_species for plant in plants] == ["Fake reed"]
+
+
+def assert_database_mode_switches_engine(path: Path) -> None:
+    """DATABASE_MODE=snapshot makes get_engine() open the snapshot file."""
+
+    previous = {key: os.environ.get(key) for key in ("DATABASE_MODE", "SNAPSHOT_PATH")}
+    os.environ["DATABASE_MODE"] = "snapshot"
+    os.environ["SNAPSHOT_PATH"] = str(path)
+    get_settings.cache_clear()
+    get_engine.cache_clear()
+    try:
+        engine = get_engine()
+        assert "immutable=1" in str(engine.url)
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM plants")).scalar_one() == 2
+        engine.dispose()
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        get_settings.cache_clear()
+        get_engine.cache_clear()
+
+
+def assert_missing_snapshot_is_reported(folder: Path) -> None:
+    """A missing file raises the same RuntimeError type as a missing URL."""
+
+    try:
+        create_snapshot_engine(folder / "missing.db")
+    except RuntimeError as exc:
+        assert "Snapshot file" in str(exc)
+    else:
+        raise AssertionError("missing snapshot did not raise")
+
+
+def main() -> None:
+    """Run all snapshot checks."""
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "snapshot.db"
+        assert_export_copies_rows_and_metadata(path)
+        assert_repositories_read_snapshot(path)
+        assert_database_mode_switches_engine(path)
+        assert_missing_snapshot_is_reported(Path(folder))
+        # Re-exporting replaces the read-only file in place.
+        export_snapshot(source_engine(), path)
+    print("snapshot checks ok: reference tables served from a local read-only file")
+
+
+if __name__ == "__main__":
+    main()
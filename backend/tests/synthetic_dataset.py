@@ -0,0 +1,614 @@
+r"""Deterministic synthetic dataset shaped like the Narmada NbS database.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\synthetic_dataset.py --database-url sqlite:///synthetic_narmada.db --scale 4
+
+The generator fills every table in `schema.sql` and
+`schema_river_network_patch.sql` with consistent fake rows:
+
+- stations belong to basins
+- observations, site attributes and pollution sources point at real stations
+- removal, implementation, footprint, criteria and plant-map rows point at real
+  NbS options and plants
+- river segments form one tree per basin through `next_down`, with Strahler
+  order, upstream area and distances derived from that tree
+- each station is snapped to a segment, and `site_stream_attributes` and
+  `site_attributes.stream_order` agree with it
+
+`--scale` multiplies stations, NbS options, plants and river segments. The
+same `--seed` always produces the same rows. Tables are created from the
+models and the `CREATE INDEX` statements in the schema files when missing.
+Pass `--replace` to delete existing rows first.
+
+Every value is drawn at random for load testing. None of it is scientific data,
+and the generator must never be pointed at the production database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from typing import Any
+
+from sqlalchemy import create_engine, delete, insert
+from sqlalchemy.engine import Engine
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.db.base import Base
+from app.db.schema_indexes import SCHEMA_FILES, schema_index_statements
+
+DEFAULT_SEED = 2026
+DEFAULT_BATCH_SIZE = 5000
+
+# Row counts at scale 1. Parameters, use cases and periods stay fixed so the
+# per-station shape matches the production tables.
+BASE_STATIONS = 50
+BASE_NBS_OPTIONS = 60
+BASE_PLANTS = 400
+BASE_RIVER_SEGMENTS = 2000
+BASINS = 8
+SOURCES = 60
+PERIODS = ("2017", "2018", "2019", "2020", "2021", "2022")
+HYDRORIVERS_SOURCE_ID = 56
+
+STATES = ("Madhya Pradesh", "Gujarat", "Maharashtra")
+# (name, unit, synthetic low, synthetic high, standard limit kind)
+PARAMETERS = (
+    ("BOD", "mg/L", 0.5, 30.0, "max"),
+    ("COD", "mg/L", 5.0, 120.0, "max"),
+    ("TSS", "mg/L", 2.0, 300.0, "max"),
+    ("turbidity", "NTU", 1.0, 200.0, "max"),
+    ("nitrate", "mg/L", 0.1, 40.0, "max"),
+    ("phosphate", "mg/L", 0.01, 3.0, "max"),
+    ("ammonia", "mg/L", 0.01, 5.0, "max"),
+    ("total_nitrogen", "mg/L", 0.5, 30.0, "max"),
+    ("fecal_coliform", "MPN/100mL", 10.0, 50000.0, "max"),
+    ("total_coliform", "MPN/100mL", 50.0, 200000.0, "max"),
+    ("EC", "uS/cm", 100.0, 3000.0, "max"),
+    ("TDS", "mg/L", 50.0, 2000.0, "max"),
+    ("chloride", "mg/L", 5.0, 600.0, "max"),
+    ("iron", "mg/L", 0.01, 3.0, "max"),
+    ("lead", "mg/L", 0.001, 0.2, "max"),
+    ("chromium", "mg/L", 0.001, 0.2, "max"),
+    ("cadmium", "mg/L", 0.0005, 0.05, "max"),
+    ("arsenic", "mg/L", 0.001, 0.1, "max"),
+    ("pH", "pH units", 6.0, 9.0, "range"),
+    ("DO", "mg/L", 1.0, 10.0, "min"),
+)
+USE_CASES = (
+    "surface_discharge",
+    "irrigation",
+    "drinking_source",
+    "bathing",
+    "industrial_reuse",
+    "groundwater_recharge",
+)
+WATER_TYPES = ("domestic wastewater", "greywater", "stormwater", "agricultural runoff", "river water")
+NBS_FAMILIES = ("Constructed wetland", "Pond system", "Vegetated channel", "Infiltration", "Riparian buffer")
+CRITERIA = ("cost", "O&M simplicity", "maintenance", "co-benefits", "land requirement", "complexity")
+QUALITATIVE = ("low", "medium", "high")
+LAND_COVER = ("cropland", "tree cover", "built-up", "grassland", "shrubland")
+SOIL_TYPES = ("clay loam", "sandy loam", "loam", "silty clay", "black cotton soil")
+
+
+def scaled(count: int, scale: float) -> int:
+    """Return a row count multiplied by `scale`, never below one."""
+
+    return max(1, round(count * scale))
+
+
+# River network
+
+
+def river_network_rows(
+    rng: random.Random,
+    segment_count: int,
+    basin_count: int,
+) -> list[dict[str, Any]]:
+    """Build one binary river tree per basin with derived HydroRIVERS attributes.
+
+    Segments are generated outlet first, so a segment's downstream neighbour
+    always has a smaller index. Attributes that depend on upstream segments
+    are then filled in one reverse pass.
+    """
+
+    rows: list[dict[str, Any]] = []
+    per_basin = [segment_count // basin_count] * basin_count
+    for index in range(segment_count % basin_count):
+        per_basin[index] += 1
+
+    for basin_index, count in enumerate(per_basin):
+        if count == 0:
+            continue
+        first = len(rows)
+        outlet_lon = 72.6 + basin_index * 1.1
+        outlet_lat = 21.6 + (basin_index % 3) * 0.6
+        children: dict[int, list[int]] = {}
+        for local in range(count):
+            position = first + local
+            if local == 0:
+                parent = None
+                lon, lat = outlet_lon, outlet_lat
+            else:
+                open_parents = [
+                    candidate
+                    for candidate in range(max(first, position - 64), position)
+                    if len(children.get(candidate, [])) < 2
+                ]
+                parent = rng.choice(open_parents)
+                children.setdefault(parent, []).append(position)
+                lon = rows[parent]["_lon"] + rng.uniform(0.01, 0.06)
+                lat = rows[parent]["_lat"] + rng.uniform(-0.03, 0.03)
+            rows.append(
+                {
+                    "id": position + 1,
+                    "hyriv_id": 40_000_000 + position + 1,
+                    "_basin": basin_index + 1,
+                    "_parent": parent,
+                    "_lon": round(lon, 5),
+                    "_lat": round(lat, 5),
+                    "length_km": round(rng.uniform(0.8, 9.0), 2),
+                    "catch_skm": round(rng.uniform(4.0, 60.0), 2),
+                    "endorheic": 0,
+                    "hybas_l12": 4_120_000_000 + basin_index * 1000,
+                    "source_id": HYDRORIVERS_SOURCE_ID,
+                }
+            )
+
+        basin_rows = range(first, first + count)
+        for position in reversed(basin_rows):
+            row = rows[position]
+            upstream = [rows[child] for child in children.get(position, [])]
+            row["upland_skm"] = round(row["catch_skm"] + sum(r["upland_skm"] for r in upstream), 2)
+            row["dist_up_km"] = round(
+                max((r["dist_up_km"] + r["length_km"] for r in upstream), default=0.0), 2
+            )
+            orders = sorted((r["ord_stra"] for r in upstream), reverse=True)
+            if not orders:
+                row["ord_stra"] = 1
+            elif len(orders) > 1 and orders[0] == orders[1]:
+                row["ord_stra"] = orders[0] + 1
+            else:
+                row["ord_stra"] = orders[0]
+            row["dis_av_cms"] = round(row["upland_skm"] * 0.012, 3)
+            row["ord_flow"] = min(10, max(1, 6 - math.floor(math.log10(max(row["dis_av_cms"], 1e-6)))))
+
+        outlet = rows[first]
+        for position in basin_rows:
+            row = rows[position]
+            parent = row["_parent"]
+            if parent is None:
+                row.update(next_down=0, dist_dn_km=0.0, ord_clas=1)
+            else:
+                down = rows[parent]
+                siblings = [rows[child] for child in children[parent]]
+                main_stem = max(siblings, key=lambda r: (r["upland_skm"], -r["id"]))
+                row["next_down"] = down["hyriv_id"]
+                row["dist_dn_km"] = round(down["dist_dn_km"] + down["length_km"], 2)
+                row["ord_clas"] = down["ord_clas"] + (0 if row is main_stem else 1)
+                row["hybas_l12"] = down["hybas_l12"] + (1 if row["ord_clas"] > down["ord_clas"] else 0)
+            row["main_riv"] = outlet["hyriv_id"]
+            end = rows[parent] if parent is not None else row
+            row["geometry_wkt"] = (
+                f"LINESTRING ({row['_lon']} {row['_lat']}, {end['_lon']} {end['_lat']})"
+            )
+    return rows
+
+
+# Dataset
+
+
+def generate_dataset(scale: float = 1.0, seed: int = DEFAULT_SEED) -> dict[str, list[dict[str, Any]]]:
+    """Return synthetic rows for every model table, keyed by table name."""
+
+    rng = random.Random(seed)
+    station_count = scaled(BASE_STATIONS, scale)
+    option_count = scaled(BASE_NBS_OPTIONS, scale)
+    plant_count = scaled(BASE_PLANTS, scale)
+    segment_count = max(BASINS, scaled(BASE_RIVER_SEGMENTS, scale))
+
+    data: dict[str, list[dict[str, Any]]] = {}
+    data["sources"] = [
+        {
+            "id": i,
+            "short": "HydroRIVERS_v10_HydroSHEDS" if i == HYDRORIVERS_SOURCE_ID else f"Synthetic source {i}",
+            "citation": f"Synthetic citation {i} (load-test data, not a real reference).",
+            "type": "synthetic",
+            "url": None,
+            "license": "synthetic",
+        }
+        for i in range(1, SOURCES + 1)
+    ]
+    data["basins"] = [
+        {
+            "id": i,
+            "basin": "Narmada",
+            "sub_basin": f"Synthetic sub-basin {i}",
+            "description": "Synthetic basin for load testing.",
+            "source_id": 1,
+        }
+        for i in range(1, BASINS + 1)
+    ]
+
+    segments = river_network_rows(rng, segment_count, BASINS)
+    segments_by_basin: dict[int, list[dict[str, Any]]] = {}
+    for segment in segments:
+        segments_by_basin.setdefault(segment["_basin"], []).append(segment)
+
+    regions, observations, site_attributes, stream_attributes, pollution = [], [], [], [], []
+    for i in range(1, station_count + 1):
+        basin_id = (i - 1) % BASINS + 1
+        state = STATES[basin_id % len(STATES)]
+        district = f"Synthetic District {(i - 1) // 4 + 1}"
+        station = f"Station {i}"
+        gauge_id = 10_000 + i
+        segment = rng.choice(segments_by_basin[basin_id])
+        lon = round(segment["_lon"] + rng.uniform(-0.004, 0.004), 5)
+        lat = round(segment["_lat"] + rng.uniform(-0.004, 0.004), 5)
+        distance_deg = math.hypot(lon - segment["_lon"], lat - segment["_lat"])
+        sand = rng.randint(10, 70)
+        silt = rng.randint(5, 100 - sand - 5)
+        regions.append(
+            {
+                "id": i,
+                "camels_gauge_id": gauge_id,
+                "station": station,
+                "river": f"Synthetic river {basin_id}",
+                "district": district,
+                "cwc_site_type": rng.choice(["GDSQ", "GDQ", "WQ"]),
+                "is_wq_station": 1,
+                "rainfall_mm_yr": round(rng.uniform(600.0, 1800.0), 1),
+                "wet_season": "Jun-Sep",
+                "dry_season": "Oct-May",
+                "tmin_C": round(rng.uniform(8.0, 16.0), 1),
+                "tmax_C": round(rng.uniform(36.0, 45.0), 1),
+                "aridity_P_PET": round(rng.uniform(0.4, 1.2), 3),
+                "pet_mm_yr": round(rng.uniform(1200.0, 1900.0), 1),
+                "sand_pct": sand,
+                "silt_pct": silt,
+                "clay_pct": 100 - sand - silt,
+                "soil_type": rng.choice(SOIL_TYPES),
+                "hydrologic_soil_group": rng.choice("ABCD"),
+                "soil_depth_m": round(rng.uniform(0.5, 2.5), 2),
+                "soil_avail_water_mm_m": rng.randint(60, 200),
+                "basin_id": basin_id,
+                "source_climate_soil": 2,
+                "source_district": 3,
+                "infiltration_class": rng.choice(QUALITATIVE),
+                "lat": lat,
+                "lon": lon,
+            }
+        )
+        for parameter, unit, low, high, _kind in PARAMETERS:
+            for period in PERIODS:
+                value = rng.uniform(low, high)
+                observations.append(
+                    {
+                        "station": station,
+                        "district": district,
+                        "state": state,
+                        "cwc_code": f"SYN{i:05d}",
+                        "parameter": parameter,
+                        "unit": unit,
+                        "value_mean": round(value, 4),
+                        "value_min": round(value * rng.uniform(0.5, 0.95), 4),
+                        "value_max": round(value * rng.uniform(1.05, 1.8), 4),
+                        "n_samples": rng.randint(4, 24),
+                        "period": period,
+                        "basin_id": basin_id,
+                        "source_id": 4,
+                    }
+                )
+        stream_attributes.append(
+            {
+                "region_id": i,
+                "gauge_id": gauge_id,
+                "station": station,
+                "ghi_stn_id": f"GHI{gauge_id}",
+                "cwc_river": f"Synthetic river {basin_id}",
+                "stream_order": segment["ord_stra"],
+                "ord_clas": segment["ord_clas"],
+                "ord_flow": segment["ord_flow"],
+                "river_discharge_cms": segment["dis_av_cms"],
+                "upland_skm": segment["upland_skm"],
+                "catch_skm": segment["catch_skm"],
+                "nearest_distance_deg": round(distance_deg, 6),
+                "nearest_distance_m": round(distance_deg * 111_000.0, 1),
+                "station_lon": lon,
+                "station_lat": lat,
+                "nearest_lon": segment["_lon"],
+                "nearest_lat": segment["_lat"],
+                "hybas_l12": segment["hybas_l12"],
+                "source_id": HYDRORIVERS_SOURCE_ID,
+            }
+        )
+        fractions = [rng.random() for _ in range(6)]
+        total = sum(fractions)
+        water, trees, agri, builtup, bare, range_frac = (round(f / total, 4) for f in fractions)
+        elev_min = rng.randint(20, 400)
+        site_attributes.append(
+            {
+                "region_id": i,
+                "gauge_id": gauge_id,
+                "station": station,
+                "elev_mean": round(elev_min + rng.uniform(50.0, 400.0), 1),
+                "elev_min": elev_min,
+                "elev_max": elev_min + rng.randint(500, 900),
+                "slope_mean": round(rng.uniform(0.5, 12.0), 2),
+                "slope_median": round(rng.uniform(0.3, 10.0), 2),
+                "drainage_area_km2": segment["upland_skm"],
+                "dpsbar": round(rng.uniform(5.0, 120.0), 2),
+                "water_frac": water,
+                "trees_frac": trees,
+                "agri_frac": agri,
+                "builtup_frac": builtup,
+                "bare_frac": bare,
+                "range_frac": range_frac,
+                "dom_land_cover": rng.choice(LAND_COVER),
+                "lai_mean": round(rng.uniform(0.5, 3.5), 2),
+                "stream_order": float(segment["ord_stra"]),
+                "dilution_proxy": round(segment["dis_av_cms"] / rng.uniform(1.0, 50.0), 4),
+                "source_id": 5,
+            }
+        )
+        for _ in range(rng.randint(3, 6)):
+            pollution.append(
+                {
+                    "region_id": i,
+                    "gauge_id": gauge_id,
+                    "station": station,
+                    "source_type": rng.choice(["point", "non-point"]),
+                    "category": rng.choice(["domestic", "industrial", "agricultural"]),
+                    "indicator": rng.choice(["population", "sewage_generation", "fertilizer_use"]),
+                    "value": round(rng.uniform(1.0, 50_000.0), 2),
+                    "unit": rng.choice(["persons", "MLD", "t/yr"]),
+                    "note": "Synthetic pollution indicator.",
+                    "source_id": 6,
+                }
+            )
+
+    data["regions"] = regions
+    data["water_observations"] = observations
+    data["site_attributes"] = site_attributes
+    data["site_stream_attributes"] = stream_attributes
+    data["pollution_sources"] = pollution
+    data["river_network"] = [
+        {key: value for key, value in segment.items() if not key.startswith("_")}
+        for segment in segments
+    ]
+
+    standards = []
+    for use_case in USE_CASES:
+        for parameter, unit, low, high, kind in PARAMETERS:
+            limit = round(low + (high - low) * rng.uniform(0.2, 0.5), 4)
+            standards.append(
+                {
+                    "use_case": use_case,
+                    "parameter": parameter,
+                    "limit_low": limit if kind in {"min", "range"} else None,
+                    "limit_high": round(high * 0.9, 4) if kind == "range" else (limit if kind == "max" else None),
+                    "direction": kind,
+                    "unit": unit,
+                    "source_id": 7,
+                    "note": "Synthetic limit for load testing.",
+                }
+            )
+    data["standards"] = standards
+    data["water_type_profiles"] = [
+        {
+            "water_type": water_type,
+            "parameter": parameter,
+            "value_low": round(low, 4),
+            "value_high": round(rng.uniform(low, high), 4),
+            "unit": unit,
+            "note": "Synthetic profile.",
+            "deprecated": 0,
+            "source_id": 8,
+        }
+        for water_type in WATER_TYPES
+        for parameter, unit, low, high, _kind in PARAMETERS[:10]
+    ]
+
+    data["plants"] = [
+        {
+            "id": i,
+            "plant_species": f"Synthetic species {i}",
+            "locational_availability": rng.choice(["common", "regional", "rare"]),
+            "climate_preference": rng.choice(["tropical", "subtropical", "semi-arid"]),
+            "soil_type": rng.choice(SOIL_TYPES),
+            "water_needs": rng.choice(QUALITATIVE),
+            "ecological_role": rng.choice(["phytoremediation", "bank stabilisation", "habitat"]),
+            "plant_type": rng.choice(["emergent", "floating", "shrub", "grass", "tree"]),
+            "native_status": rng.choice(["native", "naturalised"]),
+            "invasive": int(rng.random() < 0.08),
+            "metals_pollutants": rng.choice([None, "lead", "cadmium", "chromium"]),
+            "evidence_note": "Synthetic evidence note.",
+            "pollution_tolerance": rng.choice(QUALITATIVE),
+            "optimal_water_type": rng.choice(WATER_TYPES),
+            "source_id": rng.randint(9, 30),
+        }
+        for i in range(1, plant_count + 1)
+    ]
+
+    options, removal, implementation, footprint, criteria, plant_map = [], [], [], [], [], []
+    parameter_names = [parameter for parameter, *_rest in PARAMETERS]
+    for i in range(1, option_count + 1):
+        family = NBS_FAMILIES[(i - 1) % len(NBS_FAMILIES)]
+        solution = f"{family} {i}"
+        source_id = rng.randint(31, SOURCES)
+        options.append(
+            {
+                "id": i,
+                "solution": solution,
+                "family": family,
+                "description": f"Synthetic {family.lower()} option for load testing.",
+                "optimal_water_type": rng.choice(WATER_TYPES),
+                "location_suitability": round(rng.random(), 3) if rng.random() < 0.8 else None,
+                "climate_suitability": rng.choice(["tropical", "semi-arid", None]),
+                "soil_type": round(rng.random(), 3) if rng.random() < 0.7 else None,
+                "resource_requirements": round(rng.random(), 3),
+                "notes": None,
+                "source_id": source_id,
+            }
+        )
+        for parameter in rng.sample(parameter_names, k=rng.randint(3, 8)):
+            eff_low = round(rng.uniform(5.0, 70.0), 1)
+            numeric = rng.random() < 0.85
+            removal.append(
+                {
+                    "nbs": solution,
+                    "nbs_id": i,
+                    "parameter": parameter,
+                    "eff_low": eff_low if numeric else None,
+                    "eff_high": round(min(99.0, eff_low + rng.uniform(5.0, 30.0)), 1) if numeric else None,
+                    "confidence": rng.choice(QUALITATIVE),
+                    "source_id": source_id,
+                    "note": "Synthetic removal range.",
+                }
+            )
+        implementation.append(
+            {
+                "nbs_id": i,
+                "solution": solution,
+                "implementation_steps": "Synthetic steps: survey, excavate, plant, commission.",
+                "maintenance_requirements": rng.choice(
+                    ["Inspect monthly.", "Desludge yearly.", "Harvest vegetation seasonally."]
+                ),
+                "source_id": source_id,
+            }
+        )
+        low = round(rng.uniform(0.5, 4.0), 2)
+        footprint.append(
+            {
+                "nbs_id": i,
+                "area_per_pe_low": low,
+                "area_per_pe_high": round(low + rng.uniform(0.5, 5.0), 2),
+                "olr_g_m2_d": round(rng.uniform(2.0, 20.0), 2),
+                "olr_basis": "BOD",
+                "hlr_m3_m2_d": round(rng.uniform(0.02, 0.3), 3),
+                "depth_m": round(rng.uniform(0.3, 1.5), 2),
+                "source_id": source_id,
+                "note": "Synthetic footprint.",
+            }
+        )
+        for criterion in rng.sample(CRITERIA, k=rng.randint(3, len(CRITERIA))):
+            criteria.append(
+                {
+                    "nbs_id": i,
+                    "criterion": criterion,
+                    "value_qual": rng.choice(QUALITATIVE),
+                    "confidence": rng.choice(["literature", "expert", "low"]),
+                    "source_id": source_id,
+                }
+            )
+        for plant_id in rng.sample(range(1, plant_count + 1), k=min(plant_count, rng.randint(5, 15))):
+            plant_map.append(
+                {
+                    "plant_id": plant_id,
+                    "plant_species": data["plants"][plant_id - 1]["plant_species"],
+                    "nbs_id": i,
+                    "solution": solution,
+                    "basis": "Synthetic explicit mapping.",
+                    "source_id": source_id,
+                }
+            )
+    data["nbs_options"] = options
+    data["removal_efficiency"] = removal
+    data["nbs_implementation"] = implementation
+    data["nbs_footprint"] = footprint
+    data["nbs_criteria"] = criteria
+    data["plant_solution_map"] = plant_map
+
+    for name, rows in data.items():
+        if rows and "id" not in rows[0]:
+            for row_id, row in enumerate(rows, start=1):
+                row["id"] = row_id
+    return data
+
+
+# Writing
+
+
+def create_schema(engine: Engine, files: tuple[str, ...] = SCHEMA_FILES) -> None:
+    """Create missing tables from the models and apply the schema files' indexes."""
+
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for statement in schema_index_statements(files):
+            connection.exec_driver_sql(statement)
+
+
+def write_dataset(
+    engine: Engine,
+    data: dict[str, list[dict[str, Any]]],
+    *,
+    replace: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[str, int]:
+    """Insert generated rows in foreign-key order inside one transaction."""
+
+    tables = [table for table in Base.metadata.sorted_tables if table.name in data]
+    counts: dict[str, int] = {}
+    with engine.begin() as connection:
+        if replace:
+            for table in reversed(tables):
+                connection.execute(delete(table))
+        for table in tables:
+            rows = data[table.name]
+            for start in range(0, len(rows), batch_size):
+                connection.execute(insert(table), rows[start:start + batch_size])
+            counts[table.name] = len(rows)
+        if engine.dialect.name in {"sqlite", "postgresql"}:
+            connection.exec_driver_sql("ANALYZE")
+    return counts
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Generate a synthetic dataset into SQLite or a local PostgreSQL database."""
+
+    parser = argparse.ArgumentParser(description="Write a synthetic Narmada NbS dataset.")
+    parser.add_argument(
+        "--database-url",
+        required=True,
+        help="Target database, e.g. sqlite:///synthetic_narmada.db. Never production.",
+    )
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--replace", action="store_true", help="Delete existing rows first.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+    if args.scale <= 0:
+        parser.error("--scale must be positive")
+
+    from app.db.session import _connect_args, _normalize_database_url
+
+    url = _normalize_database_url(args.database_url)
+    engine = create_engine(url, connect_args=_connect_args(url))
+    started = time.perf_counter()
+    try:
+        create_schema(engine)
+        counts = write_dataset(
+            engine,
+            generate_dataset(args.scale, args.seed),
+            replace=args.replace,
+            batch_size=args.batch_size,
+        )
+    finally:
+        engine.dispose()
+
+    for name, count in counts.items():
+        print(f"{name:<24} {count:>9} rows")
+    print(
+        f"Synthetic dataset (scale {args.scale:g}, seed {args.seed}) written in "
+        f"{time.perf_counter() - started:.1f}s ({sum(counts.values())} rows)."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
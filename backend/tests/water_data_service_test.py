@@ -0,0 +1,177 @@
+r"""Query-count tests for the WaterDataService station parameter fetch.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\water_data_service_test.py
+
+These tests use an in-memory SQLite database with a few fake observation rows.
+They do not connect to Azure, do not need production data, and do not compare
+observations with standards.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+except ModuleNotFoundError as exc:
+    print(
+        "water data service test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+from app import models  # noqa: F401  # Import models so Base.metadata knows the tables.
+from app.db.base import Base
+from app.engines import InputNormalizationEngine, WaterInputAssemblyEngine
+from app.models import WaterObservation
+from app.services import WaterDataService
+
+
+def build_session() -> tuple[Session, list[str]]:
+    """Create a seeded in-memory session and a list that records SELECTs."""
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record_select(
+        _connection: object,
+        _cursor: object,
+        statement: str,
+        _parameters: object,
+        _context: object,
+        _executemany: bool,
+    ) -> None:
+        """Record every SELECT so tests can fix the query count."""
+
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    session = Session(engine)
+    session.add_all(
+        [
+            observation(1, "Station A", "BOD", 12.0),
+            observation(2, "Station A", "bod", 14.0),
+            observation(3, "Station A", "Total Nitrogen", 3.0),
+            observation(4, "Station A", "pH", 7.1),
+            observation(5, "Station A", "Iron", 0.4),
+            observation(6, "Station B", "BOD", 30.0),
+            observation(7, "Station A", "Total  Nitrogen", 3.2),
+            observation(8, "Station A", "total\tnitrogen", 3.4),
+        ]
+    )
+    session.commit()
+    statements.clear()
+    return session, statements
+
+
+def observation(row_id: int, station: str, parameter: str, value: float) -> WaterObservation:
+    """Build one fake water observation row."""
+
+    return WaterObservation(
+        id=row_id,
+        station=station,
+        parameter=parameter,
+        unit="mg/L",
+        value_mean=value,
+        source_id=4,
+    )
+
+
+def assert_many_parameters_use_one_query() -> None:
+    """A multi-parameter station fetch should cost one SELECT."""
+
+    session, statements = build_session()
+    service = WaterDataService(session)
+
+    grouped = service.get_observations_for_parameters(
+        "Station A",
+        ["BOD", "total-nitrogen", "pH", "Nitrate"],
+    )
+
+    assert len(statements) == 1, statements
+    assert [row["id"] for row in grouped["BOD"]] == [1, 2]
+    assert [row["id"] for row in grouped["total-nitrogen"]] == [3, 7, 8]
+    assert [row["id"] for row in grouped["pH"]] == [4]
+    assert grouped["Nitrate"] == []
+
+
+def assert_duplicate_keys_are_not_duplicated() -> None:
+    """Rows belong to the first requested name that shares their key."""
+
+    session, _statements = build_session()
+    grouped = WaterDataService(session).get_observations_for_parameters(
+        "Station A",
+        ["BOD", " bod "],
+    )
+
+    assert [row["id"] for row in grouped["BOD"]] == [1, 2]
+    assert grouped[" bod "] == []
+
+
+def assert_step_b_matches_filter_behavior() -> None:
+    """Step B selection should match the normalized-key filter exactly."""
+
+    session, statements = build_session()
+    context = InputNormalizationEngine().normalize(
+        use_case="surface_discharge",
+        station="Station A",
+        selected_parameters=[" bod ", "Total  Nitrogen", "IRON"],
+    )
+
+    bundle = WaterInputAssemblyEngine(WaterDataService(session)).assemble(context)
+    selected: list[dict[str, Any]] = bundle.observations
+
+    assert len(statements) == 1, statements
+    assert bundle.selected_source_type == "station_observations"
+    assert sorted(row["id"] for row in selected) == [1, 2, 3, 5, 7, 8]
+
+
+def assert_repeated_whitespace_matches_step_b_key() -> None:
+    """Stored names with repeated or tab whitespace fold to the Step B key."""
+
+    session, _statements = build_session()
+    grouped = WaterDataService(session).get_observations_for_parameters(
+        "Station A",
+        ["Total Nitrogen"],
+    )
+
+    assert [row["parameter"] for row in grouped["Total Nitrogen"]] == [
+        "Total Nitrogen",
+        "Total  Nitrogen",
+        "total\tnitrogen",
+    ]
+
+
+def assert_empty_parameters_skip_query() -> None:
+    """No requested parameters should not touch the database."""
+
+    session, statements = build_session()
+
+    assert WaterDataService(session).get_observations_for_parameters("Station A", []) == {}
+    assert statements == []
+
+
+def main() -> None:
+    """Run all WaterDataService query-count checks."""
+
+    assert_many_parameters_use_one_query()
+    assert_duplicate_keys_are_not_duplicated()
+    assert_step_b_matches_filter_behavior()
+    assert_repeated_whitespace_matches_step_b_key()
+    assert_empty_parameters_skip_query()
+    print("water data service checks ok: one query per station parameter fetch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+r"""Checks for the in-memory station/parameter water summary index.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\water_summary_index_test.py
+
+These tests use fake observation dictionaries. They do not connect to Azure,
+do not need production data, and do not compare values with standards.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.engines import InputNormalizationEngine, WaterInputAssemblyEngine
+from app.services import WaterSummaryIndex, build_station_parameter_summaries
+
+
+def history() -> list[dict[str, Any]]:
+    """Return several periods of fake station rows."""
+
+    return [
+        row(1, "Station A", "BOD", 10.0, 4.0, 18.0, 12, "2019-20", 4),
+        row(2, "Station A", "bod", 14.0, 6.0, 30.0, 10, "2021-22", 5),
+        row(3, "Station A", "BOD", 12.0, None, None, None, "2020-21", 4),
+        row(4, "Station A", "pH", 7.2, 6.9, 7.8, 12, "2021-22", 5),
+        row(5, "Station A", "TDS", 300.0, 250.0, 350.0, 4, "2021-22", 5, unit="ppm"),
+        row(6, "Station A", "TDS", 320.0, 280.0, 360.0, 4, "2021-22", 5),
+        row(7, "Station B", "BOD", 30.0, 20.0, 40.0, 8, "2021-22", 6),
+    ]
+
+
+def row(
+    row_id: int,
+    station: str,
+    parameter: str,
+    mean: float,
+    minimum: float | None,
+    maximum: float | None,
+    samples: int | None,
+    period: str,
+    source_id: int,
+    *,
+    unit: str = "mg/L",
+) -> dict[str, Any]:
+    """Build one raw observation dictionary."""
+
+    return {
+        "id": row_id,
+        "station": station,
+        "parameter": parameter,
+        "unit": unit,
+        "value_mean": mean,
+        "value_min": minimum,
+        "value_max": maximum,
+        "n_samples": samples,
+        "period": period,
+        "basin_id": 2,
+        "source_id": source_id,
+    }
+
+
+def assert_history_is_aggregated() -> None:
+    """One summary row per (station, parameter, unit) with aggregate values."""
+
+    summaries = build_station_parameter_summaries(history())
+    by_key = {
+        (summary["station"], summary["parameter"], summary["unit"]): summary
+        for summary in summaries
+    }
+
+    assert len(summaries) == 5
+    bod = by_key[("Station A", "BOD", "mg/L")]
+    assert bod["value_mean"] == 12.0
+    assert bod["value_min"] == 4.0
+    assert bod["value_max"] == 30.0
+    assert bod["n_samples"] == 22
+    assert bod["period"] == "2021-22"
+    assert bod["source_id"] == 5
+    assert bod["source_ids"] == [5, 4]
+    assert bod["observation_count"] == 3
+    assert ("Station A", "TDS", "ppm") in by_key
+    assert ("Station A", "TDS", "mg/L") in by_key
+
+
+def assert_index_feeds_step_b() -> None:
+    """Step B should accept the index in place of WaterDataService."""
+
+    index = WaterSummaryIndex.from_observations(history())
+    context = InputNormalizationEngine().normalize(
+        use_case="surface_discharge",
+        station="Station A",
+        selected_parameters=["bod", "pH"],
+    )
+
+    bundle = WaterInputAssemblyEngine(index).assemble(context)
+
+    assert bundle.selected_source_type == "station_observations"
+    assert bundle.observation_count == 2
+    assert [observation["parameter"] for observation in bundle.observations] == ["BOD", "pH"]
+    assert bundle.source_ids == [5, 4]
+
+
+def assert_basin_and_missing_lookups() -> None:
+    """Basin lookups return summaries; unknown stations return nothing."""
+
+    index = WaterSummaryIndex.from_observations(history())
+
+    assert index.summary_count == 5
+    assert len(index.get_observations_by_basin(2)) == 5
+    assert index.get_observations_by_station("Unknown") == []
+    assert index.get_observations_for_parameters("Station B", []) == {}
+
+
+def main() -> None:
+    """Run all water summary index checks."""
+
+    assert_history_is_aggregated()
+    assert_index_feeds_step_b()
+    assert_basin_and_missing_lookups()
+    print("water summary index checks ok: one row per station parameter unit")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+r"""Per-step benchmark for Scientific Workflow Steps A-L on synthetic data.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\workflow_benchmark.py --output workflow_benchmark.json
+    python tests\workflow_benchmark.py --baseline workflow_benchmark.json
+
+The benchmark runs `ScientificWorkflowService.run(max_step="L",
+record_timings=True)` and reads each step's wall time from the result's
+`timings` block. It runs over synthetic NbS catalogues (10 to 10k options) and
+station histories (up to 100k observation rows), then reports mean, p95, and
+tracemalloc peak memory per step. Results are written as JSON. `--baseline`
+compares a run against a stored JSON file and exits with status 1 when a step
+regresses beyond the tolerance.
+
+Synthetic rows are built from the fake providers used by the integration
+tests. They are shaped like catalogue and observation rows but are not
+scientific values, and nothing here connects to a database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from app.services.scientific_workflow_service import (
+    WORKFLOW_COMPLETED,
+    ScientificWorkflowResult,
+    ScientificWorkflowService,
+)
+from app.services.water_data_service import group_observations_by_parameter
+from scientific_engine_ai_integration_test import (
+    FakeNbsCatalogService,
+    fake_standards_service,
+    nbs_profile,
+)
+from scientific_workflow_service_ak_test import temporary_weights
+
+
+DEFAULT_OPTION_COUNTS = (10, 100, 1_000, 10_000)
+DEFAULT_OBSERVATION_COUNTS = (1_000, 10_000, 100_000)
+DEFAULT_OPTIONS_FOR_OBSERVATION_CASES = 100
+DEFAULT_OBSERVATIONS_FOR_OPTION_CASES = 1_000
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_DELTA_MS = 1.0
+DEFAULT_SEED = 20260
+
+BENCHMARK_STATION = "Benchmark Station"
+SELECTED_PARAMETERS = ["BOD", "TSS", "nitrate", "DO"]
+EXTRA_PARAMETERS = ["pH", "conductivity", "turbidity", "phosphate"]
+WORKFLOW_STEPS = ("A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L")
+
+
+# Synthetic providers
+
+
+class SyntheticWaterService:
+    """Provider-shaped fake serving one long station history."""
+
+    def __init__(self, observations: list[dict[str, Any]]) -> None:
+        self._by_station: dict[str, list[dict[str, Any]]] = {}
+        for row in observations:
+            self._by_station.setdefault(row["station"], []).append(row)
+
+    def get_observations_by_station(self, station: str) -> list[dict[str, Any]]:
+        """Return every stored row for one station."""
+
+        return list(self._by_station.get(station, []))
+
+    def get_observations_by_basin(self, basin_id: int) -> list[dict[str, Any]]:
+        """Return no basin rows; the benchmark input selects a station."""
+
+        return []
+
+    def get_observations_for_parameters(
+        self,
+        station: str,
+        parameters: list[str],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return station rows grouped by requested parameters."""
+
+        return group_observations_by_parameter(self._by_station.get(station, []), parameters)
+
+
+class SyntheticPlantProvider:
+    """Provider-shaped fake mapping two plants to every NbS ID."""
+
+    def get_plants_for_nbs(
+        self,
+        nbs_id: int,
+        *,
+        include_invasive: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Return two synthetic plant mappings for one NbS ID."""
+
+        return [
+            {
+                "plant_id": nbs_id * 10 + offset,
+                "scientific_name": f"Synthetic species {nbs_id}-{offset}",
+                "common_name": f"Synthetic plant {nbs_id}-{offset}",
+                "basis": "Synthetic benchmark mapping.",
+                "source_id": 900,
+            }
+            for offset in (1, 2)
+        ]
+
+
+def synthetic_observations(count: int, seed: int = DEFAULT_SEED) -> list[dict[str, Any]]:
+    """Build `count` observation rows for the benchmark station."""
+
+    rng = random.Random(seed)
+    parameters = SELECTED_PARAMETERS + EXTRA_PARAMETERS
+    rows = []
+    for index in range(count):
+        value = round(rng.uniform(0.5, 80.0), 3)
+        rows.append(
+            {
+                "id": index + 1,
+                "station": BENCHMARK_STATION,
+                "parameter": parameters[index % len(parameters)],
+                "unit": "mg/L",
+                "value_mean": value,
+                "value_min": round(value * 0.8, 3),
+                "value_max": round(value * 1.2, 3),
+                "n_samples": 12,
+                "period": f"P{index // len(parameters):06d}",
+                "basin_id": None,
+                "source_id": 800,
+            }
+        )
+    return rows
+
+
+def synthetic_nbs_provider(option_count: int, seed: int = DEFAULT_SEED) -> FakeNbsCatalogService:
+    """Build `option_count` fake NbS profiles with mixed evidence coverage.
+
+    Every fifth option only has arsenic removal rows, so Step E keeps a mix of
+    eligible and ineligible candidates. Some options add a qualitative removal
+    row or omit site metadata so the projected Step G criteria vary.
+    """
+
+    rng = random.Random(seed)
+    profiles = {}
+    for nbs_id in range(1, option_count + 1):
+        if nbs_id % 5 == 0:
+            parameters = ["arsenic"]
+        else:
+            parameters = rng.sample(SELECTED_PARAMETERS[:3], k=rng.randint(1, 3))
+        removal_rows = []
+        for parameter in parameters:
+            low = round(rng.uniform(10.0, 60.0), 1)
+            removal_rows.append(
+                {
+                    "parameter": parameter,
+                    "eff_low": low,
+                    "eff_high": round(low + rng.uniform(5.0, 30.0), 1),
+                    "source_id": 700 + nbs_id % 10,
+                }
+            )
+        if nbs_id % 3 == 0:
+            removal_rows.append(
+                {"parameter": "TSS", "eff_low": None, "eff_high": None, "source_id": 709}
+            )
+        profiles[nbs_id] = nbs_profile(
+            nbs_id=nbs_id,
+            solution=f"Synthetic option {nbs_id}",
+            removal_rows=removal_rows,
+            footprint_rows=[
+                {
+                    "area_per_pe_low": round(rng.uniform(0.5, 3.0), 2),
+                    "area_per_pe_high": round(rng.uniform(3.0, 8.0), 2),
+                    "source_id": 710,
+                }
+            ],
+            criteria_rows=[
+                {
+                    "criterion": "cost",
+                    "value_qual": rng.choice(["low", "medium", "high"]),
+                    "confidence": "literature",
+                    "source_id": 720,
+                }
+            ],
+            option_extra={"climate_suitability": None} if nbs_id % 4 == 0 else None,
+        )
+    return FakeNbsCatalogService(profiles)
+
+
+def benchmark_input() -> dict[str, Any]:
+    """Return request-like input that selects the synthetic station history."""
+
+    return {
+        "use_case": "surface discharge",
+        "station": BENCHMARK_STATION,
+        "selected_parameters": list(SELECTED_PARAMETERS),
+    }
+
+
+# Workflow runner
+
+
+@dataclass
+class WorkflowCase:
+    """Providers and input for one benchmark scale."""
+
+    option_count: int
+    observation_count: int
+    water_service: SyntheticWaterService
+    nbs_provider: FakeNbsCatalogService
+    standards_service: Any = field(default_factory=fake_standards_service)
+    plant_provider: SyntheticPlantProvider = field(default_factory=SyntheticPlantProvider)
+    raw_input: dict[str, Any] = field(default_factory=benchmark_input)
+    weights: dict[str, float] = field(default_factory=temporary_weights)
+
+
+def build_case(option_count: int, observation_count: int, seed: int = DEFAULT_SEED) -> WorkflowCase:
+    """Build synthetic providers for one (options, observations) scale."""
+
+    return WorkflowCase(
+        option_count=option_count,
+        observation_count=observation_count,
+        water_service=SyntheticWaterService(synthetic_observations(observation_count, seed)),
+        nbs_provider=synthetic_nbs_provider(option_count, seed),
+    )
+
+
+def workflow_service(case: WorkflowCase) -> ScientificWorkflowService:
+    """Return the real workflow service wired to the case's providers."""
+
+    return ScientificWorkflowService(
+        water_service=case.water_service,
+        standards_service=case.standards_service,
+        nbs_provider=case.nbs_provider,
+        plant_provider=case.plant_provider,
+    )
+
+
+def run_workflow(
+    case: WorkflowCase,
+    *,
+    trace_memory: bool = False,
+) -> tuple[ScientificWorkflowResult, dict[str, float], dict[str, float]]:
+    """Run `ScientificWorkflowService.run` through Step L once.
+
+    Returns (result, wall ms per step, peak KiB per step), read from the
+    result's own `timings` block. Peak memory is only measured when
+    `trace_memory` is true.
+    """
+
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        result = workflow_service(case).run(
+            case.raw_input,
+            max_step="L",
+            supplied_weights=case.weights,
+            weights_source="synthetic_benchmark_weights",
+            expert_validated=False,
+            record_timings=True,
+        )
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    if result.workflow_status != WORKFLOW_COMPLETED:
+        raise RuntimeError(
+            f"Benchmark workflow returned {result.workflow_status}: {result.errors}"
+        )
+
+    steps = result.timings["steps"]
+    wall_ms = {timing["step"]: timing["wall_ms"] for timing in steps}
+    peaks = {timing["step"]: timing["peak_kib"] for timing in steps if "peak_kib" in timing}
+    return result, wall_ms, peaks
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of `values`."""
+
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def benchmark_case(case: WorkflowCase, repeat: int = DEFAULT_REPEAT) -> dict[str, Any]:
+    """Time one case `repeat` times, plus one traced run for peak memory."""
+
+    result, _, _ = run_workflow(case)  # Warm-up; also checks the run completes.
+    samples: dict[str, list[float]] = {step: [] for step in WORKFLOW_STEPS}
+    totals: list[float] = []
+    for _ in range(repeat):
+        timed, wall_ms, _ = run_workflow(case)
+        for step, value in wall_ms.items():
+            samples[step].append(value)
+        totals.append(timed.timings["total"]["wall_ms"])
+
+    _, _, peaks = run_workflow(case, trace_memory=True)
+
+    return {
+        "options": case.option_count,
+        "observations": case.observation_count,
+        "candidates": result.candidate_filter_bundle.candidate_count,
+        "recommendations": len(result.recommendation_assembly_bundle.recommendations),
+        "steps": {
+            step: {
+                "mean_ms": round(statistics.fmean(samples[step]), 4),
+                "p95_ms": round(percentile(samples[step], 0.95), 4),
+                "peak_kib": peaks[step],
+            }
+            for step in WORKFLOW_STEPS
+        },
+        "total": {
+            "mean_ms": round(statistics.fmean(totals), 4),
+            "p95_ms": round(percentile(totals, 0.95), 4),
+        },
+    }
+
+
+def case_scales(
+    option_counts: list[int],
+    observation_counts: list[int],
+    *,
+    options_for_observation_cases: int = DEFAULT_OPTIONS_FOR_OBSERVATION_CASES,
+    observations_for_option_cases: int = DEFAULT_OBSERVATIONS_FOR_OPTION_CASES,
+) -> list[tuple[int, int]]:
+    """Return (options, observations) pairs: one sweep per dimension."""
+
+    scales = [(count, observations_for_option_cases) for count in option_counts]
+    scales += [(options_for_observation_cases, count) for count in observation_counts]
+    return list(dict.fromkeys(scales))
+
+
+def run_benchmark(
+    scales: list[tuple[int, int]],
+    *,
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = DEFAULT_SEED,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Benchmark every scale and return the machine-readable report."""
+
+    cases = []
+    for option_count, observation_count in scales:
+        result = benchmark_case(build_case(option_count, observation_count, seed), repeat)
+        cases.append(result)
+        if progress is not None:
+            progress(result)
+    return {
+        "benchmark": "scientific_workflow_steps",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "seed": seed,
+        "steps": list(WORKFLOW_STEPS),
+        "cases": cases,
+    }
+
+
+# Regression gate
+
+
+def compare_reports(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> list[str]:
+    """Return one message per step whose mean time regressed against the baseline.
+
+    A step regresses when its mean is more than `tolerance` slower and at
+    least `min_delta_ms` slower, so sub-millisecond noise does not fail the
+    gate. Cases missing from the baseline are skipped.
+    """
+
+    baseline_cases = {
+        (case["options"], case["observations"]): case for case in baseline.get("cases", [])
+    }
+    regressions = []
+    for case in current.get("cases", []):
+        previous = baseline_cases.get((case["options"], case["observations"]))
+        if previous is None:
+            continue
+        for step, stats in [*case["steps"].items(), ("total", case["total"])]:
+            before = previous["steps"].get(step) if step != "total" else previous.get("total")
+            if not before:
+                continue
+            delta = stats["mean_ms"] - before["mean_ms"]
+            if delta >= min_delta_ms and stats["mean_ms"] > before["mean_ms"] * (1.0 + tolerance):
+                regressions.append(
+                    f"options={case['options']} observations={case['observations']} "
+                    f"step {step}: {before['mean_ms']:.2f} ms -> {stats['mean_ms']:.2f} ms "
+                    f"(+{delta / before['mean_ms']:.0%})"
+                )
+    return regressions
+
+
+def format_case(case: dict[str, Any]) -> str:
+    """Return a one-table text summary of one benchmark case."""
+
+    lines = [
+        f"options={case['options']} observations={case['observations']} "
+        f"candidates={case['candidates']} recommendations={case['recommendations']}",
+        f"  {'step':<6}{'mean ms':>12}{'p95 ms':>12}{'peak KiB':>12}",
+    ]
+    for step, stats in case["steps"].items():
+        lines.append(
+            f"  {step:<6}{stats['mean_ms']:>12.3f}{stats['p95_ms']:>12.3f}"
+            f"{stats['peak_kib']:>12.1f}"
+        )
+    lines.append(
+        f"  {'total':<6}{case['total']['mean_ms']:>12.3f}{case['total']['p95_ms']:>12.3f}"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark, write JSON, and optionally gate against a baseline."""
+
+    parser = argparse.ArgumentParser(description="Benchmark Scientific Workflow Steps A-L.")
+    parser.add_argument("--options", type=int, nargs="+", default=list(DEFAULT_OPTION_COUNTS))
+    parser.add_argument(
+        "--observations",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_OBSERVATION_COUNTS),
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument("--baseline", help="Compare against a stored JSON report.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        case_scales(args.options, args.observations),
+        repeat=args.repeat,
+        seed=args.seed,
+        progress=lambda case: print(format_case(case), flush=True),
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Benchmark report written to {args.output}.")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare_reports(
+            report,
+            baseline,
+            tolerance=args.tolerance,
+            min_delta_ms=args.min_delta_ms,
+        )
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+        print(f"No step regressed more than {args.tolerance:.0%} against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
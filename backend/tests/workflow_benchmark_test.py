@@ -0,0 +1,113 @@
+r"""Checks for the per-step workflow benchmark and its regression gate.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\workflow_benchmark_test.py
+
+These tests run the benchmark at a tiny synthetic scale. They do not connect
+to Azure, read database records, or add scientific values.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+
+from workflow_benchmark import (
+    WORKFLOW_STEPS,
+    build_case,
+    case_scales,
+    compare_reports,
+    percentile,
+    run_benchmark,
+    run_workflow,
+)
+
+
+def assert_synthetic_case_reaches_step_l() -> None:
+    """The real workflow ranks candidates and reports every step's timing."""
+
+    result, wall_ms, peaks = run_workflow(build_case(10, 80))
+    assert list(wall_ms) == list(WORKFLOW_STEPS)
+    assert peaks == {}
+    assert result.water_input_bundle.observation_count == 40
+    assert result.candidate_filter_bundle.ineligible_count == 2
+    assert result.topsis_ranking_bundle.ranked_count == 8
+    assert len(result.recommendation_assembly_bundle.recommendations) == 8
+
+    _, _, traced = run_workflow(build_case(10, 80), trace_memory=True)
+    assert list(traced) == list(WORKFLOW_STEPS)
+    assert all(peak >= 0 for peak in traced.values())
+
+
+def assert_synthetic_data_is_deterministic() -> None:
+    """The same seed builds the same catalogue and observations."""
+
+    first = build_case(20, 50, seed=7)
+    second = build_case(20, 50, seed=7)
+    assert first.nbs_provider.profiles == second.nbs_provider.profiles
+    assert (
+        first.water_service.get_observations_by_station("Benchmark Station")
+        == second.water_service.get_observations_by_station("Benchmark Station")
+    )
+
+
+def assert_report_is_machine_readable() -> dict:
+    """Every case reports mean, p95, and peak memory for every step as JSON."""
+
+    scales = case_scales(
+        [10],
+        [80],
+        options_for_observation_cases=10,
+        observations_for_option_cases=80,
+    )
+    report = json.loads(json.dumps(run_benchmark(scales, repeat=2)))
+    assert len(report["cases"]) == 1
+    case = report["cases"][0]
+    assert list(case["steps"]) == list(WORKFLOW_STEPS)
+    for stats in case["steps"].values():
+        assert set(stats) == {"mean_ms", "p95_ms", "peak_kib"}
+        assert stats["mean_ms"] >= 0 and stats["p95_ms"] >= 0
+    assert case["total"]["mean_ms"] > 0
+    return report
+
+
+def assert_regression_gate_flags_slower_steps(report: dict) -> None:
+    """Steps slower than tolerance and the noise floor are reported."""
+
+    assert compare_reports(report, report) == []
+
+    baseline = copy.deepcopy(report)
+    slower = copy.deepcopy(report)
+    slower["cases"][0]["steps"]["E"]["mean_ms"] = baseline["cases"][0]["steps"]["E"]["mean_ms"] + 50.0
+    slower["cases"][0]["steps"]["A"]["mean_ms"] = baseline["cases"][0]["steps"]["A"]["mean_ms"] * 3
+    messages = compare_reports(slower, baseline, tolerance=0.25, min_delta_ms=1.0)
+    assert len(messages) == 1 and "step E" in messages[0]
+
+    unmatched = copy.deepcopy(slower)
+    unmatched["cases"][0]["options"] = 999
+    assert compare_reports(unmatched, baseline) == []
+
+
+def assert_percentile_uses_nearest_rank() -> None:
+    """p95 of twenty samples is the nineteenth smallest."""
+
+    values = [float(value) for value in range(1, 21)]
+    assert percentile(values, 0.95) == 19.0
+    assert percentile([4.0], 0.95) == 4.0
+
+
+def main() -> None:
+    """Run all workflow benchmark checks."""
+
+    assert_synthetic_case_reaches_step_l()
+    assert_synthetic_data_is_deterministic()
+    report = assert_report_is_machine_readable()
+    assert_regression_gate_flags_slower_steps(report)
+    assert_percentile_uses_nearest_rank()
+    print("workflow benchmark checks ok: per-step timings and regression gate")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+r"""Checks for per-step workflow timings and the `Server-Timing` header.
+
+Run from the backend folder:
+
+    set PYTHONPATH=%CD%
+    python tests\workflow_timing_test.py
+
+These tests run the workflow on the synthetic dataset in an in-memory SQLite
+database and call `/api/v1/recommend` with fake local providers. They do not
+connect to Azure, mutate data, or add scientific values.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError as exc:
+    print(
+        "workflow timing test skipped: install backend requirements first "
+        f"({exc.name} is missing)."
+    )
+    raise SystemExit(0) from exc
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import get_settings
+from app.db.statement_counter import count_statements
+from app.services import (
+    ScientificWorkflowService,
+    log_workflow_timings,
+    server_timing_header,
+)
+from recommendation_api_test import recommendation_test_client, valid_payload
+from synthetic_dataset import create_schema, generate_dataset, write_dataset
+
+WORKFLOW_INPUT = {
+    "use_case": "surface discharge",
+    "station": "Station 3",
+    "selected_parameters": ["BOD", "TSS", "nitrate", "DO"],
+}
+WEIGHTS = {
+    "removal_evidence_score": 5.0,
+    "removal_evidence_coverage": 3.0,
+    "site_suitability": 2.0,
+}
+
+
+def synthetic_session() -> Session:
+    """Return a session over a small synthetic SQLite database."""
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    create_schema(engine)
+    write_dataset(engine, generate_dataset(scale=0.2, seed=5))
+    return Session(engine)
+
+
+def run_workflow(session: Session, *, record_timings: bool):
+    """Run the A-L workflow with read-only services for `session`."""
+
+    return ScientificWorkflowService.from_session(session).run(
+        WORKFLOW_INPUT,
+        max_step="L",
+        supplied_weights=WEIGHTS,
+        weights_source="workflow_timing_test_weights",
+        record_timings=record_timings,
+    )
+
+
+def assert_timings_cover_every_step() -> None:
+    """Timed runs report each step with SQL counts; untimed runs report nothing."""
+
+    with synthetic_session() as session:
+        untimed = run_workflow(session, record_timings=False)
+        timed = run_workflow(session, record_timings=True)
+
+    assert untimed.timings is None and untimed.to_dict()["timings"] is None
+    assert timed.workflow_status == "completed", timed.errors
+    assert timed.to_dict()["recommendation_assembly_bundle"] == untimed.to_dict()[
+        "recommendation_assembly_bundle"
+    ]
+
+    steps = timed.timings["steps"]
+    assert [step["step"] for step in steps] == list("ABCDEFGHIJKL")
+    by_step = {step["step"]: step for step in steps}
+    for name in ("B", "C", "E"):
+        assert by_step[name]["sql_statements"] > 0, name
+    for name in ("A", "D", "G", "H", "I", "J", "L"):
+        assert by_step[name]["sql_statements"] == 0, name
+    # Without the catalogue snapshot Step E reads one NbS profile per option.
+    assert by_step["E"]["repeated_sql"] > 1
+    total = timed.timings["total"]
+    assert total["sql_statements"] == sum(step["sql_statements"] for step in steps)
+    assert total["wall_ms"] >= max(step["wall_ms"] for step in steps)
+    assert all(step["cpu_ms"] >= 0 for step in steps)
+
+
+def assert_statement_counters_nest_and_stop() -> None:
+    """Nested counters both count; statements after the block are not counted."""
+
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        with count_statements() as outer:
+            connection.execute(text("SELECT 1"))
+            with count_statements() as inner:
+                connection.execute(text("SELECT 2"))
+        connection.execute(text("SELECT 3"))
+    assert (outer.count, inner.count) == (2, 1)
+
+
+def assert_server_timing_header_format() -> None:
+    """Each step becomes a metric with duration, CPU time and SQL count."""
+
+    timings = {
+        "steps": [{"step": "B", "wall_ms": 2.5, "cpu_ms": 1.25, "sql_statements": 3}],
+        "total": {"step": "total", "wall_ms": 4.0, "cpu_ms": 2.0, "sql_statements": 3},
+    }
+    assert server_timing_header(timings) == (
+        'B;dur=2.500;desc="cpu=1.250ms sql=3", '
+        'total;dur=4.000;desc="cpu=2.000ms sql=3"'
+    )
+    assert server_timing_header(None) is None
+
+
+class _Capture(logging.Handler):
+    """Keep emitted log records in memory."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def assert_timing_logs_are_sampled_json() -> None:
+    """Sample rate 0 logs nothing; rate 1 logs one parseable JSON line."""
+
+    logger = logging.getLogger("app.workflow.timing")
+    capture = _Capture()
+    previous_level = logger.level
+    logger.addHandler(capture)
+    logger.setLevel(logging.INFO)
+    timings = {"steps": [], "total": {"step": "total", "wall_ms": 1.0, "cpu_ms": 1.0, "sql_statements": 0}}
+    try:
+        assert not log_workflow_timings(timings, sample_rate=0.0)
+        assert not log_workflow_timings(None, sample_rate=1.0)
+        assert log_workflow_timings(timings, sample_rate=1.0, workflow_status="completed")
+    finally:
+        logger.removeHandler(capture)
+        logger.setLevel(previous_level)
+
+    assert len(capture.records) == 1
+    record = json.loads(capture.records[0].getMessage())
+    assert record["event"] == "workflow_timings"
+    assert record["workflow_status"] == "completed"
+    assert record["total"]["wall_ms"] == 1.0
+
+
+def assert_recommend_route_sends_server_timing() -> None:
+    """The header appears only when WORKFLOW_TIMING_ENABLED is true."""
+
+    previous = os.environ.get("WORKFLOW_TIMING_ENABLED")
+    try:
+        for enabled in (False, True):
+            os.environ["WORKFLOW_TIMING_ENABLED"] = str(enabled).lower()
+            get_settings.cache_clear()
+            with recommendation_test_client() as client:
+                response = client.post("/api/v1/recommend", json=valid_payload())
+            assert response.status_code == 200, response.text
+            header = response.headers.get("server-timing")
+            if enabled:
+                assert header and header.startswith("A;dur=") and "L;dur=" in header
+                assert "total;dur=" in header
+            else:
+                assert header is None
+            assert "timings" not in response.json()
+    finally:
+        if previous is None:
+            os.environ.pop("WORKFLOW_TIMING_ENABLED", None)
+        else:
+            os.environ["WORKFLOW_TIMING_ENABLED"] = previous
+        get_settings.cache_clear()
+
+
+def main() -> None:
+    """Run all workflow timing checks."""
+
+    assert_timings_cover_every_step()
+    assert_statement_counters_nest_and_stop()
+    assert_server_timing_header_format()
+    assert_timing_logs_are_sampled_json()
+    assert_recommend_route_sends_server_timing()
+    print("workflow timing checks ok: per-step wall, CPU and SQL counts recorded")
+
+
+if __name__ == "__main__":
+    main()
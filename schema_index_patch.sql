@@ -0,0 +1,35 @@
+-- Narmada NbS Toolkit — index patch
+-- Adds the indexes the backend repositories filter and join on. schema.sql
+-- declares no primary keys, so ID lookups get plain indexes here as well.
+-- Idempotent: safe to run on a database that already has some of them.
+-- Checked by backend/tests/query_plan_test.py.
+
+-- ID lookups and joins (get_by_id, plant/NbS joins, source provenance).
+CREATE INDEX IF NOT EXISTS idx_sources_id ON sources(id);
+CREATE INDEX IF NOT EXISTS idx_basins_id ON basins(id);
+CREATE INDEX IF NOT EXISTS idx_regions_id ON regions(id);
+CREATE INDEX IF NOT EXISTS idx_plants_id ON plants(id);
+CREATE INDEX IF NOT EXISTS idx_nbs_options_id ON nbs_options(id);
+
+-- Water observations: station + parameter reads, basin reads.
+CREATE INDEX IF NOT EXISTS idx_wq_station_parameter ON water_observations(station, parameter);
+CREATE INDEX IF NOT EXISTS idx_wq_basin ON water_observations(basin_id);
+
+-- Region lookup by case-insensitive station name.
+CREATE INDEX IF NOT EXISTS idx_regions_station_lower ON regions(lower(station));
+
+-- Standards by use case (and parameter).
+CREATE INDEX IF NOT EXISTS idx_standards_use_case ON standards(use_case, parameter);
+
+-- NbS child tables and plant mappings.
+CREATE INDEX IF NOT EXISTS idx_rem_nbs ON removal_efficiency(nbs_id);
+CREATE INDEX IF NOT EXISTS idx_nbs_impl_nbs ON nbs_implementation(nbs_id);
+CREATE INDEX IF NOT EXISTS idx_nbs_footprint_nbs ON nbs_footprint(nbs_id);
+CREATE INDEX IF NOT EXISTS idx_nbs_criteria_nbs ON nbs_criteria(nbs_id);
+CREATE INDEX IF NOT EXISTS idx_psm_nbs ON plant_solution_map(nbs_id);
+CREATE INDEX IF NOT EXISTS idx_psm_plant ON plant_solution_map(plant_id);
+
+-- Site context.
+CREATE INDEX IF NOT EXISTS idx_sa_region ON site_attributes(region_id);
+CREATE INDEX IF NOT EXISTS idx_ps_region ON pollution_sources(region_id);
+CREATE INDEX IF NOT EXISTS idx_site_stream_station ON site_stream_attributes(station);
@@ -0,0 +1,309 @@
+"""
+Bulk loader for the legacy CSV tables in app/data.
+
+Replaces the five scripts/load_*.py scripts with one CLI:
+
+    python -m scripts.load_data                      # every table
+    python -m scripts.load_data plant_data nbs_options --workers 2
+
+For each table the CSV is read in chunks and loaded into a staging table on
+its own connection. The target table is then swapped in one transaction and
+row counts are checked before commit, so readers see either the old rows or
+the new rows, never a partial load. Replace mode restarts the id sequence,
+so rows from a CSV without ids get the same ids on every run (on PostgreSQL,
+TRUNCATE ... RESTART IDENTITY makes readers wait for the commit).
+PostgreSQL uses COPY; other databases (e.g. a local SQLite file) use
+batched INSERTs. Independent tables load in
+parallel on PostgreSQL; SQLite allows one writer, so it loads one at a time.
+
+Connection: --database-url, else DATABASE_URL, else DB_NAME/DB_USER/
+DB_PASSWORD/DB_HOST/DB_PORT as the old scripts used.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from dotenv import load_dotenv
+from sqlalchemy import column, create_engine, insert, inspect, table, text
+from sqlalchemy.engine import URL
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "app", "data")
+DEFAULT_CHUNK_SIZE = 5000
+
+# table -> (csv file, keep the CSV id column, default mode)
+# water_data also receives app submissions, so it is appended to by default.
+# Replaced tables keep any CSV ids, and replace mode restarts their id
+# sequence, so a CSV without ids gets the same ids 1..N on every run.
+# recommendation_utils joins nbs_implementation.id to nbs_options.id.
+TABLES = {
+    "district_data": ("district_data_new.csv", True, "replace"),
+    "nbs_options": ("nbs_options_new.csv", True, "replace"),
+    "nbs_implementation": ("nbs_implementation_new.csv", True, "replace"),
+    "plant_data": ("plant_data_new.csv", True, "replace"),
+    "water_data": ("water_data_new.csv", False, "append"),
+}
+
+
+class LoadError(Exception):
+    """Raised when a table load fails validation; the transaction is rolled back."""
+
+
+# ---------------------------------------------------------
+# CONNECTION
+# ---------------------------------------------------------
+
+def database_url(explicit=None):
+    """Pick the connection URL from the CLI, DATABASE_URL, or DB_* variables."""
+    if explicit:
+        return explicit
+    if os.getenv("DATABASE_URL"):
+        return os.getenv("DATABASE_URL")
+    if not os.getenv("DB_NAME"):
+        raise LoadError("Set DATABASE_URL (or DB_NAME/DB_USER/DB_PASSWORD/DB_HOST/DB_PORT).")
+    return URL.create(
+        "postgresql+psycopg2",
+        username=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        host=os.getenv("DB_HOST"),
+        port=int(os.getenv("DB_PORT")) if os.getenv("DB_PORT") else None,
+        database=os.getenv("DB_NAME"),
+    )
+
+
+# ---------------------------------------------------------
+# CSV READING
+# ---------------------------------------------------------
+
+def _load_columns(header, keep_id):
+    """Return (csv column, sql column) pairs, skipping id and pandas 'Unnamed:' columns."""
+    pairs = []
+    for name in header:
+        sql_name = name.strip()
+        if sql_name.startswith("Unnamed:") or (sql_name.lower() == "id" and not keep_id):
+            continue
+        pairs.append((name, sql_name))
+    return pairs
+
+
+def read_chunks(path, keep_id, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield (sql columns, DataFrame chunk) pairs.
+    Values are read as text so they reach the database exactly as written.
+    """
+    for chunk in pd.read_csv(path, dtype=str, chunksize=chunk_size):
+        pairs = _load_columns(chunk.columns, keep_id)
+        frame = chunk[[name for name, _ in pairs]]
+        frame.columns = [sql_name for _, sql_name in pairs]
+        yield list(frame.columns), frame
+
+
+# ---------------------------------------------------------
+# STAGING + SWAP
+# ---------------------------------------------------------
+
+def _copy_chunk(conn, staging, columns, frame):
+    """COPY one chunk into the staging table through psycopg2; `columns` are quoted."""
+    buffer = io.StringIO()
+    frame.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {staging} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV, NULL '')",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def _insert_chunk(conn, staging, columns, frame):
+    """Insert one chunk with a single executemany call."""
+    rows = frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+    conn.execute(insert(table(staging, *(column(name) for name in columns))), rows)
+
+
+def _count(conn, name):
+    return conn.execute(text(f"SELECT COUNT(*) FROM {name}")).scalar_one()
+
+
+def _check_columns(conn, table_name, csv_file, columns):
+    """
+    Reject CSV headers that are not columns of the target table.
+    Returns the columns quoted as SQL identifiers.
+    """
+    known = {item["name"] for item in inspect(conn).get_columns(table_name)}
+    unknown = [name for name in columns if name not in known]
+    if unknown:
+        raise LoadError(f"{csv_file}: column(s) not in {table_name}: {', '.join(unknown)}.")
+    quote = conn.dialect.identifier_preparer.quote
+    return [quote(name) for name in columns]
+
+
+def _clear_table(conn, name):
+    """
+    Delete every row and restart the id sequence, inside the load transaction.
+    SQLite reuses ids from 1 once the table is empty; PostgreSQL needs
+    RESTART IDENTITY, which is rolled back with the transaction.
+    """
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(f"TRUNCATE {name} RESTART IDENTITY"))
+    else:
+        conn.execute(text(f"DELETE FROM {name}"))
+
+
+def _sync_id_sequence(conn, name):
+    """Move a PostgreSQL id sequence past ids copied from the CSV."""
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), "
+            f"COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {name}"
+        ))
+
+
+def load_table(engine, table_name, *, mode=None, data_dir=DATA_DIR, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Load one CSV into its table through a staging table.
+    Returns a stats dict; raises LoadError and rolls back on any mismatch.
+    """
+    csv_file, keep_id, default_mode = TABLES[table_name]
+    mode = mode or default_mode
+    path = os.path.join(data_dir, csv_file)
+    if not os.path.exists(path):
+        raise LoadError(f"{csv_file} not found in {data_dir}.")
+
+    staging = f"_staging_{table_name}"
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        use_copy = conn.dialect.driver == "psycopg2"
+        with conn.begin():
+            read_rows = 0
+            columns = None
+            for chunk_columns, frame in read_chunks(path, keep_id, chunk_size):
+                if columns is None:
+                    # Checked before anything is written; headers never reach
+                    # the SQL text unquoted.
+                    quoted = _check_columns(conn, table_name, csv_file, chunk_columns)
+                    columns = chunk_columns
+                    # Same column types as the target, no rows, no defaults.
+                    conn.execute(text(
+                        f"CREATE TEMPORARY TABLE {staging} AS "
+                        f"SELECT {', '.join(quoted)} FROM {table_name} LIMIT 0"
+                    ))
+                if use_copy:
+                    _copy_chunk(conn, staging, quoted, frame)
+                else:
+                    _insert_chunk(conn, staging, columns, frame)
+                read_rows += len(frame)
+
+            if columns is None:
+                raise LoadError(f"{csv_file} has no rows.")
+            staged = _count(conn, staging)
+            if staged != read_rows:
+                raise LoadError(f"{table_name}: staged {staged} rows, read {read_rows}.")
+
+            before = _count(conn, table_name)
+            if mode == "replace":
+                _clear_table(conn, table_name)
+            conn.execute(text(
+                f"INSERT INTO {table_name} ({', '.join(quoted)}) "
+                f"SELECT {', '.join(quoted)} FROM {staging}"
+            ))
+            after = _count(conn, table_name)
+            expected = staged if mode == "replace" else before + staged
+            if after != expected:
+                raise LoadError(f"{table_name}: expected {expected} rows after swap, found {after}.")
+            if "id" in columns:
+                _sync_id_sequence(conn, table_name)
+            conn.execute(text(f"DROP TABLE {staging}"))
+
+    seconds = time.perf_counter() - started
+    return {
+        "table": table_name,
+        "mode": mode,
+        "rows": read_rows,
+        "total": after,
+        "seconds": seconds,
+        "rows_per_sec": read_rows / seconds if seconds else float(read_rows),
+    }
+
+
+def load_tables(engine, table_names, *, mode=None, workers=None, data_dir=DATA_DIR,
+                chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Load several tables, in parallel where the database allows concurrent writers.
+    Returns (stats list, {table: error message}).
+    """
+    if engine.dialect.name == "sqlite":
+        workers = 1
+    workers = max(1, min(workers or len(table_names), len(table_names)))
+
+    def run(table_name):
+        try:
+            return load_table(engine, table_name, mode=mode, data_dir=data_dir, chunk_size=chunk_size), None
+        except Exception as error:
+            return None, f"{type(error).__name__}: {error}"
+
+    stats, errors = [], {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for table_name, (result, error) in zip(table_names, pool.map(run, table_names)):
+            if error:
+                errors[table_name] = error
+            else:
+                stats.append(result)
+    return stats, errors
+
+
+# ---------------------------------------------------------
+# CLI
+# ---------------------------------------------------------
+
+def main(argv=None):
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Load app/data CSVs into the legacy tables.")
+    parser.add_argument("tables", nargs="*", metavar="TABLE",
+                        help=f"tables to load (default: all of {', '.join(TABLES)})")
+    parser.add_argument("--database-url", help="SQLAlchemy URL; defaults to DATABASE_URL")
+    parser.add_argument("--mode", choices=["replace", "append"],
+                        help="replace rows or append to them (default: per table)")
+    parser.add_argument("--workers", type=int, help="parallel connections (default: one per table)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.tables if name not in TABLES]
+    if unknown:
+        parser.error(f"unknown table(s): {', '.join(unknown)}")
+    table_names = args.tables or list(TABLES)
+    try:
+        engine = create_engine(database_url(args.database_url))
+    except LoadError as error:
+        print(f"Error: {error}")
+        return 1
+
+    started = time.perf_counter()
+    stats, errors = load_tables(
+        engine, table_names, mode=args.mode, workers=args.workers,
+        data_dir=args.data_dir, chunk_size=args.chunk_size,
+    )
+    engine.dispose()
+    seconds = time.perf_counter() - started
+
+    for row in stats:
+        print(f"{row['table']:<20} {row['mode']:<8} {row['rows']:>8} rows "
+              f"{row['seconds']:>7.2f}s {row['rows_per_sec']:>10.0f} rows/s  (table now {row['total']})")
+    for table_name, error in errors.items():
+        print(f"{table_name:<20} FAILED   {error}")
+    loaded = sum(row["rows"] for row in stats)
+    print(f"Loaded {loaded} rows from {len(stats)} table(s) in {seconds:.2f}s "
+          f"({loaded / seconds if seconds else loaded:.0f} rows/s).")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+r"""Checks for the legacy CSV bulk loader.
+
+Run from the repository root:
+
+    set PYTHONPATH=%CD%
+    python tests\load_data_test.py
+
+These tests load small fake CSVs into a temporary SQLite file. They do not
+connect to Azure or touch the configured database.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+_folder = tempfile.TemporaryDirectory()
+# `app.db` builds its engine at import time; point it at a throwaway file.
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_folder.name) / 'import.db'}"
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from app.db import models  # noqa: E402
+from scripts import load_data  # noqa: E402
+
+OPTIONS_HEADER = "solution,optimal_water_type,state_name"
+IMPLEMENTATION_HEADER = "id,solution,implementation_steps"
+
+
+def new_database(name: str, files: dict[str, str]):
+    """Return a SQLite engine with the legacy tables and a folder of CSVs."""
+
+    engine = create_engine(f"sqlite:///{Path(_folder.name) / name}.db")
+    models.Base.metadata.create_all(engine)
+    data_dir = Path(_folder.name) / name
+    data_dir.mkdir()
+    for csv_file, content in files.items():
+        (data_dir / csv_file).write_text(content, encoding="utf-8")
+    return engine, str(data_dir)
+
+
+def table_rows(engine, table_name: str, columns: str) -> list[tuple]:
+    statement = text(f"SELECT {columns} FROM {table_name} ORDER BY id")
+    with engine.connect() as connection:
+        return [tuple(row) for row in connection.execute(statement)]
+
+
+def assert_replace_load_keeps_ids_stable() -> None:
+    """A full load replaces the rows and gives the same ids on every run."""
+
+    engine, data_dir = new_database("full", {
+        "nbs_options_new.csv": f"{OPTIONS_HEADER}\nWetland,Greywater,Bihar\nSwale,Stormwater,\n",
+        "nbs_implementation_new.csv": f"{IMPLEMENTATION_HEADER}\n1,Wetland,Dig\n2,Swale,Plant\n",
+    })
+    for _ in range(2):
+        stats, errors = load_data.load_tables(
+            engine, ["nbs_options", "nbs_implementation"], data_dir=data_dir, chunk_size=1,
+        )
+        assert errors == {}, errors
+        assert [(row["table"], row["rows"], row["total"]) for row in stats] == [
+            ("nbs_options", 2, 2),
+            ("nbs_implementation", 2, 2),
+        ]
+    assert table_rows(engine, "nbs_options", "id, solution, state_name") == [
+        (1, "Wetland", "Bihar"),
+        (2, "Swale", None),
+    ]
+    assert table_rows(engine, "nbs_implementation", "id, solution") == [(1, "Wetland"), (2, "Swale")]
+    engine.dispose()
+
+
+def assert_row_count_mismatch_rolls_back() -> None:
+    """A staging count that differs from the rows read leaves the table as it was."""
+
+    engine, data_dir = new_database("count", {
+        "nbs_options_new.csv": f"{OPTIONS_HEADER}\nWetland,Greywater,Bihar\nSwale,Stormwater,Assam\n",
+    })
+    load_data.load_table(engine, "nbs_options", data_dir=data_dir)
+
+    original = load_data._insert_chunk
+
+    def drop_last_row(conn, staging, columns, frame):
+        original(conn, staging, columns, frame.iloc[:-1])
+
+    load_data._insert_chunk = drop_last_row
+    try:
+        load_data.load_table(engine, "nbs_options", data_dir=data_dir)
+    except load_data.LoadError as error:
+        assert "staged 1 rows, read 2" in str(error)
+    else:
+        raise AssertionError("row-count mismatch was not rejected")
+    finally:
+        load_data._insert_chunk = original
+
+    assert [row[0] for row in table_rows(engine, "nbs_options", "solution")] == ["Wetland", "Swale"]
+    engine.dispose()
+
+
+def assert_bad_header_is_rejected() -> None:
+    """A header that is not a table column fails before the live table is touched."""
+
+    engine, data_dir = new_database("header", {
+        "nbs_options_new.csv": f"{OPTIONS_HEADER}\nWetland,Greywater,Bihar\n",
+    })
+    load_data.load_table(engine, "nbs_options", data_dir=data_dir)
+    bad = '"solution) SELECT 1; --",state_name\nSwale,Assam\n'
+    (Path(data_dir) / "nbs_options_new.csv").write_text(bad, encoding="utf-8")
+
+    try:
+        load_data.load_table(engine, "nbs_options", data_dir=data_dir)
+    except load_data.LoadError as error:
+        assert "not in nbs_options" in str(error)
+    else:
+        raise AssertionError("unknown CSV header was not rejected")
+
+    assert table_rows(engine, "nbs_options", "id, solution") == [(1, "Wetland")]
+    engine.dispose()
+
+
+def main() -> None:
+    """Run all loader checks."""
+
+    assert_replace_load_keeps_ids_stable()
+    assert_row_count_mismatch_rolls_back()
+    assert_bad_header_is_rejected()
+    print("load_data checks ok: full loads, row-count check and header check")
+
+
+if __name__ == "__main__":
+    main()
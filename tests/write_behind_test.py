@@ -0,0 +1,125 @@
+r"""Checks for the legacy water-data write-behind buffer.
+
+Run from the repository root:
+
+    set PYTHONPATH=%CD%
+    python tests\write_behind_test.py
+
+These tests write to a temporary SQLite file. They do not connect to Azure
+or touch the configured database.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+_folder = tempfile.TemporaryDirectory()
+# `app.db` builds its engine at import time; point it at a throwaway file.
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_folder.name) / 'import.db'}"
+
+from sqlalchemy import create_engine, func, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.db import models  # noqa: E402
+from app.db.write_behind import WriteBehindBuffer, water_data_row  # noqa: E402
+
+TABLE = models.WaterData.__table__
+
+
+def new_buffer(name: str, **options):
+    """Return a buffer over a fresh SQLite `water_data` table, and its engine."""
+
+    engine = create_engine(f"sqlite:///{Path(_folder.name) / name}")
+    models.Base.metadata.create_all(engine, tables=[TABLE])
+    factory = sessionmaker(bind=engine)
+    return WriteBehindBuffer(factory, TABLE, **options), engine
+
+
+def stored_rows(engine) -> list[dict]:
+    with engine.connect() as connection:
+        return [dict(row._mapping) for row in connection.execute(select(TABLE).order_by(TABLE.c.id))]
+
+
+def assert_mixed_batch_is_written() -> None:
+    """Upload rows and preset rows with different columns share one batch."""
+
+    buffer, engine = new_buffer("mixed.db", batch_size=10)
+    buffer._queue.put_nowait(water_data_row(water_type="Greywater", colour="grey", turbidity="30-200"))
+    buffer._queue.put_nowait(water_data_row(water_type="Blackwater", notes="dropped"))
+    buffer._queue.put_nowait(water_data_row(water_type="Stormwater", odour="none", ph="7"))
+
+    assert buffer.flush() == 3
+    assert buffer.pending == 0 and buffer.failed == []
+    rows = stored_rows(engine)
+    assert [row["water_type"] for row in rows] == ["Greywater", "Blackwater", "Stormwater"]
+    assert rows[0]["turbidity"] == "30-200" and rows[1]["colour"] is None
+    # Columns a row leaves out keep their server defaults.
+    assert all(row["created_at"] is not None for row in rows)
+    engine.dispose()
+
+
+def assert_failing_batch_is_moved_aside() -> None:
+    """A batch that keeps failing stops retrying and does not block later rows."""
+
+    buffer, engine = new_buffer("failing.db", batch_size=1, max_retries=2)
+    with engine.begin() as connection:
+        connection.execute(TABLE.insert(), {"id": 1, "water_type": "Existing"})
+    # Reusing an existing primary key fails on every attempt.
+    buffer._queue.put_nowait({"id": 1, "water_type": "Greywater"})
+    buffer._queue.put_nowait({"water_type": "Blackwater"})
+
+    assert buffer.flush() == 0
+    assert buffer.pending == 2 and buffer.failed == []
+    assert buffer.flush() == 1
+    assert buffer.pending == 0
+    assert buffer.failed == [{"id": 1, "water_type": "Greywater"}]
+    with engine.connect() as connection:
+        assert connection.execute(select(func.count()).select_from(TABLE)).scalar_one() == 2
+    engine.dispose()
+
+
+def assert_bad_row_does_not_sink_good_rows() -> None:
+    """Only the rows that fail on their own are moved aside, and they are logged."""
+
+    buffer, engine = new_buffer("mixed_failure.db", batch_size=10, max_retries=1)
+    with engine.begin() as connection:
+        connection.execute(TABLE.insert(), {"id": 1, "water_type": "Existing"})
+    buffer._queue.put_nowait(water_data_row(water_type="Greywater", colour="grey"))
+    buffer._queue.put_nowait({"id": 1, "water_type": "Duplicate"})
+    buffer._queue.put_nowait(water_data_row(water_type="Stormwater"))
+
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger("app.db.write_behind")
+    logger.addHandler(handler)
+    try:
+        assert buffer.flush() == 2
+    finally:
+        logger.removeHandler(handler)
+
+    assert buffer.pending == 0
+    assert buffer.failed == [{"id": 1, "water_type": "Duplicate"}]
+    assert [row["water_type"] for row in stored_rows(engine)] == [
+        "Existing",
+        "Greywater",
+        "Stormwater",
+    ]
+    assert any('"water_type": "Duplicate"' in record.getMessage() for record in records)
+    engine.dispose()
+
+
+def main() -> None:
+    """Run all write-behind checks."""
+
+    assert_mixed_batch_is_written()
+    assert_failing_batch_is_moved_aside()
+    assert_bad_row_does_not_sink_good_rows()
+    print("write-behind checks ok: mixed batches written, only failing rows moved aside")
+
+
+if __name__ == "__main__":
+    main()